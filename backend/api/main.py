@@ -3,16 +3,62 @@ STRUCT-CALC ACERO - API Principal
 FastAPI backend para cálculo de estructuras de acero con OpenSeesPy
 """
 
+import logging
+from typing import Any, Dict
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from dotenv import load_dotenv
 import os
 
 # Cargar variables de entorno
 load_dotenv()
 
-# Importar routers
-from api.routes import analysis, sections, materials, connections, reports
+# Importar routers (reports se importa solo si está habilitado: carga ReportLab)
+from api.routes import analysis, sections, materials, connections
+
+REPORTS_ENABLED = os.getenv("ENABLE_REPORTS", "true").lower() in ("1", "true", "yes")
+
+logger = logging.getLogger(__name__)
+
+
+def _warmup_opensees():
+    """Resolver una viga y un pórtico mínimos para inicializar OpenSeesPy"""
+    from engine.opensees_runner import analyze_beam, analyze_frame
+
+    analyze_beam(
+        length=1.0,
+        support_left="pinned",
+        support_right="roller",
+        section_id="W310X39",
+        material_id="A36",
+        point_loads=[],
+        distributed_loads=[analysis.DistributedLoad(start=0, end=1, w_start=1, w_end=None)]
+    )
+    analyze_frame(
+        nodes=[
+            analysis.FrameNode(id=1, x=0, y=0, support="fixed"),
+            analysis.FrameNode(id=2, x=0, y=3),
+            analysis.FrameNode(id=3, x=4, y=3),
+        ],
+        elements=[
+            analysis.FrameElement(id=1, node_i=1, node_j=2, section_id="W310X39", element_type="column"),
+            analysis.FrameElement(id=2, node_i=2, node_j=3, section_id="W310X39", element_type="beam"),
+        ],
+        loads=[analysis.FrameLoad(type="nodal", node_id=3, Fy=1)],
+        material_id="A36"
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Calentar OpenSeesPy antes del primer request real
+    try:
+        await analysis.run_opensees(_warmup_opensees)
+    except Exception as e:
+        logger.warning(f"Warm-up de OpenSeesPy falló: {str(e)}")
+    yield
 
 # Crear app
 app = FastAPI(
@@ -20,24 +66,34 @@ app = FastAPI(
     description="API para cálculo de estructuras de acero industriales usando OpenSeesPy",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
-# Configurar CORS para permitir requests desde orígenes específicos
-# Usar variable de entorno ALLOWED_ORIGINS para dominios adicionales (separados por comas)
-# CORS: Permitir todos los orígenes en producción (API pública)
-# Para mayor seguridad, usar ALLOWED_ORIGINS env var con dominios específicos
+# Configurar CORS
+# Por defecto se permiten todos los orígenes (API pública, sin cookies).
+# Usar variable de entorno ALLOWED_ORIGINS para restringir a dominios
+# específicos (separados por comas).
+ALLOWED_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("ALLOWED_ORIGINS", "*").split(",")
+    if origin.strip()
+]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Permite todos los orígenes
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=ALLOWED_ORIGINS,
+    allow_credentials=False,  # "*" con credenciales no es válido en navegadores
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "authorization"],
 )
 
+# Comprimir respuestas grandes (diagramas y resultados de pórticos)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 
 @app.get("/")
-async def root():
+async def root() -> Dict[str, Any]:
     """Health check endpoint"""
     return {
         "status": "online",
@@ -47,14 +103,22 @@ async def root():
     }
 
 
+def _probe_opensees():
+    """Crear y destruir un modelo mínimo de OpenSeesPy"""
+    import openseespy.opensees as ops
+    from engine.opensees_runner import _wipe_model
+    # _wipe_model también invalida el modelo reutilizable de las vigas
+    _wipe_model()
+    ops.model('basic', '-ndm', 2, '-ndf', 3)
+    _wipe_model()
+
+
 @app.get("/health")
-async def health_check():
+async def health_check() -> Dict[str, Any]:
     """Verificar que OpenSeesPy está funcionando"""
     try:
-        import openseespy.opensees as ops
-        ops.wipe()
-        ops.model('basic', '-ndm', 2, '-ndf', 3)
-        ops.wipe()
+        # Ejecutar fuera del event loop (OpenSeesPy es síncrono y global)
+        await analysis.run_opensees(_probe_opensees)
         return {"status": "healthy", "opensees": "operational"}
     except Exception as e:
         return {"status": "error", "message": str(e)}
@@ -65,4 +129,21 @@ app.include_router(analysis.router, prefix="/api/analysis", tags=["Análisis"])
 app.include_router(sections.router, prefix="/api/sections", tags=["Secciones"])
 app.include_router(materials.router, prefix="/api/materials", tags=["Materiales"])
 app.include_router(connections.router, prefix="/api/connections", tags=["Conexiones"])
-app.include_router(reports.router, prefix="/api/reports", tags=["Reportes"])
+
+if REPORTS_ENABLED:
+    from api.routes import reports
+    app.include_router(reports.router, prefix="/api/reports", tags=["Reportes"])
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # Un worker por CPU: cada proceso tiene su propio estado OpenSees
+    uvicorn.run(
+        "api.main:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8000")),
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+    )
@@ -2,16 +2,23 @@
 Routes para análisis estructural con OpenSeesPy
 """
 
+import asyncio
+import hashlib
 import logging
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field, field_validator
-from typing import List, Optional, Literal, Dict
-from engine.opensees_runner import analyze_beam, analyze_column, analyze_frame
-from engine.sections import get_section_by_id
-from engine.materials import get_material_by_id
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ConfigDict, Field, AfterValidator, ValidationError, field_validator
+from typing import Annotated, Any, List, Optional, Literal, Dict
+from engine.opensees_runner import analyze_beam, analyze_column, analyze_frame, Support
+from engine.sections import get_section_by_id, get_section_properties, AISC_SECTIONS, CHILEAN_SECTIONS
+from engine.materials import get_material_by_id, STEEL_GRADES
 from engine.load_combinations import (
-    get_critical_combination,
-    calculate_all_combinations,
+    evaluate_combinations,
     apply_combination,
     get_combinations
 )
@@ -21,10 +28,224 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+# ==================== EJECUCIÓN DE OPENSEES ====================
+
+# OpenSeesPy mantiene estado global: un solo modelo a la vez por proceso.
+# Los requests se encolan y un worker los agrupa en micro-lotes que se
+# resuelven uno tras otro en una sola llamada al executor.
+BATCH_MAX_SIZE = 16
+BATCH_MAX_WAIT = 0.010  # segundos
+
+# Procesos solver dedicados (cada uno con su propio estado OpenSees).
+# 0 = resolver en un hilo del proceso de la API (lotes en serie).
+OPENSEES_WORKERS = int(os.getenv("OPENSEES_WORKERS", "0"))
+
+
+def _init_opensees_worker():
+    """Inicializar OpenSeesPy una vez por proceso solver"""
+    import openseespy.opensees as ops
+    from engine.opensees_runner import _wipe_model
+    _wipe_model()
+    ops.model('basic', '-ndm', 2, '-ndf', 3)
+
+
+_solver_pool = None
+
+
+def _get_solver_pool() -> ProcessPoolExecutor:
+    """Pool de procesos solver (se crea en el primer uso)"""
+    global _solver_pool
+    if _solver_pool is None:
+        _solver_pool = ProcessPoolExecutor(
+            max_workers=OPENSEES_WORKERS,
+            initializer=_init_opensees_worker
+        )
+    return _solver_pool
+
+
+def _run_batch(jobs):
+    """Ejecutar un lote de trabajos en secuencia (hilo o proceso solver)"""
+    outcomes = []
+    for func, args, kwargs in jobs:
+        try:
+            outcomes.append((True, func(*args, **kwargs)))
+        except Exception as e:
+            outcomes.append((False, e))
+    return outcomes
+
+
+class _OpenSeesBatcher:
+    """Cola de trabajos OpenSeesPy con agrupación dinámica"""
+
+    def __init__(self):
+        self._loop = None
+        self._queue = None
+        self._worker = None
+        self._slots = None
+        self._pending = set()
+
+    def _ensure_worker(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._slots = asyncio.Semaphore(max(OPENSEES_WORKERS, 1))
+            self._worker = loop.create_task(self._consume())
+
+    async def _consume(self):
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + BATCH_MAX_WAIT
+
+            # Juntar requests pendientes hasta llenar el lote o vencer el plazo
+            while len(batch) < BATCH_MAX_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Un lote en vuelo por proceso solver (o uno solo en modo hilo)
+            await self._slots.acquire()
+            if OPENSEES_WORKERS > 0:
+                task = loop.create_task(self._dispatch(batch))
+                self._pending.add(task)
+                task.add_done_callback(self._pending.discard)
+            else:
+                await self._dispatch(batch)
+
+    async def _dispatch(self, batch):
+        jobs = [(func, args, kwargs) for func, args, kwargs, _ in batch]
+        try:
+            if OPENSEES_WORKERS > 0:
+                outcomes = await self._loop.run_in_executor(_get_solver_pool(), _run_batch, jobs)
+            else:
+                outcomes = await asyncio.to_thread(_run_batch, jobs)
+        except Exception as e:
+            # Falla del executor (proceso caído, argumentos no serializables)
+            outcomes = [(False, e)] * len(batch)
+        finally:
+            self._slots.release()
+
+        for (_, _, _, future), (ok, value) in zip(batch, outcomes):
+            if future.cancelled():
+                continue
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+    async def submit(self, func, *args, **kwargs):
+        self._ensure_worker()
+        future = self._loop.create_future()
+        await self._queue.put((func, args, kwargs, future))
+        return await future
+
+
+_batcher = _OpenSeesBatcher()
+
+
+async def run_opensees(func, *args, **kwargs):
+    """
+    Ejecutar una función que usa OpenSeesPy fuera del event loop
+
+    Las llamadas a OpenSeesPy son síncronas (extensión C) y bloquearían el
+    event loop. Se encolan en el worker de micro-lotes; con OPENSEES_WORKERS
+    los lotes se reparten entre procesos solver en paralelo.
+    """
+    return await _batcher.submit(func, *args, **kwargs)
+
+
+# ==================== CACHÉ DE RESULTADOS ====================
+
+# Los análisis son deterministas: el mismo request produce el mismo resultado
+RESULT_CACHE_SIZE = 1024
+
+
+class _ResultCache:
+    """Caché LRU de resultados de análisis"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+
+    def get(self, key: str):
+        result = self._data.get(key)
+        if result is not None:
+            self._data.move_to_end(key)
+        return result
+
+    def put(self, key: str, result: dict):
+        self._data[key] = result
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
+_result_cache = _ResultCache(RESULT_CACHE_SIZE)
+
+
+def _cache_key(kind: str, request: BaseModel) -> str:
+    """Hash canónico del request (claves ordenadas)"""
+    payload = orjson.dumps(request.model_dump(), option=orjson.OPT_SORT_KEYS)
+    return kind + ":" + hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _store_result(key: str, result: dict):
+    """Guardar solo análisis exitosos"""
+    if result.get("status") == "success":
+        _result_cache.put(key, result)
+
+
+# ==================== VALIDACIÓN DE CATÁLOGOS ====================
+
+# IDs válidos precalculados (los catálogos son estáticos)
+_VALID_SECTION_IDS = frozenset(AISC_SECTIONS) | frozenset(CHILEAN_SECTIONS)
+_VALID_MATERIAL_IDS = frozenset(STEEL_GRADES)
+
+
+@lru_cache(maxsize=512)
+def _section_exists(section_id: str) -> bool:
+    """Verificar si existe la sección (caso común: ID exacto en mayúsculas)"""
+    return section_id in _VALID_SECTION_IDS or get_section_by_id(section_id) is not None
+
+
+@lru_cache(maxsize=512)
+def _material_exists(material_id: str) -> bool:
+    """Verificar si existe el material (caso común: ID exacto en mayúsculas)"""
+    return material_id in _VALID_MATERIAL_IDS or get_material_by_id(material_id) is not None
+
+
+def _check_section_id(v: str) -> str:
+    if not _section_exists(v):
+        raise ValueError(f"Sección '{v}' no encontrada en el catálogo")
+    return v
+
+
+def _check_material_id(v: str) -> str:
+    if not _material_exists(v):
+        raise ValueError(f"Material '{v}' no encontrado en el catálogo")
+    return v
+
+
+# Tipos validados contra el catálogo (validador incorporado al schema)
+SectionId = Annotated[str, AfterValidator(_check_section_id)]
+MaterialId = Annotated[str, AfterValidator(_check_material_id)]
+
+# Configuración común de los modelos de request (inmutables, sin campos extra)
+_REQUEST_CONFIG = ConfigDict(extra="forbid", frozen=True)
+
+
 # ==================== MODELOS DE REQUEST ====================
 
 class PointLoad(BaseModel):
     """Carga puntual"""
+    model_config = _REQUEST_CONFIG
+
     position: float = Field(..., description="Posición desde el inicio [m]")
     Fy: float = Field(0, description="Fuerza vertical [kN] (positivo hacia abajo)")
     Fx: float = Field(0, description="Fuerza horizontal [kN]")
@@ -33,6 +254,8 @@ class PointLoad(BaseModel):
 
 class DistributedLoad(BaseModel):
     """Carga distribuida"""
+    model_config = _REQUEST_CONFIG
+
     start: float = Field(..., description="Posición inicial [m]")
     end: float = Field(..., description="Posición final [m]")
     w_start: float = Field(..., description="Carga en inicio [kN/m]")
@@ -41,6 +264,8 @@ class DistributedLoad(BaseModel):
 
 class BeamAnalysisRequest(BaseModel):
     """Request para análisis de viga"""
+    model_config = _REQUEST_CONFIG
+
     # Geometría
     length: float = Field(..., gt=0, description="Longitud de la viga [m]")
 
@@ -49,10 +274,10 @@ class BeamAnalysisRequest(BaseModel):
     support_right: Literal["fixed", "pinned", "roller", "free"] = Field("roller")
 
     # Sección (perfil)
-    section_id: str = Field(..., description="ID del perfil (ej: 'W14X22')")
+    section_id: SectionId = Field(..., description="ID del perfil (ej: 'W14X22')")
 
     # Material
-    material_id: str = Field("A572_GR50", description="ID del material")
+    material_id: MaterialId = Field("A572_GR50", description="ID del material")
 
     # Cargas - Método tradicional (compatibilidad hacia atrás)
     point_loads: List[PointLoad] = Field(default_factory=list)
@@ -76,23 +301,17 @@ class BeamAnalysisRequest(BaseModel):
     # Número de puntos para diagramas
     num_points: int = Field(21, ge=5, le=101)
 
-    @field_validator("section_id")
+    @field_validator("support_left", "support_right", mode="after")
     @classmethod
-    def validate_section_id(cls, v: str) -> str:
-        if get_section_by_id(v) is None:
-            raise ValueError(f"Sección '{v}' no encontrada en el catálogo")
-        return v
-
-    @field_validator("material_id")
-    @classmethod
-    def validate_material_id(cls, v: str) -> str:
-        if get_material_by_id(v) is None:
-            raise ValueError(f"Material '{v}' no encontrado en el catálogo")
-        return v
+    def to_support_code(cls, v: str) -> Support:
+        # Convertir una sola vez a código entero para el motor
+        return Support[v.upper()]
 
 
 class ColumnAnalysisRequest(BaseModel):
     """Request para análisis de columna"""
+    model_config = _REQUEST_CONFIG
+
     # Geometría
     height: float = Field(..., gt=0, description="Altura de la columna [m]")
 
@@ -101,10 +320,10 @@ class ColumnAnalysisRequest(BaseModel):
     top: Literal["fixed", "pinned", "free"] = Field("free")
 
     # Sección
-    section_id: str = Field(..., description="ID del perfil")
+    section_id: SectionId = Field(..., description="ID del perfil")
 
     # Material
-    material_id: str = Field("A572_GR50")
+    material_id: MaterialId = Field("A572_GR50")
 
     # Cargas - Método tradicional
     axial_load: float = Field(0, description="Carga axial [kN] (positivo = compresión)")
@@ -126,23 +345,17 @@ class ColumnAnalysisRequest(BaseModel):
     # Unidades
     units: Literal["kN-m", "tonf-m", "kgf-cm"] = Field("kN-m")
 
-    @field_validator("section_id")
+    @field_validator("base", "top", mode="after")
     @classmethod
-    def validate_section_id(cls, v: str) -> str:
-        if get_section_by_id(v) is None:
-            raise ValueError(f"Sección '{v}' no encontrada en el catálogo")
-        return v
-
-    @field_validator("material_id")
-    @classmethod
-    def validate_material_id(cls, v: str) -> str:
-        if get_material_by_id(v) is None:
-            raise ValueError(f"Material '{v}' no encontrado en el catálogo")
-        return v
+    def to_support_code(cls, v: str) -> Support:
+        # Convertir una sola vez a código entero para el motor
+        return Support[v.upper()]
 
 
 class FrameNode(BaseModel):
     """Nodo del pórtico"""
+    model_config = _REQUEST_CONFIG
+
     id: int
     x: float
     y: float
@@ -151,22 +364,19 @@ class FrameNode(BaseModel):
 
 class FrameElement(BaseModel):
     """Elemento del pórtico"""
+    model_config = _REQUEST_CONFIG
+
     id: int
     node_i: int
     node_j: int
-    section_id: str
+    section_id: SectionId
     element_type: Literal["beam", "column", "brace"] = "beam"
 
-    @field_validator("section_id")
-    @classmethod
-    def validate_section_id(cls, v: str) -> str:
-        if get_section_by_id(v) is None:
-            raise ValueError(f"Sección '{v}' no encontrada en el catálogo")
-        return v
-
 
 class FrameLoad(BaseModel):
     """Carga en el pórtico"""
+    model_config = _REQUEST_CONFIG
+
     type: Literal["nodal", "distributed", "point"]
     element_id: Optional[int] = None  # Para cargas en elementos
     node_id: Optional[int] = None     # Para cargas nodales
@@ -179,25 +389,20 @@ class FrameLoad(BaseModel):
 
 class FrameAnalysisRequest(BaseModel):
     """Request para análisis de pórtico 2D"""
+    model_config = _REQUEST_CONFIG
+
     nodes: List[FrameNode]
     elements: List[FrameElement]
     loads: List[FrameLoad]
-    material_id: str = Field("A572_GR50")
+    material_id: MaterialId = Field("A572_GR50")
     units: Literal["kN-m", "tonf-m", "kgf-cm"] = Field("kN-m")
     verify_elements: bool = Field(True, description="Realizar verificación de elementos")
 
-    @field_validator("material_id")
-    @classmethod
-    def validate_material_id(cls, v: str) -> str:
-        if get_material_by_id(v) is None:
-            raise ValueError(f"Material '{v}' no encontrado en el catálogo")
-        return v
-
 
 # ==================== ENDPOINTS ====================
 
 @router.post("/beam")
-async def analyze_beam_endpoint(request: BeamAnalysisRequest):
+async def analyze_beam_endpoint(request: BeamAnalysisRequest) -> Dict[str, Any]:
     """
     Analizar viga de acero con OpenSeesPy
 
@@ -208,19 +413,19 @@ async def analyze_beam_endpoint(request: BeamAnalysisRequest):
     - Verificaciones AISC
     - Combinaciones de carga (si se especifica design_method)
     """
+    cache_key = _cache_key("beam", request)
+    cached = _result_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         # Si se especifica método de diseño y cargas por tipo, usar combinaciones
         if request.design_method and request.load_types:
-            # Calcular todas las combinaciones
-            all_combinations = calculate_all_combinations(
+            # Calcular todas las combinaciones y la crítica en una pasada
+            all_combinations, critical_combo, critical_value = evaluate_combinations(
                 request.load_types,
-                request.design_method
-            )
-
-            # Obtener combinación crítica
-            critical_combo, critical_value = get_critical_combination(
-                request.load_types,
-                request.design_method
+                request.design_method,
+                top_k=5
             )
 
             # Crear carga distribuida con la combinación crítica
@@ -234,7 +439,8 @@ async def analyze_beam_endpoint(request: BeamAnalysisRequest):
             ]
 
             # Ejecutar análisis con carga factorizada
-            result = analyze_beam(
+            result = await run_opensees(
+                analyze_beam,
                 length=request.length,
                 support_left=request.support_left,
                 support_right=request.support_right,
@@ -256,11 +462,12 @@ async def analyze_beam_endpoint(request: BeamAnalysisRequest):
                     "factored_load": critical_value,
                     "factors": critical_combo["factors"]
                 },
-                "all_combinations": all_combinations[:5]  # Top 5
+                "all_combinations": all_combinations  # Top 5
             }
         else:
             # Método tradicional (compatibilidad hacia atrás)
-            result = analyze_beam(
+            result = await run_opensees(
+                analyze_beam,
                 length=request.length,
                 support_left=request.support_left,
                 support_right=request.support_right,
@@ -272,6 +479,7 @@ async def analyze_beam_endpoint(request: BeamAnalysisRequest):
                 num_points=request.num_points
             )
 
+        _store_result(cache_key, result)
         return result
     except Exception as e:
         logger.error(f"Error en análisis de viga: {str(e)}")
@@ -279,7 +487,7 @@ async def analyze_beam_endpoint(request: BeamAnalysisRequest):
 
 
 @router.post("/column")
-async def analyze_column_endpoint(request: ColumnAnalysisRequest):
+async def analyze_column_endpoint(request: ColumnAnalysisRequest) -> Dict[str, Any]:
     """
     Analizar columna de acero con OpenSeesPy
 
@@ -289,29 +497,30 @@ async def analyze_column_endpoint(request: ColumnAnalysisRequest):
     - Verificaciones AISC
     - Combinaciones de carga (si se especifica design_method)
     """
+    cache_key = _cache_key("column", request)
+    cached = _result_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         # Determinar carga axial a usar
         axial_load = request.axial_load
 
         # Si se especifica método de diseño y cargas por tipo, usar combinaciones
         if request.design_method and request.load_types:
-            # Calcular todas las combinaciones
-            all_combinations = calculate_all_combinations(
+            # Calcular todas las combinaciones y la crítica en una pasada
+            all_combinations, critical_combo, critical_value = evaluate_combinations(
                 request.load_types,
-                request.design_method
-            )
-
-            # Obtener combinación crítica
-            critical_combo, critical_value = get_critical_combination(
-                request.load_types,
-                request.design_method
+                request.design_method,
+                top_k=5
             )
 
             # Usar carga factorizada
             axial_load = critical_value
 
         # Ejecutar análisis
-        result = analyze_column(
+        result = await run_opensees(
+            analyze_column,
             height=request.height,
             base=request.base,
             top=request.top,
@@ -334,15 +543,23 @@ async def analyze_column_endpoint(request: ColumnAnalysisRequest):
                     "factored_load": critical_value,
                     "factors": critical_combo["factors"]
                 },
-                "all_combinations": all_combinations[:5]  # Top 5
+                "all_combinations": all_combinations  # Top 5
             }
 
+        _store_result(cache_key, result)
         return result
     except Exception as e:
         logger.error(f"Error en análisis de columna: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error en análisis: {str(e)}")
 
 
+# Respuestas precalculadas: las combinaciones son fijas para cada método
+_COMBINATIONS_JSON = {
+    method: orjson.dumps({"method": method, "combinations": get_combinations(method)})
+    for method in ("LRFD", "ASD")
+}
+
+
 @router.get("/load-combinations/{method}")
 async def get_load_combinations_endpoint(method: Literal["LRFD", "ASD"]):
     """
@@ -354,19 +571,55 @@ async def get_load_combinations_endpoint(method: Literal["LRFD", "ASD"]):
     Returns:
         Lista de combinaciones con nombre, descripción y factores
     """
-    try:
-        combinations = get_combinations(method)
-        return {
-            "method": method,
-            "combinations": combinations
-        }
-    except Exception as e:
-        logger.error(f"Error al obtener combinaciones: {str(e)}")
-        raise HTTPException(status_code=400, detail=str(e))
+    return Response(_COMBINATIONS_JSON[method], media_type="application/json")
+
+
+def _inline_schema(schema: dict) -> dict:
+    """Resolver las referencias $defs de un JSON schema (para openapi_extra)"""
+    defs = schema.pop("$defs", {})
+
+    def resolve(node):
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if ref is not None and ref.startswith("#/$defs/"):
+                return resolve(defs[ref[len("#/$defs/"):]])
+            return {k: resolve(v) for k, v in node.items()}
+        if isinstance(node, list):
+            return [resolve(v) for v in node]
+        return node
 
+    return resolve(schema)
 
-@router.post("/frame")
-async def analyze_frame_endpoint(request: FrameAnalysisRequest):
+
+async def _parse_frame_request(http_request: Request) -> FrameAnalysisRequest:
+    """
+    Decodificar y validar el cuerpo del pórtico en una sola pasada
+
+    model_validate_json parsea el JSON directamente en pydantic-core, sin
+    construir antes los dicts/listas intermedios (relevante para pórticos
+    con muchos nodos y elementos).
+    """
+    try:
+        return FrameAnalysisRequest.model_validate_json(await http_request.body())
+    except ValidationError as e:
+        errors = e.errors(include_url=False)
+        for error in errors:
+            error["loc"] = ("body", *error["loc"])
+        raise RequestValidationError(errors)
+
+
+@router.post(
+    "/frame",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _inline_schema(FrameAnalysisRequest.model_json_schema())}}
+        }
+    }
+)
+async def analyze_frame_endpoint(
+    request: FrameAnalysisRequest = Depends(_parse_frame_request)
+) -> Dict[str, Any]:
     """
     Analizar pórtico 2D con OpenSeesPy
 
@@ -376,9 +629,16 @@ async def analyze_frame_endpoint(request: FrameAnalysisRequest):
     - Fuerzas en elementos
     - Verificaciones por elemento (si verify_elements=True)
     """
+    # El hash incluye verify_elements (parte del request)
+    cache_key = _cache_key("frame", request)
+    cached = _result_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         # Ejecutar análisis estructural
-        result = analyze_frame(
+        result = await run_opensees(
+            analyze_frame,
             nodes=request.nodes,
             elements=request.elements,
             loads=request.loads,
@@ -394,12 +654,19 @@ async def analyze_frame_endpoint(request: FrameAnalysisRequest):
             # Obtener propiedades del material
             material = get_material_properties(request.material_id)
 
-            # Verificar elementos
+            # Propiedades de cada sección distinta, resueltas una sola vez
+            sections = {
+                section_id: get_section_properties(section_id)
+                for section_id in {elem.section_id for elem in request.elements}
+            }
+
+            # Verificar elementos (en un hilo: no bloquea el event loop)
             element_forces = result.get("element_forces", {})
-            verifications = verify_frame_elements(
+            verifications = await asyncio.to_thread(
+                verify_frame_elements,
                 elements=request.elements,
                 element_forces=element_forces,
-                sections={},  # No se usa, se obtiene internamente
+                sections=sections,
                 material=material,
                 nodes=request.nodes,
                 units=request.units
@@ -421,6 +688,7 @@ async def analyze_frame_endpoint(request: FrameAnalysisRequest):
                 "failed_elements": sum(1 for v in verifications if not v.get("overall_ok", False))
             }
 
+        _store_result(cache_key, result)
         return result
     except Exception as e:
         logger.error(f"Error en análisis de pórtico: {str(e)}")
@@ -2,9 +2,10 @@
 Routes para verificacion de conexiones con pernos
 """
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
-from typing import Literal
+from fastapi import APIRouter, HTTPException, Response
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, Dict, Literal
+import orjson
 from engine.connections import (
     verify_bolt_shear,
     verify_bolt_tension,
@@ -19,7 +20,13 @@ router = APIRouter()
 
 
 # Request Models
+# Configuracion comun (inmutables, sin campos extra)
+_REQUEST_CONFIG = ConfigDict(extra="forbid", frozen=True)
+
+
 class BoltShearRequest(BaseModel):
+    model_config = _REQUEST_CONFIG
+
     bolt_grade: str = Field(..., description="Grado del perno (A325, A490, 8.8, 10.9)")
     diameter: str = Field(..., description="Diametro nominal (M12, M16, 3/4\", etc)")
     num_bolts: int = Field(..., ge=1, description="Numero de pernos")
@@ -28,6 +35,8 @@ class BoltShearRequest(BaseModel):
 
 
 class BoltTensionRequest(BaseModel):
+    model_config = _REQUEST_CONFIG
+
     bolt_grade: str = Field(..., description="Grado del perno")
     diameter: str = Field(..., description="Diametro nominal")
     num_bolts: int = Field(..., ge=1, description="Numero de pernos")
@@ -35,6 +44,8 @@ class BoltTensionRequest(BaseModel):
 
 
 class BoltCombinedRequest(BaseModel):
+    model_config = _REQUEST_CONFIG
+
     bolt_grade: str = Field(..., description="Grado del perno")
     diameter: str = Field(..., description="Diametro nominal")
     num_bolts: int = Field(..., ge=1, description="Numero de pernos")
@@ -44,6 +55,8 @@ class BoltCombinedRequest(BaseModel):
 
 
 class BoltBearingRequest(BaseModel):
+    model_config = _REQUEST_CONFIG
+
     t_plate: float = Field(..., gt=0, description="Espesor de placa [mm]")
     Fu_plate: float = Field(..., gt=0, description="Tension ultima de placa [MPa]")
     diameter: str = Field(..., description="Diametro nominal del perno")
@@ -55,6 +68,8 @@ class BoltBearingRequest(BaseModel):
 
 
 class BlockShearRequest(BaseModel):
+    model_config = _REQUEST_CONFIG
+
     Agv: float = Field(..., gt=0, description="Area bruta a corte [mm2]")
     Anv: float = Field(..., gt=0, description="Area neta a corte [mm2]")
     Ant: float = Field(..., gt=0, description="Area neta a tension [mm2]")
@@ -65,7 +80,7 @@ class BlockShearRequest(BaseModel):
 
 # Endpoints
 @router.post("/bolts/shear")
-async def verify_shear(request: BoltShearRequest):
+async def verify_shear(request: BoltShearRequest) -> Dict[str, Any]:
     """Verificar pernos a corte segun AISC J3.6"""
     try:
         result = verify_bolt_shear(
@@ -83,7 +98,7 @@ async def verify_shear(request: BoltShearRequest):
 
 
 @router.post("/bolts/tension")
-async def verify_tension(request: BoltTensionRequest):
+async def verify_tension(request: BoltTensionRequest) -> Dict[str, Any]:
     """Verificar pernos a tension segun AISC J3.6"""
     try:
         result = verify_bolt_tension(
@@ -100,7 +115,7 @@ async def verify_tension(request: BoltTensionRequest):
 
 
 @router.post("/bolts/combined")
-async def verify_combined(request: BoltCombinedRequest):
+async def verify_combined(request: BoltCombinedRequest) -> Dict[str, Any]:
     """Verificar pernos a tension + corte combinado segun AISC J3.7"""
     try:
         result = verify_bolt_combined(
@@ -119,7 +134,7 @@ async def verify_combined(request: BoltCombinedRequest):
 
 
 @router.post("/bolts/bearing")
-async def verify_bearing(request: BoltBearingRequest):
+async def verify_bearing(request: BoltBearingRequest) -> Dict[str, Any]:
     """Verificar aplastamiento en placa segun AISC J3.10"""
     try:
         result = verify_bolt_bearing(
@@ -140,7 +155,7 @@ async def verify_bearing(request: BoltBearingRequest):
 
 
 @router.post("/block-shear")
-async def verify_block_shear_endpoint(request: BlockShearRequest):
+async def verify_block_shear_endpoint(request: BlockShearRequest) -> Dict[str, Any]:
     """Verificar bloque de corte segun AISC J4.3"""
     try:
         result = verify_block_shear(
@@ -156,19 +171,27 @@ async def verify_block_shear_endpoint(request: BlockShearRequest):
         raise HTTPException(status_code=500, detail=f"Error en verificacion: {str(e)}")
 
 
+# Catalogos estaticos construidos y serializados una sola vez
+_BOLT_GRADES = tuple(get_available_bolt_grades())
+_BOLT_DIAMETERS = tuple(get_available_bolt_diameters())
+
+_BOLT_GRADES_JSON = orjson.dumps({
+    "count": len(_BOLT_GRADES),
+    "grades": _BOLT_GRADES
+})
+_BOLT_DIAMETERS_JSON = orjson.dumps({
+    "count": len(_BOLT_DIAMETERS),
+    "diameters": _BOLT_DIAMETERS
+})
+
+
 @router.get("/bolts/grades")
 async def list_bolt_grades():
     """Listar grados de pernos disponibles con sus propiedades"""
-    return {
-        "count": len(get_available_bolt_grades()),
-        "grades": get_available_bolt_grades()
-    }
+    return Response(_BOLT_GRADES_JSON, media_type="application/json")
 
 
 @router.get("/bolts/diameters")
 async def list_bolt_diameters():
     """Listar diametros de pernos disponibles con sus propiedades"""
-    return {
-        "count": len(get_available_bolt_diameters()),
-        "diameters": get_available_bolt_diameters()
-    }
+    return Response(_BOLT_DIAMETERS_JSON, media_type="application/json")
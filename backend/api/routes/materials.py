@@ -2,12 +2,33 @@
 Routes para consultar materiales de acero
 """
 
-from fastapi import APIRouter, HTTPException
-from typing import Optional, Literal
+from fastapi import APIRouter, HTTPException, Response
+from typing import Any, Dict, Optional, Literal
+import orjson
 from engine.materials import get_all_materials, get_material_by_id, STEEL_GRADES
 
 router = APIRouter()
 
+# Catálogos de solo lectura, construidos una sola vez
+_MATERIALS = tuple(get_all_materials())
+_GRADES = tuple(STEEL_GRADES)
+
+_MATERIALS_JSON = orjson.dumps({
+    "count": len(_MATERIALS),
+    "materials": _MATERIALS
+})
+
+_STEEL_GRADES_JSON = orjson.dumps({
+    "grades": _GRADES,
+    "description": {
+        "A36": "Acero estructural carbono (Fy=250 MPa)",
+        "A572_GR50": "Acero alta resistencia baja aleación (Fy=345 MPa)",
+        "A992": "Acero para perfiles W (Fy=345 MPa)",
+        "A500_GR_B": "Acero para tubos estructurales (Fy=290 MPa)",
+        "A500_GR_C": "Acero para tubos estructurales (Fy=317 MPa)",
+    }
+})
+
 
 @router.get("/")
 async def list_materials():
@@ -22,30 +43,17 @@ async def list_materials():
     - nu: Coeficiente de Poisson
     - rho: Densidad [kg/m³]
     """
-    materials = get_all_materials()
-    return {
-        "count": len(materials),
-        "materials": materials
-    }
+    return Response(_MATERIALS_JSON, media_type="application/json")
 
 
 @router.get("/grades")
 async def list_steel_grades():
     """Listar grados de acero disponibles"""
-    return {
-        "grades": list(STEEL_GRADES.keys()),
-        "description": {
-            "A36": "Acero estructural carbono (Fy=250 MPa)",
-            "A572_GR50": "Acero alta resistencia baja aleación (Fy=345 MPa)",
-            "A992": "Acero para perfiles W (Fy=345 MPa)",
-            "A500_GR_B": "Acero para tubos estructurales (Fy=290 MPa)",
-            "A500_GR_C": "Acero para tubos estructurales (Fy=317 MPa)",
-        }
-    }
+    return Response(_STEEL_GRADES_JSON, media_type="application/json")
 
 
 @router.get("/{material_id}")
-async def get_material(material_id: str):
+async def get_material(material_id: str) -> Dict[str, Any]:
     """
     Obtener propiedades de un material específico
     """
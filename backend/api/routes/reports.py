@@ -3,32 +3,71 @@ REPORTS - Generación de memorias de cálculo en PDF
 Genera reportes profesionales con ReportLab para vigas y columnas
 """
 
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import anyio
+import orjson
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
-from typing import Optional, Dict, List
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict
+from types import MappingProxyType
+from typing import Any, Optional, Dict, List, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime
-from io import BytesIO
+from tempfile import SpooledTemporaryFile
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch, mm
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
+from reportlab.platypus import Table, TableStyle, Paragraph, Spacer, PageBreak, Image
 from reportlab.platypus.frames import Frame
 from reportlab.platypus.doctemplate import PageTemplate, BaseDocTemplate
 from reportlab.pdfgen import canvas
 
 router = APIRouter()
 
+# PDFs up to this size stay in memory and are sent as one body; larger ones
+# spill to a temp file and are streamed in chunks
+PDF_SPOOL_MAX_SIZE = 256 * 1024
+PDF_CHUNK_SIZE = 64 * 1024
+
+# ReportLab rendering is synchronous and CPU-bound; renders run in worker
+# threads so they never block the event loop, capped at about one per CPU so
+# concurrent PDFs queue instead of thrashing (override with PDF_RENDER_THREADS)
+PDF_RENDER_THREADS = int(os.getenv("PDF_RENDER_THREADS", "0")) or max(2, os.cpu_count() or 2)
+_PDF_RENDER_LIMITER = anyio.CapacityLimiter(PDF_RENDER_THREADS)
+
+# Rendered in-memory PDFs kept for identical repeat requests
+PDF_CACHE_SIZE = int(os.getenv("PDF_CACHE_SIZE", "128"))
+
+# Column reports bundled per /column/batch request (one document build)
+MAX_BATCH_REPORTS = 20
+
+# Lines per paragraph in item listings (e.g. beam loads). ReportLab re-wraps
+# a whole paragraph each time it splits it across a page, so very long lists
+# are laid out as several bounded paragraphs instead of one
+MAX_LISTING_LINES = 50
+
 
 # ============================================================================
 # PYDANTIC MODELS FOR REPORT REQUESTS
 # ============================================================================
 
+# Report payloads are read-only snapshots of a finished calculation; unknown
+# fields from newer clients are dropped instead of rejected
+_REPORT_CONFIG = ConfigDict(extra='ignore', frozen=True)
+
+
 class BeamReportRequest(BaseModel):
     """Request model for beam calculation report"""
+    model_config = _REPORT_CONFIG
+
     # Input data
     length: float
     section_id: str
@@ -103,6 +142,8 @@ class BeamReportRequest(BaseModel):
 
 class ColumnReportRequest(BaseModel):
     """Request model for column calculation report"""
+    model_config = _REPORT_CONFIG
+
     # Input data
     height: float
     section_id: str
@@ -165,490 +206,716 @@ class ColumnReportRequest(BaseModel):
 
 
 # ============================================================================
-# PDF GENERATION UTILITIES
+# CACHED COLORS AND STYLES (built once at import, read-only afterwards)
 # ============================================================================
 
-def create_header_footer(canvas_obj, doc):
-    """Draw header and footer on each page"""
-    canvas_obj.saveState()
-
-    # Header
-    canvas_obj.setFont('Helvetica-Bold', 10)
-    canvas_obj.drawString(50, A4[1] - 30, "STRUCT-CALC ACERO")
-    canvas_obj.setFont('Helvetica', 8)
-    canvas_obj.drawRightString(A4[0] - 50, A4[1] - 30, f"Generado: {datetime.now().strftime('%d/%m/%Y %H:%M')}")
-    canvas_obj.line(50, A4[1] - 35, A4[0] - 50, A4[1] - 35)
-
-    # Footer
-    canvas_obj.line(50, 40, A4[0] - 50, 40)
-    canvas_obj.setFont('Helvetica', 8)
-    canvas_obj.drawString(50, 25, "Memoria de Cálculo - AISC 360")
-    canvas_obj.drawRightString(A4[0] - 50, 25, f"Página {doc.page}")
-
-    canvas_obj.restoreState()
-
-
-def get_unit_labels(units: str) -> Dict[str, str]:
-    """Get unit labels based on unit system"""
-    unit_systems = {
-        "kN-m": {"force": "kN", "length": "m", "moment": "kN-m", "stress": "MPa"},
-        "tonf-m": {"force": "tonf", "length": "m", "moment": "tonf-m", "stress": "kgf/cm²"},
-        "kgf-cm": {"force": "kgf", "length": "cm", "moment": "kgf-cm", "stress": "kgf/cm²"},
-    }
-    return unit_systems.get(units, unit_systems["kN-m"])
-
-
-def create_title_section(title: str, styles):
-    """Create title section"""
-    elements = []
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Title'],
-        fontSize=18,
-        textColor=colors.HexColor('#1e3a8a'),
-        spaceAfter=30,
+# Layout dimensions (points), computed once
+_SP_S = 0.2*inch
+_SP_M = 0.3*inch
+_INFO_COLWIDTHS = (4*inch, 2*inch)
+_RESULTS_COLWIDTHS = (3*inch, 1.5*inch, 1.5*inch)
+_CHECK_COLWIDTHS = (2*inch, 2.2*inch, 1*inch, 0.8*inch)
+_GRID4_COLWIDTHS = (1.5*inch, 1.5*inch, 1.5*inch, 1.5*inch)
+_CONCLUSION_COLWIDTHS = (6*inch,)
+
+_C_WHITE = colors.white
+_C_TITLE = colors.HexColor('#1e3a8a')
+_C_TEXT = colors.HexColor('#1e293b')
+_C_GRID = colors.HexColor('#cbd5e1')
+_C_INFO_BG = colors.HexColor('#f1f5f9')
+_C_HEADER_BLUE = colors.HexColor('#3b82f6')
+_C_HEADER_GREEN = colors.HexColor('#10b981')
+_C_HEADER_GRAY = colors.HexColor('#64748b')
+_C_HEADER_AMBER = colors.HexColor('#f59e0b')
+_C_HEADER_RED = colors.HexColor('#ef4444')
+_C_OK_BG = colors.HexColor('#d1fae5')
+_C_OK_FG = colors.HexColor('#065f46')
+_C_FAIL_BG = colors.HexColor('#fee2e2')
+_C_FAIL_FG = colors.HexColor('#991b1b')
+
+# (background, text) for a status cell, indexed by int(ok)
+_STATUS_COLORS = ((_C_FAIL_BG, _C_FAIL_FG), (_C_OK_BG, _C_OK_FG))
+
+_STYLES = getSampleStyleSheet()
+_NORMAL = _STYLES['Normal']
+_HEADING3 = _STYLES['Heading3']
+
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Title'],
+    fontSize=18,
+    textColor=_C_TITLE,
+    spaceAfter=30,
+    alignment=TA_CENTER,
+    fontName='Helvetica-Bold'
+)
+
+_HEADING_STYLE = ParagraphStyle(
+    'Heading2Custom',
+    parent=_STYLES['Heading2'],
+    fontSize=12,
+    textColor=_C_TITLE,
+    spaceAfter=12,
+    fontName='Helvetica-Bold'
+)
+
+
+def _conclusion_style(text_color):
+    return ParagraphStyle(
+        'Conclusion',
+        parent=_NORMAL,
+        fontSize=14,
+        fontName='Helvetica-Bold',
+        textColor=text_color,
         alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
+        spaceAfter=10,
+        spaceBefore=10
     )
-    elements.append(Paragraph(title, title_style))
-    return elements
 
 
-def create_info_table(data: List[List], col_widths=None):
-    """Create a formatted info table"""
-    if col_widths is None:
-        col_widths = [4*inch, 2*inch]
-
-    table = Table(data, colWidths=col_widths)
-    table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#f1f5f9')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#1e293b')),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (1, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#cbd5e1')),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 12),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 12),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-    ]))
-    return table
+_CONCLUSION_OK_STYLE = _conclusion_style(_C_OK_FG)
+_CONCLUSION_FAIL_STYLE = _conclusion_style(_C_FAIL_FG)
 
 
-def create_results_table(data: List[List], header_color='#3b82f6'):
-    """Create results table with header"""
-    table = Table(data, colWidths=[3*inch, 1.5*inch, 1.5*inch])
-    table.setStyle(TableStyle([
+def _conclusion_box_style(bg_color, text_color):
+    return TableStyle((
+        ('BACKGROUND', (0, 0), (-1, -1), bg_color),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('LEFTPADDING', (0, 0), (-1, -1), 20),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 20),
+        ('TOPPADDING', (0, 0), (-1, -1), 15),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 15),
+        ('BOX', (0, 0), (-1, -1), 2, text_color),
+    ))
+
+
+_CONCLUSION_OK_BOX_STYLE = _conclusion_box_style(_C_OK_BG, _C_OK_FG)
+_CONCLUSION_FAIL_BOX_STYLE = _conclusion_box_style(_C_FAIL_BG, _C_FAIL_FG)
+
+_INFO_TABLE_STYLE = TableStyle((
+    ('BACKGROUND', (0, 0), (-1, -1), _C_INFO_BG),
+    ('TEXTCOLOR', (0, 0), (-1, -1), _C_TEXT),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 0.5, _C_GRID),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 12),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 12),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+))
+
+
+@lru_cache(maxsize=16)
+def _results_table_style(header_color: str) -> TableStyle:
+    """Results table style for a given header color (cached per color)"""
+    return TableStyle((
         # Header row
         ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(header_color)),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('TEXTCOLOR', (0, 0), (-1, 0), _C_WHITE),
         ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
         ('FONTSIZE', (0, 0), (-1, 0), 11),
         ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
         # Data rows
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('TEXTCOLOR', (0, 1), (-1, -1), colors.HexColor('#1e293b')),
+        ('BACKGROUND', (0, 1), (-1, -1), _C_WHITE),
+        ('TEXTCOLOR', (0, 1), (-1, -1), _C_TEXT),
         ('FONTNAME', (0, 1), (0, -1), 'Helvetica'),
         ('FONTNAME', (1, 1), (-1, -1), 'Courier'),
         ('FONTSIZE', (0, 1), (-1, -1), 10),
         ('ALIGN', (0, 1), (0, -1), 'LEFT'),
         ('ALIGN', (1, 1), (-1, -1), 'CENTER'),
         # Grid
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#cbd5e1')),
+        ('GRID', (0, 0), (-1, -1), 1, _C_GRID),
         ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
         ('LEFTPADDING', (0, 0), (-1, -1), 12),
         ('RIGHTPADDING', (0, 0), (-1, -1), 12),
         ('TOPPADDING', (0, 0), (-1, -1), 8),
         ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-    ]))
-    return table
+    ))
 
 
-def create_verification_table(checks: List[Dict], header_color='#10b981'):
-    """Create verification table with OK/NO OK status"""
-    data = [['Verificación', 'Demanda / Capacidad', 'Ratio', 'Estado']]
-
-    for check in checks:
-        status = 'OK' if check['ok'] else 'NO OK'
-        ratio_str = f"{check['ratio']*100:.1f}%"
-        demand_capacity = f"{check['demand']:.1f} / {check['capacity']:.1f} {check['unit']}"
-        data.append([
-            check['label'],
-            demand_capacity,
-            ratio_str,
-            status
-        ])
-
-    table = Table(data, colWidths=[2*inch, 2.2*inch, 1*inch, 0.8*inch])
-
-    # Base style
-    style = [
+@lru_cache(maxsize=16)
+def _verification_base_style(header_color: str) -> TableStyle:
+    """Shared part of the verification table style (cached per header color)"""
+    return TableStyle((
         # Header
         ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(header_color)),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('TEXTCOLOR', (0, 0), (-1, 0), _C_WHITE),
         ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
         ('FONTSIZE', (0, 0), (-1, 0), 11),
         ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
         # Data
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('TEXTCOLOR', (0, 1), (-1, -1), colors.HexColor('#1e293b')),
+        ('BACKGROUND', (0, 1), (-1, -1), _C_WHITE),
+        ('TEXTCOLOR', (0, 1), (-1, -1), _C_TEXT),
         ('FONTNAME', (0, 1), (0, -1), 'Helvetica'),
         ('FONTNAME', (1, 1), (-1, -1), 'Courier'),
         ('FONTSIZE', (0, 1), (-1, -1), 9),
         ('ALIGN', (0, 1), (0, -1), 'LEFT'),
         ('ALIGN', (1, 1), (-1, -1), 'CENTER'),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#cbd5e1')),
+        ('GRID', (0, 0), (-1, -1), 1, _C_GRID),
         ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
         ('LEFTPADDING', (0, 0), (-1, -1), 8),
         ('RIGHTPADDING', (0, 0), (-1, -1), 8),
         ('TOPPADDING', (0, 0), (-1, -1), 6),
         ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ))
+
+
+_REACTIONS_TABLE_STYLE = TableStyle((
+    ('BACKGROUND', (0, 0), (-1, 0), _C_HEADER_GRAY),
+    ('TEXTCOLOR', (0, 0), (-1, 0), _C_WHITE),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 1), (-1, -1), 'Courier'),
+    ('GRID', (0, 0), (-1, -1), 1, _C_GRID),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+))
+
+_DEFLECTION_BASE_STYLE = TableStyle((
+    ('BACKGROUND', (0, 0), (-1, 0), _C_HEADER_AMBER),
+    ('TEXTCOLOR', (0, 0), (-1, 0), _C_WHITE),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 1), (-1, -1), 'Courier'),
+    ('GRID', (0, 0), (-1, -1), 1, _C_GRID),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+))
+
+
+def _interaction_table_style(header_bg):
+    return TableStyle((
+        ('BACKGROUND', (0, 0), (-1, 0), header_bg),
+        ('TEXTCOLOR', (0, 0), (-1, 0), _C_WHITE),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (1, 0), (-1, 0), 'Courier-Bold'),
+        ('GRID', (0, 0), (-1, -1), 1, _C_GRID),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ))
+
+
+_INTERACTION_OK_STYLE = _interaction_table_style(_C_HEADER_GREEN)
+_INTERACTION_FAIL_STYLE = _interaction_table_style(_C_HEADER_RED)
+
+
+# ============================================================================
+# PDF GENERATION UTILITIES
+# ============================================================================
+
+def create_header_footer(canvas_obj, doc, _w=A4[0], _h=A4[1]):
+    """Draw header and footer on each page (grouped by font)"""
+    set_font = canvas_obj.setFont
+    draw = canvas_obj.drawString
+    draw_right = canvas_obj.drawRightString
+    line = canvas_obj.line
+
+    canvas_obj.saveState()
+
+    set_font('Helvetica-Bold', 10)
+    draw(50, _h - 30, "STRUCT-CALC ACERO")
+
+    set_font('Helvetica', 8)
+    draw_right(_w - 50, _h - 30, f"Generado: {doc.generated_at}")
+    draw(50, 25, "Memoria de Cálculo - AISC 360")
+    draw_right(_w - 50, 25, f"Página {doc.page}")
+
+    # Header / footer rules
+    line(50, _h - 35, _w - 50, _h - 35)
+    line(50, 40, _w - 50, 40)
+
+    canvas_obj.restoreState()
+
+
+def report_timestamp() -> str:
+    """Timestamp printed in the page header (minute resolution)"""
+    return datetime.now().strftime('%d/%m/%Y %H:%M')
+
+
+def iter_pdf_chunks(pdf_file, chunk_size: int = PDF_CHUNK_SIZE):
+    """Yield the generated PDF in fixed-size chunks and close the file when done"""
+    try:
+        pdf_file.seek(0)
+        for chunk in iter(lambda: pdf_file.read(chunk_size), b''):
+            yield chunk
+    finally:
+        pdf_file.close()
+
+
+class _PdfCache:
+    """LRU cache of rendered PDF bytes"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+
+    def get(self, key: str) -> Optional[bytes]:
+        data = self._data.get(key)
+        if data is not None:
+            self._data.move_to_end(key)
+        return data
+
+    def put(self, key: str, data: bytes):
+        self._data[key] = data
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
+_pdf_cache = _PdfCache(PDF_CACHE_SIZE)
+
+
+def report_cache_key(kind: str, request: BaseModel, generated_at: str) -> str:
+    """Canonical request hash, scoped to the timestamp printed in the page header"""
+    payload = orjson.dumps(request.model_dump(), option=orjson.OPT_SORT_KEYS)
+    return f"{kind}:{generated_at}:" + hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def pdf_bytes_response(data: bytes, filename: str) -> Response:
+    """Return an in-memory PDF as a single body"""
+    headers = {"Content-Disposition": f"attachment; filename={filename}"}
+    return Response(content=data, media_type="application/pdf", headers=headers)
+
+
+def pdf_response(pdf_file, filename: str, cache_key: Optional[str] = None) -> Response:
+    """Return the PDF as a single body while it is still in memory, else stream it"""
+    size = pdf_file.seek(0, 2)
+    if size > PDF_SPOOL_MAX_SIZE:
+        headers = {"Content-Disposition": f"attachment; filename={filename}"}
+        return StreamingResponse(iter_pdf_chunks(pdf_file), media_type="application/pdf", headers=headers)
+
+    pdf_file.seek(0)
+    data = pdf_file.read()
+    pdf_file.close()
+    if cache_key is not None:
+        _pdf_cache.put(cache_key, data)
+    return pdf_bytes_response(data, filename)
+
+
+# Renders in progress by cache key, so identical concurrent requests wait
+# for the first one instead of building the same PDF again. Only touched
+# from the event loop, so no lock is needed.
+_pdf_inflight: Dict[str, anyio.Event] = {}
+
+
+async def cached_pdf_response(kind: str, render, request: BaseModel, filename: str) -> Response:
+    """Serve a report from the cache, join an identical render in flight, or
+    render it in a worker thread"""
+    generated_at = report_timestamp()
+    cache_key = report_cache_key(kind, request, generated_at)
+    cached = _pdf_cache.get(cache_key)
+    if cached is None:
+        pending = _pdf_inflight.get(cache_key)
+        if pending is not None:
+            await pending.wait()
+            cached = _pdf_cache.get(cache_key)
+    if cached is not None:
+        return pdf_bytes_response(cached, filename)
+
+    # Large PDFs are streamed rather than cached; those waiters render again
+    event = anyio.Event()
+    owner = _pdf_inflight.setdefault(cache_key, event) is event
+    try:
+        buffer = await anyio.to_thread.run_sync(render, request, generated_at, limiter=_PDF_RENDER_LIMITER)
+        return pdf_response(buffer, filename, cache_key)
+    finally:
+        if owner:
+            del _pdf_inflight[cache_key]
+            event.set()
+
+
+_UNIT_SYSTEMS = MappingProxyType({
+    "kN-m": MappingProxyType({"force": "kN", "length": "m", "moment": "kN-m", "stress": "MPa"}),
+    "tonf-m": MappingProxyType({"force": "tonf", "length": "m", "moment": "tonf-m", "stress": "kgf/cm²"}),
+    "kgf-cm": MappingProxyType({"force": "kgf", "length": "cm", "moment": "kgf-cm", "stress": "kgf/cm²"}),
+})
+_DEFAULT_UNITS = _UNIT_SYSTEMS["kN-m"]
+
+_BEAM_SUPPORT_LABELS = MappingProxyType({
+    'fixed': 'Empotrado',
+    'pinned': 'Articulado',
+    'roller': 'Rodillo',
+    'free': 'Libre'
+})
+
+_COLUMN_SUPPORT_LABELS = MappingProxyType({
+    'fixed': 'Empotrado',
+    'pinned': 'Articulado',
+    'free': 'Libre'
+})
+
+
+# Precompiled cell formatters for numeric table rows
+_FMT_2F = "{:.2f}".format
+_FMT_MM = "{:.2f} mm".format
+_STATUS_TEXT = ('NO OK', 'OK')
+
+# Load-combination paragraphs (fixed markup, only the values change)
+_BEAM_COMBINATION_TEXT = (
+    "<b>Método de diseño:</b> {method}<br/>"
+    "<b>Combinación crítica:</b> {name}<br/>"
+    "<b>Carga factorizada:</b> {load:.2f}{suffix}"
+).format
+_COLUMN_COMBINATION_TEXT = (
+    "<b>Método de diseño:</b> {method}<br/>"
+    "<b>Combinación crítica:</b> {name}<br/>"
+    "<b>Carga axial factorizada:</b> {load:.1f} {force}"
+).format
+
+
+def reaction_row(label: str, rx: float, ry: float, mz: float, _abs=abs, _fmt=_FMT_2F) -> List[str]:
+    """Reaction table row; a zero moment (pinned/roller, incl. -0.0) prints '-'"""
+    return [label, _fmt(_abs(rx)), _fmt(_abs(ry)), '-' if mz == 0 else _fmt(_abs(mz))]
+
+
+def deflection_row(label: str, limit: float, actual: float, ok: bool) -> List[str]:
+    """Deflection table row: limit, actual (mm) and status"""
+    return [label, _FMT_MM(limit), _FMT_MM(actual), _STATUS_TEXT[ok]]
+
+
+def get_unit_labels(units: str) -> Mapping[str, str]:
+    """Get unit labels based on unit system"""
+    return _UNIT_SYSTEMS.get(units, _DEFAULT_UNITS)
+
+
+def create_title_section(title: str):
+    """Create title section"""
+    elements = []
+    elements.append(Paragraph(title, _TITLE_STYLE))
+    return elements
+
+
+def create_info_table(data: List[List], col_widths=None):
+    """Create a formatted info table"""
+    if col_widths is None:
+        col_widths = _INFO_COLWIDTHS
+
+    table = Table(data, colWidths=col_widths, style=_INFO_TABLE_STYLE)
+    return table
+
+
+def create_results_table(data: List[List], header_color='#3b82f6'):
+    """Create results table with header"""
+    table = Table(data, colWidths=_RESULTS_COLWIDTHS, style=_results_table_style(header_color))
+    return table
+
+
+def create_verification_table(checks: List[Dict], header_color='#10b981'):
+    """Create verification table with OK/NO OK status"""
+    data = [['Verificación', 'Demanda / Capacidad', 'Ratio', 'Estado']]
+    data.extend(
+        [
+            check['label'],
+            f"{check['demand']:.1f} / {check['capacity']:.1f} {check['unit']}",
+            f"{check['ratio']*100:.1f}%",
+            'OK' if check['ok'] else 'NO OK'
+        ]
+        for check in checks
+    )
+
+    # Base style (shared)
+    table = Table(data, colWidths=_CHECK_COLWIDTHS, style=_verification_base_style(header_color))
+
+    # Color status column (varies per row)
+    status_colors = [_STATUS_COLORS[bool(check['ok'])] for check in checks]
+    style = [
+        cmd
+        for i, (bg, fg) in enumerate(status_colors, start=1)
+        for cmd in (
+            ('BACKGROUND', (3, i), (3, i), bg),
+            ('TEXTCOLOR', (3, i), (3, i), fg),
+            ('FONTNAME', (3, i), (3, i), 'Helvetica-Bold'),
+        )
     ]
 
-    # Color status column
-    for i, check in enumerate(checks, start=1):
-        if check['ok']:
-            style.append(('BACKGROUND', (3, i), (3, i), colors.HexColor('#d1fae5')))
-            style.append(('TEXTCOLOR', (3, i), (3, i), colors.HexColor('#065f46')))
-        else:
-            style.append(('BACKGROUND', (3, i), (3, i), colors.HexColor('#fee2e2')))
-            style.append(('TEXTCOLOR', (3, i), (3, i), colors.HexColor('#991b1b')))
-        style.append(('FONTNAME', (3, i), (3, i), 'Helvetica-Bold'))
-
-    table.setStyle(TableStyle(style))
+    table.setStyle(style)
     return table
 
 
-def create_conclusion_box(overall_ok: bool, styles):
+def append_listing(elements: List, heading: str, lines: List[str], max_lines: int = MAX_LISTING_LINES):
+    """Append a heading plus one line per item, split into paragraphs of at
+    most max_lines lines so page-break splitting never rewraps a huge block"""
+    for start in range(0, len(lines), max_lines):
+        chunk = "".join(lines[start:start + max_lines])
+        elements.append(Paragraph(heading + chunk if start == 0 else chunk, _NORMAL))
+
+
+def create_conclusion_box(overall_ok: bool):
     """Create conclusion box"""
     elements = []
 
     if overall_ok:
-        bg_color = colors.HexColor('#d1fae5')
-        text_color = colors.HexColor('#065f46')
         conclusion_text = "LA SECCIÓN CUMPLE CON TODOS LOS REQUISITOS"
         icon = "✓"
+        conclusion_style = _CONCLUSION_OK_STYLE
+        box_style = _CONCLUSION_OK_BOX_STYLE
     else:
-        bg_color = colors.HexColor('#fee2e2')
-        text_color = colors.HexColor('#991b1b')
         conclusion_text = "LA SECCIÓN NO CUMPLE - REDIMENSIONAR"
         icon = "✗"
-
-    conclusion_style = ParagraphStyle(
-        'Conclusion',
-        parent=styles['Normal'],
-        fontSize=14,
-        fontName='Helvetica-Bold',
-        textColor=text_color,
-        alignment=TA_CENTER,
-        spaceAfter=10,
-        spaceBefore=10
-    )
+        conclusion_style = _CONCLUSION_FAIL_STYLE
+        box_style = _CONCLUSION_FAIL_BOX_STYLE
 
     data = [[Paragraph(f"{icon}  {conclusion_text}", conclusion_style)]]
-    table = Table(data, colWidths=[6*inch])
-    table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), bg_color),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 20),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 20),
-        ('TOPPADDING', (0, 0), (-1, -1), 15),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 15),
-        ('BOX', (0, 0), (-1, -1), 2, text_color),
-    ]))
+    table = Table(data, colWidths=_CONCLUSION_COLWIDTHS, style=box_style)
 
     elements.append(table)
     return elements
 
 
+# ============================================================================
+# SHARED REPORT SKELETON
+# ============================================================================
+
+@dataclass(slots=True)
+class InfoSection:
+    """Heading followed by a two-column info table"""
+    title: str
+    rows: List[List]
+    heading_style: ParagraphStyle = _HEADING_STYLE
+    space_after: float = _SP_S
+
+
+def append_info_sections(elements: List, sections: List[InfoSection]):
+    """Append each section as heading + info table + spacer"""
+    for section in sections:
+        elements.append(Paragraph(section.title, section.heading_style))
+        elements.append(create_info_table(section.rows))
+        elements.append(Spacer(1, section.space_after))
+
+
+def create_report_intro(title: str, request, input_rows: List[List], section_rows: List[List]) -> List:
+    """Title, project info and input data (sections 1 to 2.2) shared by all reports"""
+    elements = create_title_section(title)
+    elements.append(Spacer(1, _SP_S))
+
+    project_rows = [
+        ['Proyecto:', request.project_name],
+        ['Fecha:', request.date or datetime.now().strftime('%d/%m/%Y')],
+        ['Ingeniero:', request.engineer or 'No especificado'],
+    ]
+    material_rows = [
+        ['Especificación:', request.material_id],
+        ['Esfuerzo de fluencia Fy:', f"{request.material_fy} MPa"],
+        ['Módulo de elasticidad E:', f"{request.material_e} MPa"],
+    ]
+    append_info_sections(elements, [
+        InfoSection("1. INFORMACIÓN DEL PROYECTO", project_rows, space_after=_SP_M),
+        InfoSection("2. DATOS DE ENTRADA", input_rows),
+        InfoSection("2.1 Perfil Estructural", section_rows, _HEADING3),
+        InfoSection("2.2 Material", material_rows, _HEADING3),
+    ])
+    return elements
+
+
+def append_report_conclusion(elements: List, request):
+    """Conclusion box and optional notes shared by all reports"""
+    elements.append(Paragraph("5. CONCLUSIÓN", _HEADING_STYLE))
+    elements.extend(create_conclusion_box(request.overall_ok))
+
+    if request.notes:
+        elements.append(Spacer(1, _SP_S))
+        elements.append(Paragraph("6. NOTAS ADICIONALES", _HEADING_STYLE))
+        elements.append(Paragraph(request.notes, _NORMAL))
+
+
+# Page layout is the same for every report. Frames keep layout state while a
+# document is built, so each render thread reuses its own template instead
+# of sharing one across concurrent builds.
+_page_templates = threading.local()
+
+
+def get_a4_page_template() -> PageTemplate:
+    """A4 page template (margins 50/60 pt) with header/footer, cached per thread"""
+    template = getattr(_page_templates, 'a4', None)
+    if template is None:
+        frame = Frame(50, 60, A4[0] - 100, A4[1] - 120, id='normal')
+        template = PageTemplate(id='main', frames=[frame], onPage=create_header_footer, pagesize=A4)
+        _page_templates.a4 = template
+    return template
+
+
+def build_report_pdf(elements: List, generated_at: str) -> SpooledTemporaryFile:
+    """Lay out the flowables on A4 with header/footer into a spooled buffer"""
+    buffer = SpooledTemporaryFile(max_size=PDF_SPOOL_MAX_SIZE)
+    doc = BaseDocTemplate(
+        buffer,
+        pagesize=A4,
+        rightMargin=50,
+        leftMargin=50,
+        topMargin=60,
+        bottomMargin=60,
+        pageTemplates=[get_a4_page_template()]
+    )
+    doc.generated_at = generated_at
+    doc.build(elements)
+    return buffer
+
+
 # ============================================================================
 # BEAM REPORT GENERATOR
 # ============================================================================
 
-@router.post("/beam")
-async def generate_beam_report(request: BeamReportRequest):
-    """Generate professional beam calculation report in PDF format"""
+def _render_beam_pdf(request: BeamReportRequest, generated_at: str):
+    """Build the beam report PDF synchronously (runs in a worker thread)"""
+    unit_labels = get_unit_labels(request.units)
+    length_u = unit_labels['length']
+    force_u = unit_labels['force']
+    moment_u = unit_labels['moment']
+    load_suffix = f" {force_u}/{length_u}"
+
+    # ====================================================================
+    # TITLE, PROJECT INFO AND INPUT DATA
+    # ====================================================================
+    # Geometry and supports
+    input_data = [
+        ['Longitud de la viga:', f"{request.length} {length_u}"],
+        ['Apoyo izquierdo:', _BEAM_SUPPORT_LABELS.get(request.support_left, request.support_left)],
+        ['Apoyo derecho:', _BEAM_SUPPORT_LABELS.get(request.support_right, request.support_right)],
+        ['Sistema de unidades:', request.units],
+    ]
 
-    try:
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=A4,
-            rightMargin=50,
-            leftMargin=50,
-            topMargin=60,
-            bottomMargin=60
+    # Section properties
+    section_data = [
+        ['Designación:', request.section_id],
+        ['Profundidad:', f"{request.section_depth} mm" if request.section_depth else "N/A"],
+        ['Ancho de ala:', f"{request.section_width} mm" if request.section_width else "N/A"],
+        ['Peso:', f"{request.section_weight} kg/m" if request.section_weight else "N/A"],
+        ['Momento de inercia Ix:', f"{request.section_ix} cm⁴" if request.section_ix else "N/A"],
+        ['Módulo plástico Zx:', f"{request.section_zx} cm³" if request.section_zx else "N/A"],
+    ]
+
+    elements = create_report_intro("MEMORIA DE CÁLCULO - VIGA DE ACERO", request, input_data, section_data)
+
+    # Loads
+    elements.append(Paragraph("2.3 Cargas Aplicadas", _HEADING3))
+
+    if request.load_combination_method:
+        load_text = _BEAM_COMBINATION_TEXT(
+            method=request.load_combination_method,
+            name=request.load_combination_name,
+            load=request.load_combination_factored_load,
+            suffix=load_suffix
         )
+        elements.append(Paragraph(load_text, _NORMAL))
+    else:
+        # Distributed loads
+        if request.distributed_loads:
+            length = request.length
+            append_listing(elements, "<b>Cargas distribuidas:</b><br/>", [
+                f"  {i}. w = {load.get('w_start', 0)}{load_suffix} "
+                f"desde x={load.get('start', 0)} hasta x={load.get('end', length)} {length_u}<br/>"
+                for i, load in enumerate(request.distributed_loads, 1)
+            ])
+
+        # Point loads
+        if request.point_loads:
+            append_listing(elements, "<b>Cargas puntuales:</b><br/>", [
+                f"  {i}. Fy = {load.get('Fy', 0)} {force_u} "
+                f"en x={load.get('position', 0)} {length_u}<br/>"
+                for i, load in enumerate(request.point_loads, 1)
+            ])
+
+    elements.append(Spacer(1, _SP_M))
+
+    # ====================================================================
+    # ANALYSIS RESULTS
+    # ====================================================================
+    elements.append(Paragraph("3. RESULTADOS DEL ANÁLISIS", _HEADING_STYLE))
+
+    results_data = [
+        ['Parámetro', 'Valor', 'Unidad'],
+        ['Momento flector máximo', f"{request.max_moment:.2f}", moment_u],
+        ['Cortante máximo', f"{request.max_shear:.2f}", force_u],
+        ['Deflexión máxima', f"{request.max_deflection*1000:.2f}", 'mm'],
+    ]
+    elements.extend((create_results_table(results_data, header_color='#3b82f6'), Spacer(1, _SP_S)))
+
+    # Reactions
+    elements.append(Paragraph("3.1 Reacciones en Apoyos", _HEADING3))
+    reactions_data = [
+        ['Apoyo', 'Rx', 'Ry', 'Mz'],
+        reaction_row('Izquierdo', request.reaction_left_rx, request.reaction_left_ry, request.reaction_left_mz),
+        reaction_row('Derecho', request.reaction_right_rx, request.reaction_right_ry, request.reaction_right_mz),
+    ]
+    reactions_table = Table(reactions_data, colWidths=_GRID4_COLWIDTHS, style=_REACTIONS_TABLE_STYLE)
+    elements.extend((reactions_table, Spacer(1, _SP_M)))
+
+    # ====================================================================
+    # VERIFICATION AISC 360
+    # ====================================================================
+    elements.append(Paragraph("4. VERIFICACIÓN SEGÚN AISC 360", _HEADING_STYLE))
+
+    verification_checks = [
+        {
+            'label': f'Flexión (Zona {request.flexure_zone})',
+            'demand': request.flexure_mu,
+            'capacity': request.flexure_phi_mn,
+            'ratio': request.flexure_ratio,
+            'ok': request.flexure_ok,
+            'unit': moment_u
+        },
+        {
+            'label': 'Cortante',
+            'demand': request.shear_vu,
+            'capacity': request.shear_phi_vn,
+            'ratio': request.shear_ratio,
+            'ok': request.shear_ok,
+            'unit': force_u
+        },
+    ]
 
-        styles = getSampleStyleSheet()
-        elements = []
-        unit_labels = get_unit_labels(request.units)
-
-        # ====================================================================
-        # TITLE
-        # ====================================================================
-        elements.extend(create_title_section("MEMORIA DE CÁLCULO - VIGA DE ACERO", styles))
-        elements.append(Spacer(1, 0.2*inch))
-
-        # ====================================================================
-        # PROJECT INFO
-        # ====================================================================
-        heading_style = ParagraphStyle(
-            'Heading2Custom',
-            parent=styles['Heading2'],
-            fontSize=12,
-            textColor=colors.HexColor('#1e3a8a'),
-            spaceAfter=12,
-            fontName='Helvetica-Bold'
+    elements.extend((create_verification_table(verification_checks, header_color='#10b981'), Spacer(1, _SP_S)))
+
+    # Deflection checks
+    elements.append(Paragraph("4.1 Verificación de Deflexiones", _HEADING3))
+    deflection_data = [
+        ['Límite', 'Máximo Permisible', 'Actual', 'Estado'],
+        deflection_row('L/180', request.deflection_l180_limit, request.deflection_l180_actual, request.deflection_l180_ok),
+        deflection_row('L/240', request.deflection_l240_limit, request.deflection_l240_actual, request.deflection_l240_ok),
+        deflection_row('L/360', request.deflection_l360_limit, request.deflection_l360_actual, request.deflection_l360_ok),
+    ]
+
+    deflection_table = Table(deflection_data, colWidths=_GRID4_COLWIDTHS, style=_DEFLECTION_BASE_STYLE)
+
+    # Color status
+    deflection_flags = (request.deflection_l180_ok, request.deflection_l240_ok, request.deflection_l360_ok)
+    style_list = [
+        cmd
+        for i, ok in enumerate(deflection_flags, start=1)
+        for cmd in (
+            ('BACKGROUND', (3, i), (3, i), _STATUS_COLORS[ok][0]),
+            ('TEXTCOLOR', (3, i), (3, i), _STATUS_COLORS[ok][1]),
         )
+    ]
 
-        elements.append(Paragraph("1. INFORMACIÓN DEL PROYECTO", heading_style))
+    deflection_table.setStyle(style_list)
+    elements.extend((deflection_table, Spacer(1, _SP_M)))
 
-        project_data = [
-            ['Proyecto:', request.project_name],
-            ['Fecha:', request.date or datetime.now().strftime('%d/%m/%Y')],
-            ['Ingeniero:', request.engineer or 'No especificado'],
-        ]
-        elements.append(create_info_table(project_data))
-        elements.append(Spacer(1, 0.3*inch))
-
-        # ====================================================================
-        # INPUT DATA
-        # ====================================================================
-        elements.append(Paragraph("2. DATOS DE ENTRADA", heading_style))
-
-        # Geometry and supports
-        support_labels = {
-            'fixed': 'Empotrado',
-            'pinned': 'Articulado',
-            'roller': 'Rodillo',
-            'free': 'Libre'
-        }
-
-        input_data = [
-            ['Longitud de la viga:', f"{request.length} {unit_labels['length']}"],
-            ['Apoyo izquierdo:', support_labels.get(request.support_left, request.support_left)],
-            ['Apoyo derecho:', support_labels.get(request.support_right, request.support_right)],
-            ['Sistema de unidades:', request.units],
-        ]
-        elements.append(create_info_table(input_data))
-        elements.append(Spacer(1, 0.2*inch))
-
-        # Section properties
-        elements.append(Paragraph("2.1 Perfil Estructural", styles['Heading3']))
-        section_data = [
-            ['Designación:', request.section_id],
-            ['Profundidad:', f"{request.section_depth} mm" if request.section_depth else "N/A"],
-            ['Ancho de ala:', f"{request.section_width} mm" if request.section_width else "N/A"],
-            ['Peso:', f"{request.section_weight} kg/m" if request.section_weight else "N/A"],
-            ['Momento de inercia Ix:', f"{request.section_ix} cm⁴" if request.section_ix else "N/A"],
-            ['Módulo plástico Zx:', f"{request.section_zx} cm³" if request.section_zx else "N/A"],
-        ]
-        elements.append(create_info_table(section_data))
-        elements.append(Spacer(1, 0.2*inch))
-
-        # Material properties
-        elements.append(Paragraph("2.2 Material", styles['Heading3']))
-        material_data = [
-            ['Especificación:', request.material_id],
-            ['Esfuerzo de fluencia Fy:', f"{request.material_fy} MPa"],
-            ['Módulo de elasticidad E:', f"{request.material_e} MPa"],
-        ]
-        elements.append(create_info_table(material_data))
-        elements.append(Spacer(1, 0.2*inch))
-
-        # Loads
-        elements.append(Paragraph("2.3 Cargas Aplicadas", styles['Heading3']))
-
-        if request.load_combination_method:
-            load_text = f"<b>Método de diseño:</b> {request.load_combination_method}<br/>"
-            load_text += f"<b>Combinación crítica:</b> {request.load_combination_name}<br/>"
-            load_text += f"<b>Carga factorizada:</b> {request.load_combination_factored_load:.2f} {unit_labels['force']}/{unit_labels['length']}"
-            elements.append(Paragraph(load_text, styles['Normal']))
-        else:
-            # Distributed loads
-            if request.distributed_loads:
-                dl_text = "<b>Cargas distribuidas:</b><br/>"
-                for i, load in enumerate(request.distributed_loads, 1):
-                    dl_text += f"  {i}. w = {load.get('w_start', 0)} {unit_labels['force']}/{unit_labels['length']} "
-                    dl_text += f"desde x={load.get('start', 0)} hasta x={load.get('end', request.length)} {unit_labels['length']}<br/>"
-                elements.append(Paragraph(dl_text, styles['Normal']))
-
-            # Point loads
-            if request.point_loads:
-                pl_text = "<b>Cargas puntuales:</b><br/>"
-                for i, load in enumerate(request.point_loads, 1):
-                    pl_text += f"  {i}. Fy = {load.get('Fy', 0)} {unit_labels['force']} "
-                    pl_text += f"en x={load.get('position', 0)} {unit_labels['length']}<br/>"
-                elements.append(Paragraph(pl_text, styles['Normal']))
-
-        elements.append(Spacer(1, 0.3*inch))
-
-        # ====================================================================
-        # ANALYSIS RESULTS
-        # ====================================================================
-        elements.append(Paragraph("3. RESULTADOS DEL ANÁLISIS", heading_style))
-
-        results_data = [
-            ['Parámetro', 'Valor', 'Unidad'],
-            ['Momento flector máximo', f"{request.max_moment:.2f}", unit_labels['moment']],
-            ['Cortante máximo', f"{request.max_shear:.2f}", unit_labels['force']],
-            ['Deflexión máxima', f"{request.max_deflection*1000:.2f}", 'mm'],
-        ]
-        elements.append(create_results_table(results_data, header_color='#3b82f6'))
-        elements.append(Spacer(1, 0.2*inch))
-
-        # Reactions
-        elements.append(Paragraph("3.1 Reacciones en Apoyos", styles['Heading3']))
-        reactions_data = [
-            ['Apoyo', 'Rx', 'Ry', 'Mz'],
-            [
-                'Izquierdo',
-                f"{abs(request.reaction_left_rx):.2f}",
-                f"{abs(request.reaction_left_ry):.2f}",
-                f"{abs(request.reaction_left_mz):.2f}" if request.reaction_left_mz != 0 else "-"
-            ],
-            [
-                'Derecho',
-                f"{abs(request.reaction_right_rx):.2f}",
-                f"{abs(request.reaction_right_ry):.2f}",
-                f"{abs(request.reaction_right_mz):.2f}" if request.reaction_right_mz != 0 else "-"
-            ],
-        ]
-        reactions_table = Table(reactions_data, colWidths=[1.5*inch, 1.5*inch, 1.5*inch, 1.5*inch])
-        reactions_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#64748b')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 1), (-1, -1), 'Courier'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#cbd5e1')),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ]))
-        elements.append(reactions_table)
-        elements.append(Spacer(1, 0.3*inch))
-
-        # ====================================================================
-        # VERIFICATION AISC 360
-        # ====================================================================
-        elements.append(Paragraph("4. VERIFICACIÓN SEGÚN AISC 360", heading_style))
-
-        verification_checks = [
-            {
-                'label': f'Flexión (Zona {request.flexure_zone})',
-                'demand': request.flexure_mu,
-                'capacity': request.flexure_phi_mn,
-                'ratio': request.flexure_ratio,
-                'ok': request.flexure_ok,
-                'unit': unit_labels['moment']
-            },
-            {
-                'label': 'Cortante',
-                'demand': request.shear_vu,
-                'capacity': request.shear_phi_vn,
-                'ratio': request.shear_ratio,
-                'ok': request.shear_ok,
-                'unit': unit_labels['force']
-            },
-        ]
+    # ====================================================================
+    # CONCLUSION
+    # ====================================================================
+    append_report_conclusion(elements, request)
 
-        elements.append(create_verification_table(verification_checks, header_color='#10b981'))
-        elements.append(Spacer(1, 0.2*inch))
-
-        # Deflection checks
-        elements.append(Paragraph("4.1 Verificación de Deflexiones", styles['Heading3']))
-        deflection_data = [
-            ['Límite', 'Máximo Permisible', 'Actual', 'Estado'],
-            [
-                'L/180',
-                f"{request.deflection_l180_limit:.2f} mm",
-                f"{request.deflection_l180_actual:.2f} mm",
-                'OK' if request.deflection_l180_ok else 'NO OK'
-            ],
-            [
-                'L/240',
-                f"{request.deflection_l240_limit:.2f} mm",
-                f"{request.deflection_l240_actual:.2f} mm",
-                'OK' if request.deflection_l240_ok else 'NO OK'
-            ],
-            [
-                'L/360',
-                f"{request.deflection_l360_limit:.2f} mm",
-                f"{request.deflection_l360_actual:.2f} mm",
-                'OK' if request.deflection_l360_ok else 'NO OK'
-            ],
-        ]
+    return build_report_pdf(elements, generated_at)
 
-        deflection_table = Table(deflection_data, colWidths=[1.5*inch, 1.5*inch, 1.5*inch, 1.5*inch])
-        style_list = [
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f59e0b')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 1), (-1, -1), 'Courier'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#cbd5e1')),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ]
 
-        # Color status
-        if request.deflection_l180_ok:
-            style_list.append(('BACKGROUND', (3, 1), (3, 1), colors.HexColor('#d1fae5')))
-            style_list.append(('TEXTCOLOR', (3, 1), (3, 1), colors.HexColor('#065f46')))
-        else:
-            style_list.append(('BACKGROUND', (3, 1), (3, 1), colors.HexColor('#fee2e2')))
-            style_list.append(('TEXTCOLOR', (3, 1), (3, 1), colors.HexColor('#991b1b')))
-
-        if request.deflection_l240_ok:
-            style_list.append(('BACKGROUND', (3, 2), (3, 2), colors.HexColor('#d1fae5')))
-            style_list.append(('TEXTCOLOR', (3, 2), (3, 2), colors.HexColor('#065f46')))
-        else:
-            style_list.append(('BACKGROUND', (3, 2), (3, 2), colors.HexColor('#fee2e2')))
-            style_list.append(('TEXTCOLOR', (3, 2), (3, 2), colors.HexColor('#991b1b')))
-
-        if request.deflection_l360_ok:
-            style_list.append(('BACKGROUND', (3, 3), (3, 3), colors.HexColor('#d1fae5')))
-            style_list.append(('TEXTCOLOR', (3, 3), (3, 3), colors.HexColor('#065f46')))
-        else:
-            style_list.append(('BACKGROUND', (3, 3), (3, 3), colors.HexColor('#fee2e2')))
-            style_list.append(('TEXTCOLOR', (3, 3), (3, 3), colors.HexColor('#991b1b')))
-
-        deflection_table.setStyle(TableStyle(style_list))
-        elements.append(deflection_table)
-        elements.append(Spacer(1, 0.3*inch))
-
-        # ====================================================================
-        # CONCLUSION
-        # ====================================================================
-        elements.append(Paragraph("5. CONCLUSIÓN", heading_style))
-        elements.extend(create_conclusion_box(request.overall_ok, styles))
-
-        # Additional notes
-        if request.notes:
-            elements.append(Spacer(1, 0.2*inch))
-            elements.append(Paragraph("6. NOTAS ADICIONALES", heading_style))
-            elements.append(Paragraph(request.notes, styles['Normal']))
-
-        # ====================================================================
-        # BUILD PDF
-        # ====================================================================
-        doc.build(elements, onFirstPage=create_header_footer, onLaterPages=create_header_footer)
-        buffer.seek(0)
+@router.post("/beam")
+async def generate_beam_report(request: BeamReportRequest):
+    """Generate professional beam calculation report in PDF format"""
 
+    try:
         # Generate filename
         filename = f"memoria_viga_{request.section_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
 
-        return StreamingResponse(
-            buffer,
-            media_type="application/pdf",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
+        return await cached_pdf_response("beam", _render_beam_pdf, request, filename)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generando reporte: {str(e)}")
@@ -658,232 +925,185 @@ async def generate_beam_report(request: BeamReportRequest):
 # COLUMN REPORT GENERATOR
 # ============================================================================
 
-@router.post("/column")
-async def generate_column_report(request: ColumnReportRequest):
-    """Generate professional column calculation report in PDF format"""
+def _column_report_elements(request: ColumnReportRequest) -> List:
+    """Flowables of one column report (title through conclusion)"""
+    unit_labels = get_unit_labels(request.units)
+    length_u = unit_labels['length']
+    force_u = unit_labels['force']
+    moment_u = unit_labels['moment']
+
+    # ====================================================================
+    # TITLE, PROJECT INFO AND INPUT DATA
+    # ====================================================================
+    # Geometry and boundary conditions
+    input_data = [
+        ['Altura de la columna:', f"{request.height} {length_u}"],
+        ['Condición en base:', _COLUMN_SUPPORT_LABELS.get(request.base, request.base)],
+        ['Condición en tope:', _COLUMN_SUPPORT_LABELS.get(request.top, request.top)],
+        ['Factor de longitud efectiva K:', f"{request.k_factor:.2f}"],
+        ['Sistema de unidades:', request.units],
+    ]
 
-    try:
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=A4,
-            rightMargin=50,
-            leftMargin=50,
-            topMargin=60,
-            bottomMargin=60
-        )
+    # Section properties
+    section_data = [
+        ['Designación:', request.section_id],
+        ['Profundidad:', f"{request.section_depth} mm" if request.section_depth else "N/A"],
+        ['Ancho:', f"{request.section_width} mm" if request.section_width else "N/A"],
+        ['Peso:', f"{request.section_weight} kg/m" if request.section_weight else "N/A"],
+        ['Radio de giro rx:', f"{request.section_rx} cm" if request.section_rx else "N/A"],
+        ['Radio de giro ry:', f"{request.section_ry} cm" if request.section_ry else "N/A"],
+    ]
 
-        styles = getSampleStyleSheet()
-        elements = []
-        unit_labels = get_unit_labels(request.units)
-
-        # ====================================================================
-        # TITLE
-        # ====================================================================
-        elements.extend(create_title_section("MEMORIA DE CÁLCULO - COLUMNA DE ACERO", styles))
-        elements.append(Spacer(1, 0.2*inch))
-
-        # ====================================================================
-        # PROJECT INFO
-        # ====================================================================
-        heading_style = ParagraphStyle(
-            'Heading2Custom',
-            parent=styles['Heading2'],
-            fontSize=12,
-            textColor=colors.HexColor('#1e3a8a'),
-            spaceAfter=12,
-            fontName='Helvetica-Bold'
+    elements = create_report_intro("MEMORIA DE CÁLCULO - COLUMNA DE ACERO", request, input_data, section_data)
+
+    # Loads
+    elements.append(Paragraph("2.3 Cargas Aplicadas", _HEADING3))
+
+    if request.load_combination_method:
+        load_text = _COLUMN_COMBINATION_TEXT(
+            method=request.load_combination_method,
+            name=request.load_combination_name,
+            load=request.load_combination_factored_load,
+            force=force_u
+        )
+    else:
+        load_text = (
+            f"<b>Carga axial P:</b> {request.axial_load} {force_u} (Compresión)<br/>"
+            f"{f'<b>Momento en tope:</b> {request.moment_top} {moment_u}<br/>' if request.moment_top else ''}"
+            f"{f'<b>Momento en base:</b> {request.moment_base} {moment_u}<br/>' if request.moment_base else ''}"
         )
 
-        elements.append(Paragraph("1. INFORMACIÓN DEL PROYECTO", heading_style))
+    elements.extend((Paragraph(load_text, _NORMAL), Spacer(1, _SP_M)))
 
-        project_data = [
-            ['Proyecto:', request.project_name],
-            ['Fecha:', request.date or datetime.now().strftime('%d/%m/%Y')],
-            ['Ingeniero:', request.engineer or 'No especificado'],
-        ]
-        elements.append(create_info_table(project_data))
-        elements.append(Spacer(1, 0.3*inch))
-
-        # ====================================================================
-        # INPUT DATA
-        # ====================================================================
-        elements.append(Paragraph("2. DATOS DE ENTRADA", heading_style))
-
-        # Geometry and boundary conditions
-        support_labels = {
-            'fixed': 'Empotrado',
-            'pinned': 'Articulado',
-            'free': 'Libre'
-        }
-
-        input_data = [
-            ['Altura de la columna:', f"{request.height} {unit_labels['length']}"],
-            ['Condición en base:', support_labels.get(request.base, request.base)],
-            ['Condición en tope:', support_labels.get(request.top, request.top)],
-            ['Factor de longitud efectiva K:', f"{request.k_factor:.2f}"],
-            ['Sistema de unidades:', request.units],
-        ]
-        elements.append(create_info_table(input_data))
-        elements.append(Spacer(1, 0.2*inch))
-
-        # Section properties
-        elements.append(Paragraph("2.1 Perfil Estructural", styles['Heading3']))
-        section_data = [
-            ['Designación:', request.section_id],
-            ['Profundidad:', f"{request.section_depth} mm" if request.section_depth else "N/A"],
-            ['Ancho:', f"{request.section_width} mm" if request.section_width else "N/A"],
-            ['Peso:', f"{request.section_weight} kg/m" if request.section_weight else "N/A"],
-            ['Radio de giro rx:', f"{request.section_rx} cm" if request.section_rx else "N/A"],
-            ['Radio de giro ry:', f"{request.section_ry} cm" if request.section_ry else "N/A"],
-        ]
-        elements.append(create_info_table(section_data))
-        elements.append(Spacer(1, 0.2*inch))
-
-        # Material properties
-        elements.append(Paragraph("2.2 Material", styles['Heading3']))
-        material_data = [
-            ['Especificación:', request.material_id],
-            ['Esfuerzo de fluencia Fy:', f"{request.material_fy} MPa"],
-            ['Módulo de elasticidad E:', f"{request.material_e} MPa"],
-        ]
-        elements.append(create_info_table(material_data))
-        elements.append(Spacer(1, 0.2*inch))
-
-        # Loads
-        elements.append(Paragraph("2.3 Cargas Aplicadas", styles['Heading3']))
-
-        if request.load_combination_method:
-            load_text = f"<b>Método de diseño:</b> {request.load_combination_method}<br/>"
-            load_text += f"<b>Combinación crítica:</b> {request.load_combination_name}<br/>"
-            load_text += f"<b>Carga axial factorizada:</b> {request.load_combination_factored_load:.1f} {unit_labels['force']}"
-        else:
-            load_text = f"<b>Carga axial P:</b> {request.axial_load} {unit_labels['force']} (Compresión)<br/>"
-            if request.moment_top and request.moment_top != 0:
-                load_text += f"<b>Momento en tope:</b> {request.moment_top} {unit_labels['moment']}<br/>"
-            if request.moment_base and request.moment_base != 0:
-                load_text += f"<b>Momento en base:</b> {request.moment_base} {unit_labels['moment']}<br/>"
-
-        elements.append(Paragraph(load_text, styles['Normal']))
-        elements.append(Spacer(1, 0.3*inch))
-
-        # ====================================================================
-        # ANALYSIS RESULTS
-        # ====================================================================
-        elements.append(Paragraph("3. RESULTADOS DEL ANÁLISIS", heading_style))
-
-        results_data = [
-            ['Parámetro', 'Valor', 'Unidad'],
-            ['Esbeltez KL/r', f"{request.kl_r:.1f}", '-'],
-            ['Carga crítica de Euler Pcr', f"{request.pcr:.1f}", unit_labels['force']],
-            ['Esfuerzo crítico Fcr', f"{request.compression_fcr:.1f}", 'MPa'],
-        ]
-        elements.append(create_results_table(results_data, header_color='#3b82f6'))
-        elements.append(Spacer(1, 0.3*inch))
+    # ====================================================================
+    # ANALYSIS RESULTS
+    # ====================================================================
+    elements.append(Paragraph("3. RESULTADOS DEL ANÁLISIS", _HEADING_STYLE))
 
-        # ====================================================================
-        # VERIFICATION AISC 360
-        # ====================================================================
-        elements.append(Paragraph("4. VERIFICACIÓN SEGÚN AISC 360", heading_style))
+    results_data = [
+        ['Parámetro', 'Valor', 'Unidad'],
+        ['Esbeltez KL/r', f"{request.kl_r:.1f}", '-'],
+        ['Carga crítica de Euler Pcr', f"{request.pcr:.1f}", force_u],
+        ['Esfuerzo crítico Fcr', f"{request.compression_fcr:.1f}", 'MPa'],
+    ]
+    elements.extend((create_results_table(results_data, header_color='#3b82f6'), Spacer(1, _SP_M)))
+
+    # ====================================================================
+    # VERIFICATION AISC 360
+    # ====================================================================
+    elements.append(Paragraph("4. VERIFICACIÓN SEGÚN AISC 360", _HEADING_STYLE))
+
+    elements.append(Paragraph("4.1 Compresión (Capítulo E)", _HEADING3))
+    compression_checks = [
+        {
+            'label': 'Compresión axial',
+            'demand': request.compression_pu,
+            'capacity': request.compression_phi_pn,
+            'ratio': request.compression_ratio,
+            'ok': request.compression_ok,
+            'unit': force_u
+        },
+    ]
+    elements.extend((create_verification_table(compression_checks, header_color='#10b981'), Spacer(1, _SP_S)))
 
-        elements.append(Paragraph("4.1 Compresión (Capítulo E)", styles['Heading3']))
-        compression_checks = [
+    # Flexure if applicable
+    if request.flexure_mu and request.flexure_mu > 0:
+        elements.append(Paragraph("4.2 Flexión (Capítulo F)", _HEADING3))
+        flexure_checks = [
             {
-                'label': 'Compresión axial',
-                'demand': request.compression_pu,
-                'capacity': request.compression_phi_pn,
-                'ratio': request.compression_ratio,
-                'ok': request.compression_ok,
-                'unit': unit_labels['force']
+                'label': 'Momento flector',
+                'demand': request.flexure_mu,
+                'capacity': request.flexure_phi_mn,
+                'ratio': request.flexure_ratio,
+                'ok': request.flexure_ratio <= 1.0,
+                'unit': moment_u
             },
         ]
-        elements.append(create_verification_table(compression_checks, header_color='#10b981'))
-        elements.append(Spacer(1, 0.2*inch))
-
-        # Flexure if applicable
-        if request.flexure_mu and request.flexure_mu > 0:
-            elements.append(Paragraph("4.2 Flexión (Capítulo F)", styles['Heading3']))
-            flexure_checks = [
-                {
-                    'label': 'Momento flector',
-                    'demand': request.flexure_mu,
-                    'capacity': request.flexure_phi_mn,
-                    'ratio': request.flexure_ratio,
-                    'ok': request.flexure_ratio <= 1.0,
-                    'unit': unit_labels['moment']
-                },
-            ]
-            elements.append(create_verification_table(flexure_checks, header_color='#10b981'))
-            elements.append(Spacer(1, 0.2*inch))
-
-        # Interaction
-        elements.append(Paragraph("4.3 Interacción Flexo-Compresión (Capítulo H)", styles['Heading3']))
-
-        interaction_text = f"<b>Ecuación aplicada:</b> AISC {request.interaction_equation}<br/><br/>"
-        interaction_text += f"<b>Pr/Pc:</b> {request.interaction_pr_pc:.3f}<br/>"
-        interaction_text += f"<b>Mr/Mc:</b> {request.interaction_mr_mc:.3f}<br/>"
-        interaction_text += f"<b>Valor de interacción:</b> {request.interaction_value:.3f} ≤ 1.0<br/>"
-        interaction_text += f"<b>Utilización:</b> {request.interaction_utilization:.1f}%<br/>"
-
-        elements.append(Paragraph(interaction_text, styles['Normal']))
-
-        interaction_data = [[
-            'Interacción',
-            f"{request.interaction_value:.3f}",
-            f"{request.interaction_utilization:.1f}%",
-            'OK' if request.interaction_ok else 'NO OK'
-        ]]
-
-        interaction_table = Table(interaction_data, colWidths=[2*inch, 2.2*inch, 1*inch, 0.8*inch])
-        style_list = [
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#10b981') if request.interaction_ok else colors.HexColor('#ef4444')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (1, 0), (-1, 0), 'Courier-Bold'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#cbd5e1')),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ]
+        elements.extend((create_verification_table(flexure_checks, header_color='#10b981'), Spacer(1, _SP_S)))
+
+    # Interaction
+    elements.append(Paragraph("4.3 Interacción Flexo-Compresión (Capítulo H)", _HEADING3))
+
+    interaction_text = (
+        f"<b>Ecuación aplicada:</b> AISC {request.interaction_equation}<br/><br/>"
+        f"<b>Pr/Pc:</b> {request.interaction_pr_pc:.3f}<br/>"
+        f"<b>Mr/Mc:</b> {request.interaction_mr_mc:.3f}<br/>"
+        f"<b>Valor de interacción:</b> {request.interaction_value:.3f} ≤ 1.0<br/>"
+        f"<b>Utilización:</b> {request.interaction_utilization:.1f}%<br/>"
+    )
+
+    elements.append(Paragraph(interaction_text, _NORMAL))
+
+    interaction_data = [[
+        'Interacción',
+        f"{request.interaction_value:.3f}",
+        f"{request.interaction_utilization:.1f}%",
+        'OK' if request.interaction_ok else 'NO OK'
+    ]]
+
+    interaction_style = _INTERACTION_OK_STYLE if request.interaction_ok else _INTERACTION_FAIL_STYLE
+    interaction_table = Table(interaction_data, colWidths=_CHECK_COLWIDTHS, style=interaction_style)
+    elements.extend((interaction_table, Spacer(1, _SP_M)))
+
+    # ====================================================================
+    # CONCLUSION
+    # ====================================================================
+    append_report_conclusion(elements, request)
+
+    return elements
+
+
+def _render_column_pdf(request: ColumnReportRequest, generated_at: str):
+    """Build the column report PDF synchronously (runs in a worker thread)"""
+    return build_report_pdf(_column_report_elements(request), generated_at)
 
-        interaction_table.setStyle(TableStyle(style_list))
-        elements.append(interaction_table)
-        elements.append(Spacer(1, 0.3*inch))
 
-        # ====================================================================
-        # CONCLUSION
-        # ====================================================================
-        elements.append(Paragraph("5. CONCLUSIÓN", heading_style))
-        elements.extend(create_conclusion_box(request.overall_ok, styles))
+def _render_column_batch_pdf(requests: List[ColumnReportRequest], generated_at: str):
+    """Build several column reports as one PDF, each starting on a new page"""
+    elements = _column_report_elements(requests[0])
+    for request in requests[1:]:
+        elements.append(PageBreak())
+        elements.extend(_column_report_elements(request))
+    return build_report_pdf(elements, generated_at)
 
-        # Additional notes
-        if request.notes:
-            elements.append(Spacer(1, 0.2*inch))
-            elements.append(Paragraph("6. NOTAS ADICIONALES", heading_style))
-            elements.append(Paragraph(request.notes, styles['Normal']))
 
-        # ====================================================================
-        # BUILD PDF
-        # ====================================================================
-        doc.build(elements, onFirstPage=create_header_footer, onLaterPages=create_header_footer)
-        buffer.seek(0)
+@router.post("/column")
+async def generate_column_report(request: ColumnReportRequest):
+    """Generate professional column calculation report in PDF format"""
 
+    try:
         # Generate filename
         filename = f"memoria_columna_{request.section_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
 
-        return StreamingResponse(
-            buffer,
-            media_type="application/pdf",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
+        return await cached_pdf_response("column", _render_column_pdf, request, filename)
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error generando reporte: {str(e)}")
+
+
+@router.post("/column/batch")
+async def generate_column_batch_report(requests: List[ColumnReportRequest]):
+    """Generate several column reports bundled in a single PDF"""
+
+    if not requests:
+        raise HTTPException(status_code=400, detail="Debe proporcionar al menos una columna")
+
+    if len(requests) > MAX_BATCH_REPORTS:
+        raise HTTPException(status_code=400, detail=f"Máximo {MAX_BATCH_REPORTS} columnas por reporte")
+
+    try:
+        filename = f"memoria_columnas_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+
+        generated_at = report_timestamp()
+        buffer = await anyio.to_thread.run_sync(_render_column_batch_pdf, requests, generated_at, limiter=_PDF_RENDER_LIMITER)
+        return pdf_response(buffer, filename)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generando reporte: {str(e)}")
 
 
 @router.get("/health")
-async def reports_health():
+async def reports_health() -> Dict[str, Any]:
     """Health check for reports module"""
     try:
         # Test reportlab import
@@ -2,20 +2,34 @@
 Routes para consultar secciones/perfiles de acero
 """
 
-from fastapi import APIRouter, HTTPException, Query
-from typing import List, Optional, Literal
+from fastapi import APIRouter, HTTPException, Query, Response
+from typing import Any, Dict, List, Optional, Literal
+from functools import lru_cache
+import orjson
 from engine.sections import get_all_sections, get_section_by_id, search_sections, SECTION_TYPES
 from engine.design import filter_sections_advanced, suggest_beam_sections, compare_sections
 
 router = APIRouter()
 
+# Catálogo estático de tipos, serializado una sola vez
+_SECTION_TYPES_JSON = orjson.dumps({
+    "types": SECTION_TYPES
+})
+
+
+@lru_cache(maxsize=1024)
+def _section_json(section_id: str) -> Optional[bytes]:
+    """Perfil serializado por ID (None si no existe); el catálogo es de solo lectura"""
+    section = get_section_by_id(section_id)
+    return orjson.dumps(section) if section else None
+
 
 @router.get("/")
 async def list_sections(
     section_type: Optional[Literal["W", "HSS_RECT", "HSS_ROUND", "C", "L", "WT"]] = None,
     catalog: Optional[Literal["AISC", "CHILEAN"]] = None,
     limit: int = Query(50, le=200)
-):
+) -> Dict[str, Any]:
     """
     Listar todos los perfiles disponibles
     
@@ -33,16 +47,14 @@ async def list_sections(
 @router.get("/types")
 async def list_section_types():
     """Listar tipos de secciones disponibles"""
-    return {
-        "types": SECTION_TYPES
-    }
+    return Response(_SECTION_TYPES_JSON, media_type="application/json")
 
 
 @router.get("/search")
 async def search_sections_endpoint(
     query: str = Query(..., min_length=1, description="Término de búsqueda (ej: 'W14', 'HSS6')"),
     catalog: Optional[Literal["AISC", "CHILEAN"]] = None
-):
+) -> Dict[str, Any]:
     """
     Buscar perfiles por nombre
     
@@ -71,10 +83,10 @@ async def get_section(section_id: str):
     - rx, ry: Radios de giro
     - d, bf, tf, tw: Dimensiones
     """
-    section = get_section_by_id(section_id)
-    if not section:
+    section_json = _section_json(section_id)
+    if section_json is None:
         raise HTTPException(status_code=404, detail=f"Perfil '{section_id}' no encontrado")
-    return section
+    return Response(section_json, media_type="application/json")
 
 
 @router.get("/advanced/search")
@@ -91,7 +103,7 @@ async def advanced_search(
     rx_min: Optional[float] = Query(None, description="Radio de giro X mínimo [mm]"),
     ry_min: Optional[float] = Query(None, description="Radio de giro Y mínimo [mm]"),
     limit: int = Query(50, le=200)
-):
+) -> Dict[str, Any]:
     """
     Búsqueda avanzada de perfiles con múltiples filtros
 
@@ -156,7 +168,7 @@ async def recommend_sections(
     target_util_max: float = Query(0.95, description="Utilización máxima objetivo"),
     Lb: Optional[float] = Query(None, description="Longitud no arriostrada [m]"),
     Cb: float = Query(1.0, description="Factor de momento")
-):
+) -> Dict[str, Any]:
     """
     Recomendar perfiles óptimos para condiciones de carga dadas
 
@@ -212,7 +224,7 @@ async def compare_multiple_sections(
     L: float = Query(6.0, description="Longitud [m]"),
     material_id: str = Query("A572_GR50", description="Material"),
     units: Literal["kN-m", "tonf-m", "kgf-cm"] = Query("kN-m", description="Sistema de unidades")
-):
+) -> Dict[str, Any]:
     """
     Comparar múltiples perfiles para las mismas condiciones de carga
 
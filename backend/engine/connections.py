@@ -3,33 +3,132 @@ Verificaciones de conexiones con pernos segun AISC 360
 Capitulo J - Diseno de Conexiones
 """
 
-from typing import Dict, Any, Literal
+from functools import lru_cache
+from typing import Dict, Any, Literal, NamedTuple
+
+import numpy as np
+
+
+class BoltProps(NamedTuple):
+    """Resistencias nominales del perno [MPa]"""
+    Fnt: float  # tension
+    Fnv: float  # corte
+
+
+class BoltDim(NamedTuple):
+    """Geometria nominal del perno"""
+    d: float  # mm
+    Ab: float  # mm2
+
 
 # Propiedades de pernos segun AISC J3.2
 BOLT_PROPERTIES = {
-    "A325": {"Fnt": 620, "Fnv": 372},  # MPa (tension, corte)
-    "A490": {"Fnt": 780, "Fnv": 457},
-    "4.6": {"Fnt": 240, "Fnv": 150},   # Grados metricos
-    "8.8": {"Fnt": 640, "Fnv": 372},
-    "10.9": {"Fnt": 830, "Fnv": 500},
+    "A325": BoltProps(Fnt=620, Fnv=372),  # MPa (tension, corte)
+    "A490": BoltProps(Fnt=780, Fnv=457),
+    "4.6": BoltProps(Fnt=240, Fnv=150),   # Grados metricos
+    "8.8": BoltProps(Fnt=640, Fnv=372),
+    "10.9": BoltProps(Fnt=830, Fnv=500),
 }
 
 # Diametros de pernos comunes con areas nominales
 BOLT_DIAMETERS = {
-    "M12": {"d": 12, "Ab": 113},   # mm, mm2
-    "M16": {"d": 16, "Ab": 201},
-    "M20": {"d": 20, "Ab": 314},
-    "M22": {"d": 22, "Ab": 380},
-    "M24": {"d": 24, "Ab": 452},
-    "M27": {"d": 27, "Ab": 573},
-    "M30": {"d": 30, "Ab": 707},
-    "3/4\"": {"d": 19.05, "Ab": 285},
-    "7/8\"": {"d": 22.23, "Ab": 388},
-    "1\"": {"d": 25.4, "Ab": 507},
-    "1-1/8\"": {"d": 28.58, "Ab": 641},
-    "1-1/4\"": {"d": 31.75, "Ab": 792},
+    "M12": BoltDim(d=12, Ab=113),   # mm, mm2
+    "M16": BoltDim(d=16, Ab=201),
+    "M20": BoltDim(d=20, Ab=314),
+    "M22": BoltDim(d=22, Ab=380),
+    "M24": BoltDim(d=24, Ab=452),
+    "M27": BoltDim(d=27, Ab=573),
+    "M30": BoltDim(d=30, Ab=707),
+    "3/4\"": BoltDim(d=19.05, Ab=285),
+    "7/8\"": BoltDim(d=22.23, Ab=388),
+    "1\"": BoltDim(d=25.4, Ab=507),
+    "1-1/8\"": BoltDim(d=28.58, Ab=641),
+    "1-1/4\"": BoltDim(d=31.75, Ab=792),
 }
 
+# ==================== TABLAS SoA ====================
+# Columnas indexadas por un id entero (una sola busqueda por texto por
+# llamada). Las tuplas conservan los tipos originales para los resultados
+# escalares; los arrays NumPy alimentan las verificaciones en lote.
+
+_GRADE_IDX = {grade: i for i, grade in enumerate(BOLT_PROPERTIES)}
+_DIA_IDX = {dia: i for i, dia in enumerate(BOLT_DIAMETERS)}
+
+_FNT_COL, _FNV_COL = zip(*BOLT_PROPERTIES.values())
+_D_COL, _AB_COL = zip(*BOLT_DIAMETERS.values())
+
+_FNT = np.array(_FNT_COL, dtype=np.float64)
+_FNV = np.array(_FNV_COL, dtype=np.float64)
+_D = np.array(_D_COL, dtype=np.float64)
+_AB = np.array(_AB_COL, dtype=np.float64)
+
+
+# ==================== NUCLEOS NUMERICOS ====================
+# Formulas escalares puras: reciben valores ya resueltos (sin busquedas por
+# texto), asi las funciones publicas solo validan y arman el resultado.
+# Las capacidades dependen solo de la geometria/material y se memorizan; la
+# demanda (Vu/Tu) solo entra en el ratio, calculado fuera de la cache.
+
+_PHI_BOLT = 0.75  # Factor de resistencia pernos y aplastamiento (AISC J3.6, J3.10)
+
+
+@lru_cache(maxsize=4096)
+def _bolt_capacity_kernel(Fn: float, Ab: float, n: int, planes: int):
+    """Capacidad de pernos (AISC J3-1 / J3-2) -> (Rn_per_bolt, Rn, phi_Rn)"""
+    Rn_per_bolt = Fn * Ab / 1000  # kN por perno
+    Rn_total = Rn_per_bolt * n * planes
+    phi_Rn = _PHI_BOLT * Rn_total
+    return Rn_per_bolt, Rn_total, phi_Rn
+
+
+def _bolt_strength_kernel(Fn: float, Ab: float, n: int, planes: int, Pu: float):
+    """Resistencia de pernos (AISC J3-1 / J3-2) -> (Rn_per_bolt, Rn, phi_Rn, ratio)"""
+    Rn_per_bolt, Rn_total, phi_Rn = _bolt_capacity_kernel(Fn, Ab, n, planes)
+    ratio = abs(Pu) / phi_Rn if phi_Rn > 0 else 9999.0
+    return Rn_per_bolt, Rn_total, phi_Rn, ratio
+
+
+def _bolt_interaction_kernel(Fnv: float, Fnt: float, Ab: float, n: int, planes: int,
+                             Vu: float, Tu: float):
+    """Interaccion corte-tension (AISC J3-3a) -> (frv, frt, phi_Fnv, phi_Fnt, valor)"""
+    frv_stress = abs(Vu) / (n * planes) * 1000 / Ab  # MPa
+    frt_stress = abs(Tu) / n * 1000 / Ab  # MPa
+    phi_Fnv = _PHI_BOLT * Fnv  # MPa
+    phi_Fnt = _PHI_BOLT * Fnt  # MPa
+    interaction = (frv_stress / phi_Fnv)**2 + (frt_stress / phi_Fnt)**2
+    return frv_stress, frt_stress, phi_Fnv, phi_Fnt, interaction
+
+
+@lru_cache(maxsize=4096)
+def _bearing_capacity_kernel(t: float, Fu: float, d_bolt: float, n: int,
+                             edge_dist: float, spacing: float, hole_factor: float):
+    """Capacidad al aplastamiento (AISC J3-6a/b) -> (d_hole, Lc, Rn_per_bolt, Rn, phi_Rn)"""
+    d_hole = d_bolt + 2  # mm (agujero estandar AISC J3.3)
+    Lc_edge = edge_dist - d_hole/2
+    Lc_spacing = spacing - d_hole
+    Lc = min(Lc_edge, Lc_spacing / 2) if n > 1 else Lc_edge
+
+    # min(1.2*Lc, 2.4*d) * t * Fu, con el factor comun aplicado una sola vez
+    Rn_bearing = min(1.2 * Lc, 2.4 * d_bolt) * (t * Fu * 0.001 * hole_factor)
+
+    Rn_total = Rn_bearing * n
+    phi_Rn = _PHI_BOLT * Rn_total
+    return d_hole, Lc, Rn_bearing, Rn_total, phi_Rn
+
+
+def _bearing_kernel(t: float, Fu: float, d_bolt: float, n: int, Vu: float,
+                    edge_dist: float, spacing: float, hole_factor: float):
+    """Aplastamiento (AISC J3-6a/b) -> (d_hole, Lc, Rn_per_bolt, Rn, phi_Rn, ratio)"""
+    d_hole, Lc, Rn_bearing, Rn_total, phi_Rn = _bearing_capacity_kernel(
+        t, Fu, d_bolt, n, edge_dist, spacing, hole_factor
+    )
+    ratio = abs(Vu) / phi_Rn if phi_Rn > 0 else 9999.0
+    return d_hole, Lc, Rn_bearing, Rn_total, phi_Rn, ratio
+
+
+# Reduccion de aplastamiento por tipo de agujero
+_HOLE_FACTORS = {"STD": 1.0, "OVS": 0.8, "SLOTTED": 0.7}
+
 
 def verify_bolt_shear(
     bolt_grade: str,
@@ -52,26 +151,22 @@ def verify_bolt_shear(
         Diccionario con resultados de verificacion
     """
 
-    if bolt_grade not in BOLT_PROPERTIES:
+    gi = _GRADE_IDX.get(bolt_grade)
+    if gi is None:
         raise ValueError(f"Grado de perno '{bolt_grade}' no valido. Use: {list(BOLT_PROPERTIES.keys())}")
 
-    if diameter not in BOLT_DIAMETERS:
+    di = _DIA_IDX.get(diameter)
+    if di is None:
         raise ValueError(f"Diametro '{diameter}' no valido. Use: {list(BOLT_DIAMETERS.keys())}")
 
     # Propiedades del perno
-    Fnv = BOLT_PROPERTIES[bolt_grade]["Fnv"]  # MPa
-    Ab = BOLT_DIAMETERS[diameter]["Ab"]  # mm2
-
-    # Resistencia nominal a corte (AISC J3-1)
-    Rn_per_bolt = Fnv * Ab / 1000  # kN por perno
-    Rn_total = Rn_per_bolt * num_bolts * shear_planes
-
-    # Factor de resistencia (AISC J3.6)
-    phi_v = 0.75
-    phi_Rn = phi_v * Rn_total
+    Fnv = _FNV_COL[gi]  # MPa
+    Ab = _AB_COL[di]  # mm2
 
-    # Verificacion
-    ratio = abs(Vu) / phi_Rn if phi_Rn > 0 else 9999.0
+    # Resistencia nominal a corte (AISC J3-1) y verificacion
+    Rn_per_bolt, Rn_total, phi_Rn, ratio = _bolt_strength_kernel(
+        Fnv, Ab, num_bolts, shear_planes, Vu
+    )
     ok = ratio <= 1.0
 
     return {
@@ -79,7 +174,7 @@ def verify_bolt_shear(
         "Vu": Vu,
         "phi_Rn": round(phi_Rn, 2),
         "Rn": round(Rn_total, 2),
-        "phi": phi_v,
+        "phi": _PHI_BOLT,
         "ratio": round(ratio, 3),
         "utilization": round(ratio * 100, 1),
         "ok": ok,
@@ -114,26 +209,22 @@ def verify_bolt_tension(
         Diccionario con resultados de verificacion
     """
 
-    if bolt_grade not in BOLT_PROPERTIES:
+    gi = _GRADE_IDX.get(bolt_grade)
+    if gi is None:
         raise ValueError(f"Grado de perno '{bolt_grade}' no valido. Use: {list(BOLT_PROPERTIES.keys())}")
 
-    if diameter not in BOLT_DIAMETERS:
+    di = _DIA_IDX.get(diameter)
+    if di is None:
         raise ValueError(f"Diametro '{diameter}' no valido. Use: {list(BOLT_DIAMETERS.keys())}")
 
     # Propiedades del perno
-    Fnt = BOLT_PROPERTIES[bolt_grade]["Fnt"]  # MPa
-    Ab = BOLT_DIAMETERS[diameter]["Ab"]  # mm2
-
-    # Resistencia nominal a tension (AISC J3-2)
-    Rn_per_bolt = Fnt * Ab / 1000  # kN por perno
-    Rn_total = Rn_per_bolt * num_bolts
-
-    # Factor de resistencia (AISC J3.6)
-    phi_t = 0.75
-    phi_Rn = phi_t * Rn_total
+    Fnt = _FNT_COL[gi]  # MPa
+    Ab = _AB_COL[di]  # mm2
 
-    # Verificacion
-    ratio = abs(Tu) / phi_Rn if phi_Rn > 0 else 9999.0
+    # Resistencia nominal a tension (AISC J3-2) y verificacion
+    Rn_per_bolt, Rn_total, phi_Rn, ratio = _bolt_strength_kernel(
+        Fnt, Ab, num_bolts, 1, Tu
+    )
     ok = ratio <= 1.0
 
     return {
@@ -141,7 +232,7 @@ def verify_bolt_tension(
         "Tu": Tu,
         "phi_Rn": round(phi_Rn, 2),
         "Rn": round(Rn_total, 2),
-        "phi": phi_t,
+        "phi": _PHI_BOLT,
         "ratio": round(ratio, 3),
         "utilization": round(ratio * 100, 1),
         "ok": ok,
@@ -171,36 +262,25 @@ def verify_bolt_combined(
     (frv/phiFnv)^2 + (frt/phiFnt)^2 <= 1.0
     """
 
-    if bolt_grade not in BOLT_PROPERTIES:
+    gi = _GRADE_IDX.get(bolt_grade)
+    if gi is None:
         raise ValueError(f"Grado de perno '{bolt_grade}' no valido")
 
-    if diameter not in BOLT_DIAMETERS:
+    di = _DIA_IDX.get(diameter)
+    if di is None:
         raise ValueError(f"Diametro '{diameter}' no valido")
 
     # Verificaciones individuales
     shear_check = verify_bolt_shear(bolt_grade, diameter, num_bolts, Vu, shear_planes)
     tension_check = verify_bolt_tension(bolt_grade, diameter, num_bolts, Tu)
 
-    # Esfuerzos por perno
-    Ab = BOLT_DIAMETERS[diameter]["Ab"]  # mm2
-    frv = abs(Vu) / (num_bolts * shear_planes)  # kN por plano
-    frt = abs(Tu) / num_bolts  # kN por perno
-
-    # Resistencias con factores
-    Fnv = BOLT_PROPERTIES[bolt_grade]["Fnv"]  # MPa
-    Fnt = BOLT_PROPERTIES[bolt_grade]["Fnt"]  # MPa
-    phi_v = 0.75
-    phi_t = 0.75
-
-    phi_Fnv = phi_v * Fnv  # MPa
-    phi_Fnt = phi_t * Fnt  # MPa
-
-    # Convertir fuerzas a esfuerzos
-    frv_stress = frv * 1000 / Ab  # MPa
-    frt_stress = frt * 1000 / Ab  # MPa
-
     # Ecuacion de interaccion AISC J3-3a
-    interaction = (frv_stress / phi_Fnv)**2 + (frt_stress / phi_Fnt)**2
+    Ab = _AB_COL[di]  # mm2
+    Fnv = _FNV_COL[gi]  # MPa
+    Fnt = _FNT_COL[gi]  # MPa
+    frv_stress, frt_stress, phi_Fnv, phi_Fnt, interaction = _bolt_interaction_kernel(
+        Fnv, Fnt, Ab, num_bolts, shear_planes, Vu, Tu
+    )
     ok = interaction <= 1.0
 
     return {
@@ -218,8 +298,9 @@ def verify_bolt_combined(
         "stresses": {
             "frv": round(frv_stress, 2),
             "frt": round(frt_stress, 2),
-            "phi_Fnv": round(phi_Fnv, 2),
-            "phi_Fnt": round(phi_Fnt, 2)
+            # 0.75*Fn con Fn entero en MPa: ya exacto a 2 decimales
+            "phi_Fnv": phi_Fnv,
+            "phi_Fnt": phi_Fnt
         },
         "overall_ok": ok,
         "details": {
@@ -231,6 +312,63 @@ def verify_bolt_combined(
     }
 
 
+def bolt_ids(bolt_grades, diameters):
+    """
+    Resolver grados y diametros (texto) a arrays de ids enteros para las
+    verificaciones en lote
+
+    Raises:
+        ValueError: si algun grado o diametro no existe
+    """
+    try:
+        grade_ids = np.fromiter((_GRADE_IDX[g] for g in bolt_grades), dtype=np.intp)
+    except KeyError as e:
+        raise ValueError(f"Grado de perno '{e.args[0]}' no valido")
+    try:
+        dia_ids = np.fromiter((_DIA_IDX[d] for d in diameters), dtype=np.intp)
+    except KeyError as e:
+        raise ValueError(f"Diametro '{e.args[0]}' no valido")
+    return grade_ids, dia_ids
+
+
+def verify_bolt_combined_batch(
+    grade_ids: np.ndarray,
+    dia_ids: np.ndarray,
+    num_bolts: np.ndarray,
+    Vu: np.ndarray,
+    Tu: np.ndarray,
+    shear_planes: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """
+    Interaccion corte-tension (AISC J3-3a) para N configuraciones a la vez
+
+    Todos los argumentos son arrays 1-D del mismo largo (o escalares que
+    NumPy propaga). Usar bolt_ids() para obtener grade_ids/dia_ids.
+
+    Returns:
+        Diccionario de arrays: frv, frt, phi_Fnv, phi_Fnt, interaction, ok
+    """
+    Ab = _AB[dia_ids]
+    Fnv = _FNV[grade_ids]
+    Fnt = _FNT[grade_ids]
+
+    n = np.asarray(num_bolts, dtype=np.float64)
+    frv_stress = np.abs(Vu) / (n * shear_planes) * 1000 / Ab  # MPa
+    frt_stress = np.abs(Tu) / n * 1000 / Ab  # MPa
+    phi_Fnv = _PHI_BOLT * Fnv  # MPa
+    phi_Fnt = _PHI_BOLT * Fnt  # MPa
+    interaction = (frv_stress / phi_Fnv)**2 + (frt_stress / phi_Fnt)**2
+
+    return {
+        "frv": frv_stress,
+        "frt": frt_stress,
+        "phi_Fnv": phi_Fnv,
+        "phi_Fnt": phi_Fnt,
+        "interaction": interaction,
+        "ok": interaction <= 1.0,
+    }
+
+
 def verify_bolt_bearing(
     t_plate: float,
     Fu_plate: float,
@@ -245,42 +383,17 @@ def verify_bolt_bearing(
     Verificar aplastamiento en placa segun AISC J3.10
     """
 
-    if diameter not in BOLT_DIAMETERS:
+    di = _DIA_IDX.get(diameter)
+    if di is None:
         raise ValueError(f"Diametro '{diameter}' no valido")
 
-    d_bolt = BOLT_DIAMETERS[diameter]["d"]  # mm
-
-    # Distancia clara (clear distance)
-    d_hole = d_bolt + 2  # mm (agujero estandar AISC J3.3)
-
-    # Distancia clara al borde
-    Lc_edge = edge_dist - d_hole/2
+    d_bolt = _D_COL[di]  # mm
 
-    # Distancia clara entre pernos
-    Lc_spacing = spacing - d_hole
-
-    # Usar el menor de los dos
-    Lc = min(Lc_edge, Lc_spacing / 2) if num_bolts > 1 else Lc_edge
-
-    # Resistencia nominal al aplastamiento (AISC J3-6a y J3-6b)
-    Rn_bearing = min(1.2 * Lc * t_plate * Fu_plate / 1000,
-                     2.4 * d_bolt * t_plate * Fu_plate / 1000)
-
-    # Para agujeros no estandar, aplicar reduccion
-    if hole_type == "OVS":
-        Rn_bearing *= 0.8
-    elif hole_type == "SLOTTED":
-        Rn_bearing *= 0.7
-
-    # Resistencia total (todos los pernos)
-    Rn_total = Rn_bearing * num_bolts
-
-    # Factor de resistencia (AISC J3.10)
-    phi_bearing = 0.75
-    phi_Rn = phi_bearing * Rn_total
-
-    # Verificacion
-    ratio = abs(Vu) / phi_Rn if phi_Rn > 0 else 9999.0
+    # Aplastamiento con reduccion para agujeros no estandar (AISC J3.10)
+    d_hole, Lc, Rn_bearing, Rn_total, phi_Rn, ratio = _bearing_kernel(
+        t_plate, Fu_plate, d_bolt, num_bolts, Vu, edge_dist, spacing,
+        _HOLE_FACTORS.get(hole_type, 1.0)
+    )
     ok = ratio <= 1.0
 
     return {
@@ -288,7 +401,7 @@ def verify_bolt_bearing(
         "Vu": Vu,
         "phi_Rn": round(phi_Rn, 2),
         "Rn": round(Rn_total, 2),
-        "phi": phi_bearing,
+        "phi": _PHI_BOLT,
         "ratio": round(ratio, 3),
         "utilization": round(ratio * 100, 1),
         "ok": ok,
@@ -356,7 +469,7 @@ def verify_block_shear(
 def get_available_bolt_grades() -> list:
     """Obtener lista de grados de pernos disponibles"""
     return [
-        {"id": grade, "name": grade, "Fnt": props["Fnt"], "Fnv": props["Fnv"]}
+        {"id": grade, "name": grade, **props._asdict()}
         for grade, props in BOLT_PROPERTIES.items()
     ]
 
@@ -364,6 +477,6 @@ def get_available_bolt_grades() -> list:
 def get_available_bolt_diameters() -> list:
     """Obtener lista de diametros de pernos disponibles"""
     return [
-        {"id": dia, "name": dia, "d": props["d"], "Ab": props["Ab"]}
+        {"id": dia, "name": dia, **props._asdict()}
         for dia, props in BOLT_DIAMETERS.items()
     ]
@@ -3,11 +3,55 @@ Modulo de diseño iterativo y sugerencia de perfiles
 Ayuda al ingeniero a seleccionar el perfil optimo para una condicion dada
 """
 
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, NamedTuple
 import math
-from .sections import get_all_sections, get_section_by_id, get_section_properties
+
+import numpy as np
+
+from .sections import get_all_sections, get_section_arrays, get_section_by_id, get_section_properties_mm
 from .materials import get_material_properties
-from .verification import verify_beam_aisc
+from .verification import verify_beams_aisc
+
+
+# ==================== TABLAS SoA PARA SCREENING ====================
+# El catalogo es estatico: las propiedades que usa el screening se extraen
+# una sola vez por filtro (tipo, catalogo) como arrays paralelos, y cada
+# llamada solo hace operaciones vectoriales sobre ellos.
+
+class _ScreeningArrays(NamedTuple):
+    sections: tuple      # dicts del catalogo, en el orden de get_all_sections
+    Zx: np.ndarray       # mm³
+    ry: np.ndarray       # mm
+    Aw: np.ndarray       # mm² (area de corte estimada)
+    weight: np.ndarray   # kg/m
+
+
+@lru_cache(maxsize=64)
+def _screening_arrays(section_type: Optional[str], catalog: Optional[str], limit: int) -> _ScreeningArrays:
+    """Propiedades de screening en arrays paralelos (omite secciones sin area)"""
+    sections, Zx, ry, Aw, weight = [], [], [], [], []
+    for section in get_all_sections(section_type=section_type, catalog=catalog, limit=limit):
+        # "A" es la unica propiedad sin valor por defecto en get_section_properties
+        if "A" not in section:
+            continue
+        sec_props = get_section_properties_mm(section["id"])
+        sections.append(section)
+        Zx.append(sec_props["Zx"])  # mm³
+        ry.append(sec_props["ry"])  # mm
+        if section.get("type") == "W":
+            Aw.append(sec_props["d"] * section.get("tw", 6))  # d*tw
+        else:
+            Aw.append(0.6 * sec_props["A"])  # mm²
+        weight.append(section.get("weight", 0))
+
+    return _ScreeningArrays(
+        tuple(sections),
+        np.array(Zx, dtype=np.float64),
+        np.array(ry, dtype=np.float64),
+        np.array(Aw, dtype=np.float64),
+        np.array(weight, dtype=np.float64),
+    )
 
 
 def suggest_beam_sections(
@@ -48,137 +92,99 @@ def suggest_beam_sections(
         Lista de perfiles sugeridos ordenados por eficiencia
     """
 
-    # Obtener todas las secciones disponibles del tipo especificado
-    all_sections = get_all_sections(
-        section_type=section_type,
-        catalog=catalog,
-        limit=200
-    )
+    # Propiedades de las secciones disponibles del tipo especificado
+    arrays = _screening_arrays(section_type, catalog, 200)
 
-    if not all_sections:
+    if not arrays.sections:
         return []
 
     # Obtener propiedades del material
     mat = get_material_properties(material_id)
     Fy = mat["Fy"]  # MPa
+    E = mat["E"]  # MPa
 
     # Si no se proporciona Vu, estimarlo como 0 para solo verificar flexion
     if Vu_required is None:
         Vu_required = 0.0
 
-    # Estimacion conservadora de deflexion (se calculara exactamente despues)
-    # Asumimos carga uniforme: delta_max ≈ 5*w*L^4/(384*E*I)
+    # Calcular capacidad a flexion (simplificada para screening inicial)
+    Mp = Fy * arrays.Zx / 1e6  # kN·m
 
-    candidates = []
+    # Factor de reduccion conservador
+    phi_b = 0.90
 
-    for section in all_sections:
-        section_id = section["id"]
-        weight = section.get("weight", 0)
+    # Considerar longitud no arriostrada si se proporciona
+    Lb_use = L if Lb is None else Lb
+    Lb_mm = Lb_use * 1000
 
-        try:
-            # Obtener propiedades de seccion
-            sec_props = get_section_properties(section_id)
-
-            # Calcular capacidad a flexion (simplificada para screening inicial)
-            Zx = sec_props["Zx"] * 1e9  # m³ -> mm³
-            Mp = Fy * Zx / 1e6  # kN·m
-
-            # Factor de reduccion conservador
-            phi_b = 0.90
-
-            # Considerar longitud no arriostrada si se proporciona
-            if Lb is None:
-                Lb_use = L
-            else:
-                Lb_use = Lb
-
-            ry = sec_props["ry"] * 1e3  # m -> mm
-            E = mat["E"]  # MPa
-            Lp = 1.76 * ry * math.sqrt(E / Fy)  # mm
-            Lb_mm = Lb_use * 1000
-
-            # Estimacion rapida de capacidad
-            if Lb_mm <= Lp:
-                # Zona plastica
-                phi_Mn = phi_b * Mp
-            else:
-                # Zona inelastica/elastica - usar factor conservador
-                reduction = max(0.6, 1.0 - 0.3 * (Lb_mm - Lp) / Lp)
-                phi_Mn = phi_b * Mp * reduction
-
-            # Verificar que cumpla con capacidad
-            if phi_Mn < Mu_required:
-                continue
+    Lp = 1.76 * arrays.ry * math.sqrt(E / Fy)  # mm
+    plastic = Lb_mm <= Lp
 
-            # Calcular ratio de utilizacion
-            utilization_ratio = Mu_required / phi_Mn if phi_Mn > 0 else 9999
-
-            # Verificar corte si se proporciono
-            if Vu_required > 0:
-                # Estimacion rapida de capacidad a corte
-                d = sec_props["d"] * 1e3  # m -> mm
-
-                if section.get("type") == "W":
-                    tw = section.get("tw", 6)  # mm
-                    Aw = d * tw  # mm²
-                else:
-                    A = sec_props["A"] * 1e6  # m² -> mm²
-                    Aw = 0.6 * A
-
-                phi_v = 0.90
-                Vn = 0.6 * Fy * Aw * 1.0 / 1e3  # kN
-                phi_Vn = phi_v * Vn
-
-                if phi_Vn < Vu_required:
-                    continue
-
-                shear_ratio = Vu_required / phi_Vn if phi_Vn > 0 else 9999
-            else:
-                shear_ratio = 0
-
-            # Calcular score de eficiencia
-            # Preferir utilizacion cercana al rango objetivo
-            target_mid = (target_utilization[0] + target_utilization[1]) / 2
-            utilization_score = 1.0 - abs(utilization_ratio - target_mid)
-
-            # Penalizar por peso (menos peso = mejor)
-            # Normalizar peso: asumir rango 10-150 kg/m
-            weight_score = 1.0 - min(weight / 150.0, 1.0)
-
-            # Score combinado (70% utilizacion, 30% peso)
-            efficiency_score = 0.7 * utilization_score + 0.3 * weight_score
-
-            candidates.append({
-                "section_id": section_id,
-                "section_type": section.get("type"),
-                "catalog": section.get("catalog"),
-                "weight": weight,
-                "phi_Mn": phi_Mn,
-                "Mp": Mp,
-                "utilization_flexure": utilization_ratio,
-                "utilization_shear": shear_ratio,
-                "efficiency_score": efficiency_score,
-                "meets_criteria": (
-                    target_utilization[0] <= utilization_ratio <= target_utilization[1]
-                ),
-                "properties": {
-                    "d": section.get("d", section.get("H", section.get("OD", 0))),
-                    "bf": section.get("bf", section.get("B", 0)),
-                    "A": section.get("A"),
-                    "Ix": section.get("Ix", section.get("I")),
-                    "Zx": section.get("Zx", section.get("Z")),
-                }
-            })
-
-        except Exception as e:
-            # Skip sections that cause errors
-            continue
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Zona plastica: phi*Mp; zona inelastica/elastica: factor conservador
+        reduction = np.maximum(0.6, 1.0 - 0.3 * (Lb_mm - Lp) / Lp)
+        phi_Mn = np.where(plastic, phi_b * Mp, phi_b * Mp * reduction)
+
+        # Cumple capacidad (Lp nulo fuera de la zona plastica no es evaluable)
+        keep = (phi_Mn >= Mu_required) & (plastic | (Lp > 0))
+
+        # Calcular ratio de utilizacion
+        utilization = np.where(phi_Mn > 0, Mu_required / phi_Mn, 9999)
 
-    # Ordenar por score de eficiencia (mayor primero)
-    candidates.sort(key=lambda x: x["efficiency_score"], reverse=True)
+        # Verificar corte si se proporciono (estimacion rapida de capacidad)
+        if Vu_required > 0:
+            phi_v = 0.90
+            Vn = 0.6 * Fy * arrays.Aw * 1.0 / 1e3  # kN
+            phi_Vn = phi_v * Vn
+            keep &= phi_Vn >= Vu_required
+            shear_ratio = np.where(phi_Vn > 0, Vu_required / phi_Vn, 9999)
+        else:
+            shear_ratio = None
 
-    # Retornar top N sugerencias
-    return candidates[:num_suggestions]
+    # Calcular score de eficiencia
+    # Preferir utilizacion cercana al rango objetivo
+    target_mid = (target_utilization[0] + target_utilization[1]) / 2
+    utilization_score = 1.0 - np.abs(utilization - target_mid)
+
+    # Penalizar por peso (menos peso = mejor)
+    # Normalizar peso: asumir rango 10-150 kg/m
+    weight_score = 1.0 - np.minimum(arrays.weight / 150.0, 1.0)
+
+    # Score combinado (70% utilizacion, 30% peso)
+    efficiency_score = 0.7 * utilization_score + 0.3 * weight_score
+
+    # Ordenar por score de eficiencia (mayor primero, estable ante empates)
+    idx = np.flatnonzero(keep)
+    top = idx[np.argsort(-efficiency_score[idx], kind="stable")[:num_suggestions]]
+
+    # Solo se arman los diccionarios de las top N sugerencias
+    candidates = []
+    for i in top.tolist():
+        section = arrays.sections[i]
+        utilization_ratio = float(utilization[i])
+        candidates.append({
+            "section_id": section["id"],
+            "section_type": section.get("type"),
+            "catalog": section.get("catalog"),
+            "weight": section.get("weight", 0),
+            "phi_Mn": float(phi_Mn[i]),
+            "Mp": float(Mp[i]),
+            "utilization_flexure": utilization_ratio,
+            "utilization_shear": float(shear_ratio[i]) if shear_ratio is not None else 0,
+            "efficiency_score": float(efficiency_score[i]),
+            "meets_criteria": (
+                target_utilization[0] <= utilization_ratio <= target_utilization[1]
+            ),
+            "properties": {
+                "d": section.get("d", section.get("H", section.get("OD", 0))),
+                "bf": section.get("bf", section.get("B", 0)),
+                "A": section.get("A"),
+                "Ix": section.get("Ix", section.get("I")),
+                "Zx": section.get("Zx", section.get("Z")),
+            }
+        })
+
+    return candidates
 
 
 def filter_sections_advanced(
@@ -216,51 +222,27 @@ def filter_sections_advanced(
         Lista de secciones que cumplen todos los filtros
     """
 
-    # Obtener todas las secciones
-    all_sections = get_all_sections(
-        section_type=section_type,
-        catalog=catalog,
-        limit=500  # Obtener mas para filtrar
+    # Propiedades de todas las secciones (obtener mas para filtrar)
+    arrays = get_section_arrays(section_type, catalog, 500)
+
+    # Aplicar solo los filtros activos como una mascara booleana
+    bounds = (
+        (arrays.d, d_min, d_max),
+        (arrays.weight, weight_min, weight_max),
+        (arrays.Ix, Ix_min, None),
+        (arrays.Iy, Iy_min, None),
+        (arrays.Zx, Zx_min, None),
+        (arrays.rx, rx_min, None),
+        (arrays.ry, ry_min, None),
     )
+    mask = np.ones(len(arrays.sections), dtype=bool)
+    for values, lower, upper in bounds:
+        if lower is not None:
+            mask &= values >= lower
+        if upper is not None:
+            mask &= values <= upper
 
-    filtered = []
-
-    for section in all_sections:
-        # Extraer propiedades (manejar diferentes tipos de perfiles)
-        d = section.get("d", section.get("H", section.get("OD", 0)))
-        weight = section.get("weight", 0)
-        Ix = section.get("Ix", section.get("I", 0))
-        Iy = section.get("Iy", section.get("I", 0))
-        Zx = section.get("Zx", section.get("Z", 0))
-        rx = section.get("rx", section.get("r", 0))
-        ry = section.get("ry", section.get("r", 0))
-
-        # Aplicar filtros
-        if d_min is not None and d < d_min:
-            continue
-        if d_max is not None and d > d_max:
-            continue
-        if weight_min is not None and weight < weight_min:
-            continue
-        if weight_max is not None and weight > weight_max:
-            continue
-        if Ix_min is not None and Ix < Ix_min:
-            continue
-        if Iy_min is not None and Iy < Iy_min:
-            continue
-        if Zx_min is not None and Zx < Zx_min:
-            continue
-        if rx_min is not None and rx < rx_min:
-            continue
-        if ry_min is not None and ry < ry_min:
-            continue
-
-        filtered.append(section)
-
-        if len(filtered) >= limit:
-            break
-
-    return filtered
+    return [arrays.sections[i] for i in np.flatnonzero(mask)[:limit].tolist()]
 
 
 def compare_sections(
@@ -286,44 +268,50 @@ def compare_sections(
         Lista de comparaciones con verificaciones para cada seccion
     """
 
-    comparisons = []
-
+    # Secciones validas (las inexistentes o sin propiedades se omiten)
+    sections = []
     for section_id in section_ids:
         try:
             section = get_section_by_id(section_id)
             if not section:
                 continue
-
-            # Para estimacion de deflexion, usamos una aproximacion
-            # En una implementacion real, se necesitaria correr el analisis completo
-            delta_estimate = 0.01  # Placeholder
-
-            # Verificar seccion
-            verification = verify_beam_aisc(
-                Mu=Mu,
-                Vu=Vu,
-                L=L,
-                delta_max=delta_estimate,
-                section_id=section_id,
-                material_id=material_id,
-                units=units
-            )
-
-            comparisons.append({
-                "section_id": section_id,
-                "section_type": section.get("type"),
-                "catalog": section.get("catalog"),
-                "weight": section.get("weight"),
-                "d": section.get("d", section.get("H", section.get("OD"))),
-                "verification": verification,
-                "utilization_flexure": verification["flexure"]["utilization"],
-                "utilization_shear": verification["shear"]["utilization"],
-                "overall_ok": verification["overall_ok"],
-                "governing": verification["governing"]
-            })
-
-        except Exception as e:
+            get_section_properties_mm(section_id)
+        except Exception:
             continue
+        sections.append((section_id, section))
+
+    # Para estimacion de deflexion, usamos una aproximacion
+    # En una implementacion real, se necesitaria correr el analisis completo
+    delta_estimate = 0.01  # Placeholder
+
+    # Verificar todas las secciones de una vez (misma demanda)
+    try:
+        verifications = verify_beams_aisc(
+            Mu=Mu,
+            Vu=Vu,
+            L=L,
+            delta_max=delta_estimate,
+            section_ids=[section_id for section_id, _ in sections],
+            material_id=material_id,
+            units=units
+        )
+    except Exception:
+        return []
+
+    comparisons = []
+    for (section_id, section), verification in zip(sections, verifications):
+        comparisons.append({
+            "section_id": section_id,
+            "section_type": section.get("type"),
+            "catalog": section.get("catalog"),
+            "weight": section.get("weight"),
+            "d": section.get("d", section.get("H", section.get("OD"))),
+            "verification": verification,
+            "utilization_flexure": verification["flexure"]["utilization"],
+            "utilization_shear": verification["shear"]["utilization"],
+            "overall_ok": verification["overall_ok"],
+            "governing": verification["governing"]
+        })
 
     # Ordenar por utilizacion de flexion (mas eficiente primero)
     comparisons.sort(
@@ -4,43 +4,84 @@ Verificación de elementos de pórticos según AISC 360
 
 from typing import Dict, List, Any
 import math
+import numpy as np
 from .verification import verify_beam_aisc, verify_column_aisc
 from .sections import get_section_properties, get_section_by_id
 from .materials import get_material_properties
 
 
-def calculate_element_length(elem: Any, nodes: List[Any]) -> float:
+# Base del pandeo inelastico AISC E3-2 (Fcr = 0.658^(Fy/Fe) * Fy)
+_LOG_0658 = math.log(0.658)
+
+# Fuerzas de extremo por elemento, en el orden de get_element_forces
+_FORCE_KEYS = ("N", "V_i", "M_i", "V_j", "M_j")
+
+
+def _round_list(values: np.ndarray, ndigits: int) -> List[float]:
+    """
+    Equivalente a [round(x, ndigits) for x in values], vectorizado
+
+    Fuera de los empates, rint(x*10^n)/10^n da el mismo float que round()
+    (ambos son el double más cercano a m/10^n). Cerca de un empate .5 el
+    escalado puede desviar el resultado, así que esos pocos valores se
+    redondean con round().
+    """
+    scale = 10.0 ** ndigits
+    scaled = values * scale
+    result = (np.rint(scaled) / scale).tolist()
+    with np.errstate(invalid="ignore"):
+        near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    for i in np.flatnonzero(near_tie).tolist():
+        result[i] = round(float(values[i]), ndigits)
+    return result
+
+
+def index_nodes(nodes: List[Any]) -> Dict[Any, Any]:
+    """Indice {id: nodo}; ante IDs repetidos se conserva el primero de la lista"""
+    return {n.id: n for n in reversed(nodes)}
+
+
+def calculate_element_length(elem: Any, nodes_by_id: Dict[Any, Any]) -> float:
     """
     Calcular longitud de un elemento basado en coordenadas de nodos
 
     Args:
         elem: Elemento con node_i y node_j
-        nodes: Lista de nodos con id, x, y
+        nodes_by_id: Indice {id: nodo} de index_nodes (nodos con id, x, y)
 
     Returns:
         Longitud del elemento en metros
     """
-    node_i = next((n for n in nodes if n.id == elem.node_i), None)
-    node_j = next((n for n in nodes if n.id == elem.node_j), None)
+    node_i = nodes_by_id.get(elem.node_i)
+    node_j = nodes_by_id.get(elem.node_j)
 
     if not node_i or not node_j:
         return 0.0
 
     dx = node_j.x - node_i.x
     dy = node_j.y - node_i.y
-    length = math.sqrt(dx**2 + dy**2)
+    length = math.hypot(dx, dy)
 
     return length
 
 
-def get_K_factor(elem: Any, elements: List[Any], nodes: List[Any]) -> float:
+# Factor K por par de apoyos (extremo i, extremo j)
+_K_BY_SUPPORTS = {
+    ("fixed", "fixed"): 0.65,    # Ambos empotrados
+    ("pinned", "pinned"): 1.0,   # Ambos articulados
+    ("fixed", "pinned"): 0.8,    # Empotrado-articulado
+    ("pinned", "fixed"): 0.8,
+}
+
+
+def get_K_factor(elem: Any, elements: List[Any], nodes_by_id: Dict[Any, Any]) -> float:
     """
     Determinar factor de longitud efectiva K para columnas
 
     Args:
         elem: Elemento a verificar
         elements: Lista de todos los elementos
-        nodes: Lista de nodos
+        nodes_by_id: Indice {id: nodo} de index_nodes
 
     Returns:
         Factor K (conservador)
@@ -52,8 +93,8 @@ def get_K_factor(elem: Any, elements: List[Any], nodes: List[Any]) -> float:
     # - Por defecto: K = 1.0 (conservador)
 
     # Verificar si los nodos tienen apoyos
-    node_i = next((n for n in nodes if n.id == elem.node_i), None)
-    node_j = next((n for n in nodes if n.id == elem.node_j), None)
+    node_i = nodes_by_id.get(elem.node_i)
+    node_j = nodes_by_id.get(elem.node_j)
 
     if not node_i or not node_j:
         return 1.0
@@ -62,16 +103,8 @@ def get_K_factor(elem: Any, elements: List[Any], nodes: List[Any]) -> float:
     support_i = getattr(node_i, 'support', None)
     support_j = getattr(node_j, 'support', None)
 
-    if support_i == "fixed" and support_j == "fixed":
-        return 0.65  # Ambos empotrados
-    elif support_i == "pinned" and support_j == "pinned":
-        return 1.0  # Ambos articulados
-    elif (support_i == "fixed" and support_j == "pinned") or \
-         (support_i == "pinned" and support_j == "fixed"):
-        return 0.8  # Empotrado-articulado
-    else:
-        # Para pórticos típicos sin arriostrar
-        return 1.0  # Conservador
+    # Para pórticos típicos sin arriostrar: 1.0 (conservador)
+    return _K_BY_SUPPORTS.get((support_i, support_j), 1.0)
 
 
 def verify_beam_flexure(section: Dict, material: Dict, M: float, units: str) -> Dict[str, Any]:
@@ -254,6 +287,89 @@ def verify_column_combined(
     }
 
 
+def verify_frame_elements_soa(
+    A_mm2: np.ndarray,
+    Zx_mm3: np.ndarray,
+    r_min: np.ndarray,
+    N: np.ndarray,
+    V: np.ndarray,
+    M: np.ndarray,
+    L: np.ndarray,
+    K: np.ndarray,
+    is_beam: np.ndarray,
+    material: Dict
+) -> Dict[str, np.ndarray]:
+    """
+    Núcleo vectorizado de verify_frame_elements (arreglos de entrada y salida)
+
+    Pensado para estudios paramétricos: las propiedades son arreglos de
+    largo n (uno por elemento) y las fuerzas pueden ser de forma (n,) o
+    (casos, n); los resultados que dependen de las fuerzas se propagan a
+    esa forma. No arma diccionarios ni redondea.
+
+    Args:
+        A_mm2, Zx_mm3: Área [mm²] y módulo plástico [mm³] por elemento
+        r_min: Radio de giro menor [mm]
+        N, V, M: Fuerzas máximas en valor absoluto [kN, kN, kN·m]
+        L, K: Longitud [m] y factor de longitud efectiva
+        is_beam: True para vigas (flexión + corte), False para columnas
+        material: Propiedades del material (Fy, E en MPa)
+
+    Returns:
+        Dict de arreglos: phi_Mn, phi_Vn, beam_ratio_M, beam_ratio_V,
+        lambda_c, phi_Pn, ratio_axial, col_ratio_M, use_h1a, interaction
+    """
+    Fy = material["Fy"]  # MPa
+    E = material["E"]  # MPa
+
+    # ---- Flexión (común a vigas y columnas) ----
+    phi_Mn = 0.90 * (Fy * Zx_mm3 / 1e6)  # kN·m
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # ---- Vigas: flexión + corte ----
+        beam_ratio_M = np.where(phi_Mn > 0, M / phi_Mn, 9999.0)
+        phi_Vn = 0.90 * (0.6 * Fy * (0.6 * A_mm2) * 1.0 / 1e3)  # kN
+        beam_ratio_V = np.where(phi_Vn > 0, V / phi_Vn, 9999.0)
+
+        # ---- Columnas: compresión + flexión (AISC E3 / H1) ----
+        lambda_c = (K * L * 1000) / r_min
+        col = ~is_beam
+        if np.any(lambda_c[col] == 0):
+            raise ValueError(
+                "Columna de longitud nula (nodos coincidentes o inexistentes): "
+                "la esbeltez KL/r no está definida"
+            )
+
+        lambda_limit = 4.71 * math.sqrt(E / Fy)
+        Fe = math.pi**2 * E / lambda_c**2  # MPa
+        # 0.658^(Fy/Fe) como exp((Fy/Fe)*ln 0.658): ~4x mas rapido que np.power
+        Fcr = np.where(lambda_c <= lambda_limit, np.exp((Fy / Fe) * _LOG_0658) * Fy, 0.877 * Fe)
+        phi_Pn = 0.90 * (Fcr * A_mm2 / 1e3)  # kN
+
+        ratio_axial = np.where(phi_Pn > 0, N / phi_Pn, 9999.0)
+        col_ratio_M = np.where(phi_Mn > 0, M / phi_Mn, 0.0)
+
+    use_h1a = ratio_axial >= 0.2
+    interaction = np.where(
+        use_h1a,
+        ratio_axial + (8/9) * col_ratio_M,   # H1-1a
+        ratio_axial / 2 + col_ratio_M        # H1-1b
+    )
+
+    return {
+        "phi_Mn": phi_Mn,
+        "phi_Vn": phi_Vn,
+        "beam_ratio_M": beam_ratio_M,
+        "beam_ratio_V": beam_ratio_V,
+        "lambda_c": lambda_c,
+        "phi_Pn": phi_Pn,
+        "ratio_axial": ratio_axial,
+        "col_ratio_M": col_ratio_M,
+        "use_h1a": use_h1a,
+        "interaction": interaction,
+    }
+
+
 def verify_frame_elements(
     elements: List[Any],
     element_forces: Dict[int, Dict[str, float]],
@@ -265,10 +381,16 @@ def verify_frame_elements(
     """
     Verificar cada elemento del pórtico según AISC 360
 
+    Los datos se reúnen en arreglos (uno por propiedad) y las capacidades y
+    ratios de todos los elementos se calculan de una vez con NumPy, con las
+    mismas fórmulas que verify_beam_flexure, verify_beam_shear y
+    verify_column_combined.
+
     Args:
         elements: Lista de elementos con tipo y section_id
         element_forces: Dict con fuerzas {elem_id: {N, V_i, M_i, V_j, M_j}}
-        sections: Dict de secciones (ya no se usa, se obtiene con get_section_*)
+        sections: Dict {section_id: propiedades} ya resueltas (opcional; las
+            faltantes se obtienen con get_section_properties una vez por ID)
         material: Propiedades del material
         nodes: Lista de nodos para calcular longitudes
         units: Sistema de unidades
@@ -276,39 +398,115 @@ def verify_frame_elements(
     Returns:
         Lista de verificaciones por elemento
     """
-    results = []
-
-    for elem in elements:
-        elem_id = elem.id
-        forces = element_forces.get(elem_id, {})
-
-        # Obtener propiedades de la sección
-        section = get_section_properties(elem.section_id)
-        section_info = get_section_by_id(elem.section_id)
-
-        # Fuerzas máximas
-        N = abs(forces.get("N", 0))
-        V = max(abs(forces.get("V_i", 0)), abs(forces.get("V_j", 0)))
-        M = max(abs(forces.get("M_i", 0)), abs(forces.get("M_j", 0)))
-
-        # Calcular longitud del elemento
-        L = calculate_element_length(elem, nodes)
+    n = len(elements)
+    if n == 0:
+        return []
+
+    # ---- Reunir datos por elemento (SoA) ----
+    # Propiedades por sección única (no por elemento), en orden de aparición
+    section_cache = dict(sections) if sections else {}
+    for section_id in dict.fromkeys(elem.section_id for elem in elements):
+        if section_id not in section_cache:
+            section_cache[section_id] = get_section_properties(section_id)
+
+    elem_sections = [section_cache[elem.section_id] for elem in elements]
+    A = np.array([section["A"] for section in elem_sections], dtype=np.float64)
+    Zx = np.array([section["Zx"] for section in elem_sections], dtype=np.float64)
+    rx = np.array([section["rx"] for section in elem_sections], dtype=np.float64)
+    ry = np.array([section["ry"] for section in elem_sections], dtype=np.float64)
+    r_min = np.minimum(rx * 1e3, ry * 1e3)
+
+    # Fuerzas máximas: una sola pasada por los diccionarios de fuerzas, en una
+    # matriz (n, 5) con columnas _FORCE_KEYS
+    no_forces = {}
+    F = np.abs(np.array([
+        [forces.get(key, 0) for key in _FORCE_KEYS]
+        for forces in (element_forces.get(elem.id, no_forces) for elem in elements)
+    ], dtype=np.float64))
+
+    N = F[:, 0]
+    V = np.maximum(F[:, 1], F[:, 3])
+    M = np.maximum(F[:, 2], F[:, 4])
+
+    # Longitudes desde las coordenadas de los nodos (0 si falta algún nodo)
+    nodes_by_id = index_nodes(nodes)
+    coords = np.zeros((n, 4))
+    for k, elem in enumerate(elements):
+        node_i = nodes_by_id.get(elem.node_i)
+        node_j = nodes_by_id.get(elem.node_j)
+        if node_i and node_j:
+            coords[k] = (node_i.x, node_i.y, node_j.x, node_j.y)
+    dx = coords[:, 2] - coords[:, 0]
+    dy = coords[:, 3] - coords[:, 1]
+    L = np.hypot(dx, dy)
+
+    is_beam = np.array([elem.element_type == "beam" for elem in elements], dtype=bool)
+    K = np.array([
+        1.0 if beam else get_K_factor(elem, elements, nodes_by_id)
+        for elem, beam in zip(elements, is_beam.tolist())
+    ], dtype=np.float64)
+
+    soa = verify_frame_elements_soa(
+        A_mm2=A * 1e6,      # m² -> mm²
+        Zx_mm3=Zx * 1e9,    # m³ -> mm³
+        r_min=r_min,
+        N=N, V=V, M=M, L=L, K=K,
+        is_beam=is_beam,
+        material=material
+    )
+    phi_Mn, phi_Vn, phi_Pn = soa["phi_Mn"], soa["phi_Vn"], soa["phi_Pn"]
+    beam_ratio_M, beam_ratio_V = soa["beam_ratio_M"], soa["beam_ratio_V"]
+    lambda_c, ratio_axial, col_ratio_M = soa["lambda_c"], soa["ratio_axial"], soa["col_ratio_M"]
+    use_h1a, interaction = soa["use_h1a"], soa["interaction"]
+
+    # ---- Armar resultados por elemento ----
+    # Los arreglos se convierten (y redondean) a listas de floats de Python
+    # una sola vez; los diccionarios de la API se arman solo en esta frontera.
+    N_l, V_l, M_l, L_l, K_l = N.tolist(), V.tolist(), M.tolist(), L.tolist(), K.tolist()
+    phi_Mn_l, phi_Vn_l, phi_Pn_l = phi_Mn.tolist(), phi_Vn.tolist(), phi_Pn.tolist()
+    use_h1a_l, is_beam_l = use_h1a.tolist(), is_beam.tolist()
+
+    N_r, V_r, M_r, L_r = (_round_list(x, 2) for x in (N, V, M, L))
+    KL_r_r = _round_list(lambda_c, 1)
+
+    beam_ok_M, beam_ok_V = (beam_ratio_M <= 1.0).tolist(), (beam_ratio_V <= 1.0).tolist()
+    beam_M_r, beam_V_r = _round_list(beam_ratio_M, 3), _round_list(beam_ratio_V, 3)
+    beam_M_u, beam_V_u = _round_list(beam_ratio_M * 100, 1), _round_list(beam_ratio_V * 100, 1)
+
+    col_ok = (interaction <= 1.0).tolist()
+    axial_r, col_M_r, interaction_r = (_round_list(x, 3) for x in (ratio_axial, col_ratio_M, interaction))
+    axial_u, col_M_u, interaction_u = (_round_list(x * 100, 1) for x in (ratio_axial, col_ratio_M, interaction))
 
-        if elem.element_type == "beam":
-            # Verificar como viga (flexión + corte)
-            flexure = verify_beam_flexure(section, material, M, units)
-            shear = verify_beam_shear(section, material, V, units)
+    results = []
+    for k, elem in enumerate(elements):
+        forces_out = {
+            "N": N_r[k],
+            "V": V_r[k],
+            "M": M_r[k]
+        }
+
+        if is_beam_l[k]:
+            flexure = {
+                "Mu": M_l[k],
+                "phi_Mn": phi_Mn_l[k],
+                "ratio": beam_M_r[k],
+                "utilization": beam_M_u[k],
+                "ok": beam_ok_M[k]
+            }
+            shear = {
+                "Vu": V_l[k],
+                "phi_Vn": phi_Vn_l[k],
+                "ratio": beam_V_r[k],
+                "utilization": beam_V_u[k],
+                "ok": beam_ok_V[k]
+            }
 
             verification = {
-                "element_id": elem_id,
+                "element_id": elem.id,
                 "type": "beam",
                 "section_id": elem.section_id,
-                "length": round(L, 2),
-                "forces": {
-                    "N": round(N, 2),
-                    "V": round(V, 2),
-                    "M": round(M, 2)
-                },
+                "length": L_r[k],
+                "forces": forces_out,
                 "flexure": flexure,
                 "shear": shear,
                 "overall_ok": flexure["ok"] and shear["ok"],
@@ -316,22 +514,40 @@ def verify_frame_elements(
             }
 
         else:  # column o brace
-            # Verificar como columna (compresión + flexión)
-            K = get_K_factor(elem, elements, nodes)
-
-            verification = verify_column_combined(
-                section, material, N, M, L, K, units
-            )
-            verification["element_id"] = elem_id
-            verification["type"] = elem.element_type
-            verification["section_id"] = elem.section_id
-            verification["length"] = round(L, 2)
-            verification["forces"] = {
-                "N": round(N, 2),
-                "V": round(V, 2),
-                "M": round(M, 2)
+            verification = {
+                "compression": {
+                    "Pu": N_l[k],
+                    "phi_Pn": phi_Pn_l[k],
+                    "ratio": axial_r[k],
+                    "utilization": axial_u[k]
+                },
+                "flexure": {
+                    "Mu": M_l[k],
+                    "phi_Mn": phi_Mn_l[k],
+                    "ratio": col_M_r[k],
+                    "utilization": col_M_u[k]
+                },
+                "interaction": {
+                    "equation": "H1-1a" if use_h1a_l[k] else "H1-1b",
+                    "value": interaction_r[k],
+                    "utilization": interaction_u[k],
+                    "ok": col_ok[k]
+                },
+                "slenderness": {
+                    "KL_r": KL_r_r[k],
+                    "K": K_l[k],
+                    "L": L_l[k]
+                },
+                "overall_ok": col_ok[k],
+                "max_ratio": interaction_r[k],
+                "element_id": elem.id,
+                "type": elem.element_type,
+                "section_id": elem.section_id,
+                "length": L_r[k],
+                "forces": forces_out
             }
 
         results.append(verification)
 
     return results
+
@@ -4,11 +4,12 @@ Implementa métodos LRFD y ASD para diseño estructural
 """
 
 from typing import Any, Dict, List, Literal, Optional, Tuple
+import numpy as np
 
 
 # ==================== COMBINACIONES LRFD (ASCE 7-16) ====================
 
-LRFD_COMBINATIONS = [
+LRFD_COMBINATIONS = (
     {
         "name": "1.4D",
         "description": "Carga muerta únicamente",
@@ -44,12 +45,12 @@ LRFD_COMBINATIONS = [
         "description": "Carga muerta mínima + sismo (levantamiento)",
         "factors": {"D": 0.9, "E": 1.0}
     }
-]
+)
 
 
 # ==================== COMBINACIONES ASD (ASCE 7-16) ====================
 
-ASD_COMBINATIONS = [
+ASD_COMBINATIONS = (
     {
         "name": "D",
         "description": "Carga muerta únicamente",
@@ -95,7 +96,7 @@ ASD_COMBINATIONS = [
         "description": "Carga muerta mínima + sismo (levantamiento)",
         "factors": {"D": 0.6, "E": 0.7}
     }
-]
+)
 
 
 # ==================== TIPOS DE CARGA ====================
@@ -113,10 +114,47 @@ LOAD_TYPE_LABELS = {
     "T": "Temperatura (Temperature)"
 }
 
+_VALID_LOAD_TYPES = frozenset(LOAD_TYPE_LABELS)
+_VALID_LOAD_TYPES_STR = ", ".join(LOAD_TYPE_LABELS)
+
+
+# ==================== MATRICES DE FACTORES ====================
+
+# Tipos de carga que aparecen en las combinaciones (columnas de la matriz)
+COMBINATION_LOAD_TYPES = ("D", "L", "Lr", "S", "W", "E")
+
+_COMBINATIONS_BY_METHOD = {"LRFD": LRFD_COMBINATIONS, "ASD": ASD_COMBINATIONS}
+
+# Matriz (n_combinaciones x n_tipos) por método, construida una sola vez
+_FACTOR_MATRICES = {
+    method: np.array([
+        [combo["factors"].get(load_type, 0.0) for load_type in COMBINATION_LOAD_TYPES]
+        for combo in combinations
+    ])
+    for method, combinations in _COMBINATIONS_BY_METHOD.items()
+}
+
+
+def _load_vector(loads: Dict[str, float]) -> List[float]:
+    """Cargas en el orden de columnas de la matriz de factores"""
+    return [loads.get(load_type, 0.0) for load_type in COMBINATION_LOAD_TYPES]
+
+
+def _combination_values(loads: Dict[str, float], method: str) -> np.ndarray:
+    """
+    Valor factorizado de cada combinación
+
+    Se suma en el orden de factores de cada combinación, igual que
+    apply_combination: un producto con la matriz de factores suma en otro
+    orden y puede cambiar el último bit (53.49999999999999 en vez de 53.5)
+    o el orden de combinaciones empatadas.
+    """
+    return np.array([apply_combination(loads, combo) for combo in get_combinations(method)])
+
 
 # ==================== FUNCIONES PRINCIPALES ====================
 
-def get_combinations(method: Literal["LRFD", "ASD"]) -> List[Dict]:
+def get_combinations(method: Literal["LRFD", "ASD"]) -> Tuple[Dict, ...]:
     """
     Obtener las combinaciones de carga según el método de diseño
 
@@ -124,14 +162,13 @@ def get_combinations(method: Literal["LRFD", "ASD"]) -> List[Dict]:
         method: Método de diseño ("LRFD" o "ASD")
 
     Returns:
-        Lista de combinaciones con nombre, descripción y factores
+        Tupla de combinaciones con nombre, descripción y factores
+        (datos de referencia compartidos: tratar como solo lectura)
     """
-    if method == "LRFD":
-        return LRFD_COMBINATIONS
-    elif method == "ASD":
-        return ASD_COMBINATIONS
-    else:
+    combinations = _COMBINATIONS_BY_METHOD.get(method)
+    if combinations is None:
         raise ValueError(f"Método '{method}' no reconocido. Use 'LRFD' o 'ASD'")
+    return combinations
 
 
 def apply_combination(
@@ -186,27 +223,16 @@ def get_critical_combination(
         >>> print(f"{combo['name']}: {value:.2f} kN/m")
         1.2D + 1.6L + 0.5(Lr o S): 35.50 kN/m
     """
-    combinations = get_combinations(method)
-
-    critical_combo = None
-    critical_value = float('-inf') if maximize else float('inf')
-
-    for combo in combinations:
-        value = apply_combination(loads, combo)
-
-        if maximize and value > critical_value:
-            critical_value = value
-            critical_combo = combo
-        elif not maximize and value < critical_value:
-            critical_value = value
-            critical_combo = combo
+    values = _combination_values(loads, method)
+    idx = int(np.argmax(values)) if maximize else int(np.argmin(values))
 
-    return critical_combo, critical_value
+    return get_combinations(method)[idx], float(values[idx])
 
 
 def calculate_all_combinations(
     loads: Dict[str, float],
-    method: Literal["LRFD", "ASD"] = "LRFD"
+    method: Literal["LRFD", "ASD"] = "LRFD",
+    top_k: Optional[int] = None
 ) -> List[Dict[str, Any]]:
     """
     Calcular todas las combinaciones de carga para un conjunto de cargas
@@ -214,6 +240,7 @@ def calculate_all_combinations(
     Args:
         loads: Diccionario con cargas sin factorizar
         method: Método de diseño
+        top_k: Si se indica, solo se arman las top_k combinaciones mayores
 
     Returns:
         Lista de resultados con cada combinación y su valor
@@ -224,25 +251,129 @@ def calculate_all_combinations(
         >>> for r in results:
         >>>     print(f"{r['name']}: {r['value']:.2f}")
     """
+    return evaluate_combinations(loads, method, top_k)[0]
+
+
+def evaluate_combinations(
+    loads: Dict[str, float],
+    method: Literal["LRFD", "ASD"] = "LRFD",
+    top_k: Optional[int] = None
+) -> Tuple[List[Dict[str, Any]], Dict, float]:
+    """
+    Evaluar todas las combinaciones y la crítica (máxima) en una sola pasada
+
+    Args:
+        loads: Diccionario con cargas sin factorizar
+        method: Método de diseño
+        top_k: Si se indica, solo se arman los resultados de las top_k
+               combinaciones mayores (la crítica se obtiene igual)
+
+    Returns:
+        Tupla (resultados ordenados por valor descendente,
+               combinación_crítica, carga_factorizada_crítica)
+    """
     combinations = get_combinations(method)
-    results = []
-
-    for combo in combinations:
-        value = apply_combination(loads, combo)
-        results.append({
-            "name": combo["name"],
-            "description": combo["description"],
-            "value": value,
+    values = _combination_values(loads, method)
+
+    # Orden por valor descendente; el argsort estable deja primero la crítica
+    order = np.argsort(-values, kind="stable").tolist()
+    values = values.tolist()
+
+    results = [
+        {
+            "name": combinations[i]["name"],
+            "description": combinations[i]["description"],
+            "value": values[i],
             "factors_used": {
-                k: v for k, v in combo["factors"].items()
+                k: v for k, v in combinations[i]["factors"].items()
                 if k in loads and loads[k] != 0
             }
-        })
+        }
+        for i in order[:top_k]
+    ]
+
+    critical_idx = order[0]
 
-    # Ordenar por valor (descendente)
-    results.sort(key=lambda x: x["value"], reverse=True)
+    return results, combinations[critical_idx], values[critical_idx]
 
-    return results
+
+# ==================== EVALUACIÓN POR LOTES ====================
+
+def build_load_matrix(loads_list: List[Dict[str, float]]) -> np.ndarray:
+    """
+    Apilar varios escenarios de carga en una matriz (K x n_tipos)
+
+    Las columnas siguen el orden de COMBINATION_LOAD_TYPES; los tipos que
+    no participan en ninguna combinación se ignoran.
+
+    Args:
+        loads_list: Lista de diccionarios de cargas sin factorizar
+
+    Returns:
+        Matriz de cargas de forma (K, len(COMBINATION_LOAD_TYPES))
+    """
+    return np.array([_load_vector(loads) for loads in loads_list],
+                    dtype=np.float64).reshape(len(loads_list), len(COMBINATION_LOAD_TYPES))
+
+
+def apply_combinations_batch(
+    loads_array: np.ndarray,
+    method: Literal["LRFD", "ASD"] = "LRFD",
+    dtype: Any = np.float64
+) -> np.ndarray:
+    """
+    Evaluar todas las combinaciones para K escenarios con un solo producto matricial
+
+    Args:
+        loads_array: Matriz (K, n_tipos) de cargas (ver build_load_matrix)
+        method: Método de diseño
+        dtype: Precisión del cálculo. np.float32 reduce a la mitad el
+               tráfico de memoria en barridos grandes (K de miles); el
+               error relativo (~1e-7) queda muy por debajo de las cifras
+               de los factores, pero no coincide bit a bit con los
+               resultados escalares
+
+    Returns:
+        Matriz (K, n_combinaciones) de cargas factorizadas, en el orden
+        de get_combinations(method)
+
+    Example:
+        >>> loads = build_load_matrix([{"D": 10, "L": 5}, {"D": 12, "W": 4}])
+        >>> apply_combinations_batch(loads, "LRFD").shape
+        (2, 7)
+    """
+    get_combinations(method)  # Valida el método
+    loads_array = np.asarray(loads_array, dtype=dtype)
+    if loads_array.ndim != 2 or loads_array.shape[1] != len(COMBINATION_LOAD_TYPES):
+        raise ValueError(
+            f"loads_array debe tener forma (K, {len(COMBINATION_LOAD_TYPES)}), "
+            f"columnas {', '.join(COMBINATION_LOAD_TYPES)}"
+        )
+    return loads_array @ _FACTOR_MATRICES[method].T.astype(dtype, copy=False)
+
+
+def critical_batch(
+    loads_array: np.ndarray,
+    method: Literal["LRFD", "ASD"] = "LRFD",
+    maximize: bool = True,
+    dtype: Any = np.float64
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Combinación crítica de cada escenario de un lote
+
+    Args:
+        loads_array: Matriz (K, n_tipos) de cargas (ver build_load_matrix)
+        method: Método de diseño
+        maximize: Si True, busca la combinación máxima; si False, la mínima
+        dtype: Precisión del cálculo (ver apply_combinations_batch)
+
+    Returns:
+        Tupla (índices en get_combinations(method), cargas factorizadas),
+        ambos de largo K
+    """
+    values = apply_combinations_batch(loads_array, method, dtype)
+    idx = np.argmax(values, axis=1) if maximize else np.argmin(values, axis=1)
+    return idx, values[np.arange(values.shape[0]), idx]
 
 
 def get_factored_loads(
@@ -288,18 +419,16 @@ def validate_loads(loads: Dict[str, float]) -> bool:
     Raises:
         ValueError: Si hay cargas inválidas
     """
-    valid_types = set(LOAD_TYPE_LABELS.keys())
-
-    for load_type in loads:
-        if load_type not in valid_types:
+    for load_type, value in loads.items():
+        if load_type not in _VALID_LOAD_TYPES:
             raise ValueError(
                 f"Tipo de carga '{load_type}' no reconocido. "
-                f"Tipos válidos: {', '.join(valid_types)}"
+                f"Tipos válidos: {_VALID_LOAD_TYPES_STR}"
             )
 
-        if loads[load_type] < 0:
+        if value < 0:
             raise ValueError(
-                f"Carga '{load_type}' no puede ser negativa: {loads[load_type]}"
+                f"Carga '{load_type}' no puede ser negativa: {value}"
             )
 
     return True
@@ -334,7 +463,7 @@ def print_combination_summary(
         desc = get_load_type_description(load_type)
         print(f"  {load_type} ({desc}): {value:.2f}")
 
-    results = calculate_all_combinations(loads, method)
+    results = calculate_all_combinations(loads, method, top_k=max_results)
 
     print(f"\nTop {max_results} combinaciones críticas:")
     for i, result in enumerate(results[:max_results], 1):
@@ -352,8 +481,8 @@ def print_combination_summary(
 
 # ==================== EJEMPLO DE USO ====================
 
-if __name__ == "__main__":
-    # Ejemplo: Viga con cargas distribuidas
+def _demo():
+    """Ejemplo: viga con cargas distribuidas (python -m engine.load_combinations)"""
     example_loads = {
         "D": 15.0,  # kN/m - Carga muerta (peso propio + acabados)
         "L": 10.0,  # kN/m - Carga viva (ocupación)
@@ -374,3 +503,7 @@ if __name__ == "__main__":
     print(f"  {critical_asd['name']}: {value_asd:.2f} kN/m")
 
     print(f"\nRatio LRFD/ASD: {value/value_asd:.2f}")
+
+
+if __name__ == "__main__":
+    _demo()
@@ -3,7 +3,11 @@ Materiales de Acero Estructural
 Base de datos de propiedades de aceros según ASTM
 """
 
-from typing import Dict, Any, Optional, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, Mapping, NamedTuple, Optional, List, Tuple
+
+import numpy as np
 
 # ==================== BASE DE DATOS DE ACEROS ====================
 
@@ -107,7 +111,13 @@ def get_material_by_id(material_id: str) -> Optional[Dict[str, Any]]:
     return STEEL_GRADES.get(material_id.upper())
 
 
-def get_material_properties(material_id: str, units: str = "kN-m") -> Dict[str, float]:
+# Unidades aceptadas; las propiedades se entregan siempre en MPa y la
+# conversión se hace solo en las salidas
+SUPPORTED_UNITS = frozenset({"kN-m", "tonf-m", "kgf-cm"})
+
+
+@lru_cache(maxsize=64)
+def get_material_properties(material_id: str, units: str = "kN-m") -> Mapping[str, float]:
     """
     Obtener propiedades del material convertidas a las unidades solicitadas
     
@@ -116,50 +126,74 @@ def get_material_properties(material_id: str, units: str = "kN-m") -> Dict[str,
         units: Sistema de unidades ("kN-m", "tonf-m", "kgf-cm")
     
     Returns:
-        Diccionario con propiedades en las unidades solicitadas
+        Vista de solo lectura con las propiedades en MPa (memoizada:
+        llamadas repetidas devuelven el mismo objeto)
     """
     material = get_material_by_id(material_id)
     if not material:
         raise ValueError(f"Material '{material_id}' no encontrado")
-    
-    # Propiedades base en MPa
-    Fy = material["Fy"]
-    Fu = material["Fu"]
-    E = material["E"]
-    G = material["G"]
-    
-    # Conversión según unidades
-    if units == "kN-m":
-        # MPa = N/mm² = kN/m² * 1000 -> Mantener en MPa para cálculos
-        return {
-            "Fy": Fy,           # MPa
-            "Fu": Fu,           # MPa
-            "E": E,             # MPa
-            "G": G,             # MPa
-            "nu": material["nu"],
-            "rho": material["rho"],
-        }
-    elif units == "tonf-m":
-        # 1 MPa = 0.10197 tonf/cm²
-        # Para consistencia interna, mantener en MPa y convertir solo en salidas
-        return {
-            "Fy": Fy,           # Mantener en MPa
-            "Fu": Fu,           # Mantener en MPa
-            "E": E,             # Mantener en MPa
-            "G": G,             # Mantener en MPa
-            "nu": material["nu"],
-            "rho": material["rho"],
-        }
-    elif units == "kgf-cm":
-        # 1 MPa = 10.197 kgf/cm²
-        # Para consistencia interna, mantener en MPa y convertir solo en salidas
-        return {
-            "Fy": Fy,           # Mantener en MPa
-            "Fu": Fu,           # Mantener en MPa
-            "E": E,             # Mantener en MPa
-            "G": G,             # Mantener en MPa
-            "nu": material["nu"],
-            "rho": material["rho"],
-        }
-    else:
+    if units not in SUPPORTED_UNITS:
         raise ValueError(f"Unidades '{units}' no soportadas")
+    
+    # Para consistencia interna se mantiene todo en MPa (1 MPa = N/mm²)
+    return MappingProxyType({
+        "Fy": material["Fy"],   # MPa
+        "Fu": material["Fu"],   # MPa
+        "E": material["E"],     # MPa
+        "G": material["G"],     # MPa
+        "nu": material["nu"],
+        "rho": material["rho"],
+    })
+
+
+# ==================== TABLAS SoA DE MATERIALES ====================
+
+class MaterialArrays(NamedTuple):
+    """Propiedades de STEEL_GRADES en arrays paralelos (unidades base)"""
+    ids: Tuple[str, ...]  # en el orden de STEEL_GRADES
+    Fy: np.ndarray        # MPa
+    Fu: np.ndarray        # MPa
+    E: np.ndarray         # MPa
+    G: np.ndarray         # MPa
+    nu: np.ndarray
+    rho: np.ndarray       # kg/m³
+    alpha: np.ndarray     # 1/°C
+
+
+def _material_column(key: str) -> np.ndarray:
+    array = np.array([material[key] for material in STEEL_GRADES.values()], dtype=np.float64)
+    array.flags.writeable = False
+    return array
+
+
+_MATERIAL_ARRAYS = MaterialArrays(
+    tuple(STEEL_GRADES),
+    *(_material_column(key) for key in MaterialArrays._fields[1:])
+)
+_MATERIAL_INDEX = {material_id: i for i, material_id in enumerate(STEEL_GRADES)}
+
+
+def get_material_arrays() -> MaterialArrays:
+    """
+    Tabla de materiales como arrays por propiedad (solo lectura)
+
+    Para verificaciones masivas: con los índices de get_material_indices,
+    arrays.Fy[idx] entrega la fluencia de cada miembro sin armar dicts.
+    """
+    return _MATERIAL_ARRAYS
+
+
+def get_material_indices(material_ids: Iterable[str]) -> np.ndarray:
+    """
+    Índices en get_material_arrays() para una secuencia de IDs de material
+
+    Raises:
+        ValueError: Si algún material no existe
+    """
+    indices = []
+    for material_id in material_ids:
+        index = _MATERIAL_INDEX.get(material_id.upper())
+        if index is None:
+            raise ValueError(f"Material '{material_id}' no encontrado")
+        indices.append(index)
+    return np.array(indices, dtype=np.intp)
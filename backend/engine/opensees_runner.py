@@ -3,9 +3,11 @@ OpenSees Runner - Motor de análisis estructural
 Interfaz principal con OpenSeesPy para análisis de estructuras de acero
 """
 
+import math
 import openseespy.opensees as ops
 import numpy as np
-from typing import List, Dict, Any, Tuple, Optional, Literal
+from enum import IntEnum
+from typing import Callable, List, Dict, Any, Tuple, Optional, Literal, Union
 from .materials import get_material_properties, get_material_by_id
 from .sections import get_section_properties, get_section_by_id
 from .verification import verify_beam_aisc, verify_column_aisc
@@ -13,6 +15,8 @@ from .verification import verify_beam_aisc, verify_column_aisc
 
 # ==================== CONSTANTES ====================
 
+_PI2 = math.pi * math.pi  # π², para las cargas críticas de Euler
+
 SUPPORT_DOF = {
     "fixed": [1, 1, 1],      # Empotrado: restringir dx, dy, rz
     "pinned": [1, 1, 0],     # Articulado: restringir dx, dy
@@ -22,47 +26,211 @@ SUPPORT_DOF = {
 }
 
 
+class Support(IntEnum):
+    """Condición de apoyo como código entero (se convierte una vez en la API)"""
+    FIXED = 0
+    PINNED = 1
+    ROLLER = 2
+    FREE = 3
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+
+# Grados de libertad restringidos indexados por código de apoyo
+SUPPORT_DOF_BY_CODE = tuple(SUPPORT_DOF[s.label] for s in Support)
+
+# Factor K de longitud efectiva por (base, tope)
+K_FACTORS = {
+    (Support.FIXED, Support.FIXED): 0.65,
+    (Support.FIXED, Support.PINNED): 0.80,
+    (Support.PINNED, Support.FIXED): 0.70,
+    (Support.FIXED, Support.FREE): 2.10,
+    (Support.PINNED, Support.PINNED): 1.00,
+    (Support.PINNED, Support.FREE): 2.10,
+}
+
+
+def as_support(value: Any) -> Any:
+    """Convertir nombre de apoyo a Support (otros valores se mantienen)"""
+    if isinstance(value, str):
+        return Support.__members__.get(value.upper(), value)
+    return value
+
+
+def _support_dof(support: Any, default: List[int]) -> List[int]:
+    if isinstance(support, Support):
+        return SUPPORT_DOF_BY_CODE[support]
+    return SUPPORT_DOF.get(support, default)
+
+
+def _support_label(support: Any) -> Any:
+    return support.label if isinstance(support, Support) else support
+
+
 # ==================== CONVERSIÓN DE UNIDADES ====================
 
+# Factores de escala desde kN-m (interno) por sistema de unidades y tipo de valor
+_UNIT_SCALES = {
+    "kN-m": {"force": 1.0, "moment": 1.0, "length": 1.0, "displacement": 1.0},
+    "tonf-m": {
+        "force": 1 / 9.80665,       # kN -> tonf
+        "moment": 1 / 9.80665,      # kN·m -> tonf·m
+        "length": 1.0,              # m -> m
+        "displacement": 1.0,
+    },
+    "kgf-cm": {
+        "force": 101.972,           # kN -> kgf
+        "moment": 10197.2,          # kN·m -> kgf·cm
+        "length": 100.0,            # m -> cm
+        "displacement": 100.0,      # m -> cm
+    },
+}
+
+
+def _unit_scales(units: str) -> Dict[str, float]:
+    """Factores de escala de salida (unidades desconocidas: sin conversión)"""
+    return _UNIT_SCALES.get(units, _UNIT_SCALES["kN-m"])
+
+
+def _scaled(values: np.ndarray, factor: float) -> np.ndarray:
+    """Aplicar un factor de escala; con factor 1.0 (kN-m) se omite la multiplicación"""
+    return values if factor == 1.0 else values * factor
+
+
 def convert_output_units(value: float, unit_type: str, to_units: str) -> float:
     """
     Convertir valores de salida de kN-m (interno) a unidades deseadas
     
     Args:
-        value: Valor en unidades internas (kN, m, kN-m)
+        value: Valor en unidades internas (kN, m, kN-m); acepta arrays
+            de NumPy (misma aritmética elemento a elemento)
         unit_type: Tipo de valor ("force", "moment", "length", "displacement")
         to_units: Unidades de destino ("kN-m", "tonf-m", "kgf-cm")
     """
     if to_units == "kN-m":
         return value
-    
-    elif to_units == "tonf-m":
-        if unit_type == "force":
-            return value / 9.80665  # kN -> tonf
-        elif unit_type == "moment":
-            return value / 9.80665  # kN·m -> tonf·m
-        elif unit_type in ("length", "displacement"):
-            return value  # m -> m
-    
-    elif to_units == "kgf-cm":
-        if unit_type == "force":
-            return value * 101.972  # kN -> kgf
-        elif unit_type == "moment":
-            return value * 10197.2  # kN·m -> kgf·cm
-        elif unit_type == "length":
-            return value * 100  # m -> cm
-        elif unit_type == "displacement":
-            return value * 100  # m -> cm
-    
-    return value
+    return value * _unit_scales(to_units).get(unit_type, 1.0)
+
+
+def _node_displacements(n_nodes: int) -> np.ndarray:
+    """Desplazamientos (ux, uy, rz) de los nodos 1..n_nodes como array (n_nodes, 3)"""
+    U = np.empty((n_nodes, 3))
+    for i in range(n_nodes):
+        U[i] = ops.nodeDisp(i + 1)
+    return U
+
+
+def _element_end_forces(n_elements: int) -> np.ndarray:
+    """Fuerzas de extremo (globales) de los elementos 1..n_elements como array (n, 6)"""
+    F = np.empty((n_elements, 6))
+    for i in range(n_elements):
+        F[i] = ops.eleResponse(i + 1, 'forces')
+    return F
+
+
+def _distributed_nodal_loads(
+    distributed_loads: List[Any],
+    length: float,
+    n_elements: int,
+    dx: float
+) -> np.ndarray:
+    """
+    Cargas nodales equivalentes (Fy, +Y hacia arriba) de las cargas distribuidas
+
+    Cada elemento reparte la resultante de su tramo cargado en partes
+    iguales a sus dos nodos; las contribuciones de todas las cargas se
+    acumulan en un array de largo n_elements + 1.
+    """
+    x1 = np.arange(n_elements) * dx
+    x2 = np.arange(1, n_elements + 1) * dx
+    Fy_nodal = np.zeros(n_elements + 1)
+    for dload in distributed_loads:
+        start = dload.start
+        end = dload.end if dload.end is not None else length
+        w_start = dload.w_start
+        w_end = dload.w_end if dload.w_end is not None else w_start
+
+        # Validar límites de la carga distribuida
+        if start < 0 or end > length or start > end:
+            print(f"Warning: Carga distribuida con límites inválidos (start={start}, end={end}, length={length}). Se ajustan a [0, {length}].")
+            start = max(0, min(start, length))
+            end = max(start, min(end, length))
+
+        # Evitar división por cero: si start == end, saltar esta carga
+        if abs(end - start) < 1e-9:
+            continue
+
+        # Elementos afectados y tramo cargado de cada uno
+        loaded = np.flatnonzero((x2 > start) & (x1 < end))
+        x1_load = np.maximum(x1[loaded], start)
+        x2_load = np.minimum(x2[loaded], end)
+
+        # Interpolar magnitud de carga en los extremos del tramo
+        w1 = w_start + (w_end - w_start) * ((x1_load - start) / (end - start))
+        w2 = w_start + (w_end - w_start) * ((x2_load - start) / (end - start))
+
+        # Carga promedio en el tramo, distribuida entre los nodos del elemento
+        total_load = (w1 + w2) / 2 * (x2_load - x1_load)
+        Fy_nodal[loaded] -= total_load / 2
+        Fy_nodal[loaded + 1] -= total_load / 2
+
+    return Fy_nodal
+
+
+def _line_nodes(n_nodes: int, dx: float, dy: float) -> None:
+    """Crear los nodos 1..n_nodes en línea recta desde el origen, paso (dx, dy)"""
+    node = ops.node
+    for i in range(n_nodes):
+        node(i + 1, i * dx, i * dy)
+
+
+def _line_elements(n_elements: int, A: float, E: float, I: float, transf_tag: int = 1) -> None:
+    """Crear elementos elasticBeamColumn i -> i+1 entre nodos consecutivos"""
+    element = ops.element
+    for i in range(n_elements):
+        element('elasticBeamColumn', i + 1, i + 1, i + 2, A, E, I, transf_tag)
+
+
+# Clave del modelo que está vivo en el dominio de OpenSees (None si no es
+# reutilizable). Todo wipe dentro de este módulo pasa por _wipe_model
+_live_model_key = None
+
+
+def _wipe_model() -> None:
+    """ops.wipe() invalidando el modelo reutilizable"""
+    global _live_model_key
+    _live_model_key = None
+    ops.wipe()
+
+
+def _reuse_model(key: Tuple, n_nodes: int, n_elements: int) -> bool:
+    """
+    Preparar el modelo vivo para un nuevo estado de carga, si es el de key
+
+    Quita el patrón y la serie de carga, descarta el análisis y vuelve el
+    dominio al estado inicial; nodos, apoyos y elementos se conservan. Si
+    alguien más limpió el dominio (conteo de nodos/elementos distinto),
+    retorna False y el modelo se reconstruye.
+    """
+    if (key != _live_model_key
+            or len(ops.getNodeTags()) != n_nodes
+            or len(ops.getEleTags()) != n_elements):
+        return False
+    ops.remove('loadPattern', 1)
+    ops.remove('timeSeries', 1)
+    ops.wipeAnalysis()
+    ops.reset()
+    return True
 
 
 # ==================== ANÁLISIS DE VIGA ====================
 
 def analyze_beam(
     length: float,
-    support_left: str,
-    support_right: str,
+    support_left: Union[Support, str],
+    support_right: Union[Support, str],
     section_id: str,
     material_id: str,
     point_loads: List[Any],
@@ -87,259 +255,233 @@ def analyze_beam(
     Returns:
         Diccionario con reacciones, desplazamientos, diagramas y verificaciones
     """
-    
+    analyze = make_beam_analyzer(
+        length, support_left, support_right, section_id, material_id,
+        units=units, num_points=num_points
+    )
+    return analyze(point_loads, distributed_loads)
+
+
+def make_beam_analyzer(
+    length: float,
+    support_left: Union[Support, str],
+    support_right: Union[Support, str],
+    section_id: str,
+    material_id: str,
+    units: str = "kN-m",
+    num_points: int = 21,
+    diagram_arrays: bool = False
+) -> Callable[[List[Any], List[Any]], Dict[str, Any]]:
+    """
+    Preparar el análisis de una viga fija para evaluar muchos estados de carga
+
+    Propiedades, discretización, apoyos y escalas de unidades se resuelven
+    una sola vez; la función devuelta solo arma el modelo, aplica las
+    cargas, resuelve y extrae resultados (barridos de posición de carga,
+    optimización).
+
+    Args:
+        Los mismos de analyze_beam, salvo las cargas
+        diagram_arrays: Agregar "diagram_arrays" al resultado: {x, moment,
+            shear, axial} como arrays de NumPy (ya en las unidades de
+            salida), para consumidores internos; no es serializable a JSON
+
+    Returns:
+        analyze(point_loads, distributed_loads) -> mismo resultado que analyze_beam
+    """
+    scale = _unit_scales(units)
+
     # Obtener propiedades
     mat_props = get_material_properties(material_id)
     sec_props = get_section_properties(section_id)
     section_info = get_section_by_id(section_id)
+    material_info = get_material_by_id(material_id)
     
     E = mat_props["E"] * 1e6  # MPa -> kN/m² (kPa)
     A = sec_props["A"]        # m²
     Iz = sec_props["Ix"]      # m⁴ (usando Ix para flexión en plano)
     
-    # Limpiar modelo anterior
-    ops.wipe()
-    
-    # Crear modelo 2D con 3 DOF por nodo (dx, dy, rz)
-    ops.model('basic', '-ndm', 2, '-ndf', 3)
-    
     # Discretizar la viga en varios elementos para mejor precisión
     n_elements = max(10, num_points - 1)
     n_nodes = n_elements + 1
     dx = length / n_elements
-    
-    # Crear nodos
-    for i in range(n_nodes):
-        x = i * dx
-        ops.node(i + 1, x, 0.0)
-    
-    # Aplicar condiciones de apoyo
-    left_dof = SUPPORT_DOF.get(support_left, [0, 0, 0])
-    right_dof = SUPPORT_DOF.get(support_right, [0, 0, 0])
-    
-    ops.fix(1, *left_dof)
-    ops.fix(n_nodes, *right_dof)
-    
-    # Transformación geométrica (lineal para análisis elástico)
-    ops.geomTransf('Linear', 1)
-    
-    # Crear elementos elasticBeamColumn
-    for i in range(n_elements):
-        ops.element('elasticBeamColumn', i + 1, i + 1, i + 2, A, E, Iz, 1)
-    
-    # Crear patrón de carga
-    ops.timeSeries('Linear', 1)
-    ops.pattern('Plain', 1, 1)
-    
-    # Aplicar cargas puntuales
-    for load in point_loads:
-        pos = load.position
-        Fy = load.Fy
-        Fx = load.Fx
-        Mz = load.Mz
-        
-        # Encontrar el nodo más cercano
-        node_idx = int(round(pos / dx)) + 1
-
-        # Validar que node_idx esté dentro del rango
-        if pos > length:
-            print(f"Warning: Carga puntual en posición {pos}m excede la longitud de la viga {length}m. Se coloca en el extremo.")
-        node_idx = max(1, min(n_nodes, node_idx))
-
-        # Aplicar carga (Fy negativo porque OpenSees usa +Y hacia arriba)
-        ops.load(node_idx, Fx, -Fy, Mz)
-    
-    # Aplicar cargas distribuidas (convertir a cargas nodales equivalentes)
-    for dload in distributed_loads:
-        start = dload.start
-        end = dload.end if dload.end is not None else length
-        w_start = dload.w_start
-        w_end = dload.w_end if dload.w_end is not None else w_start
-
-        # Validar límites de la carga distribuida
-        if start < 0 or end > length or start > end:
-            print(f"Warning: Carga distribuida con límites inválidos (start={start}, end={end}, length={length}). Se ajustan a [0, {length}].")
-            start = max(0, min(start, length))
-            end = max(start, min(end, length))
-
-        # Evitar división por cero: si start == end, saltar esta carga
-        if abs(end - start) < 1e-9:
-            continue
-
-        # Encontrar elementos afectados
-        for i in range(n_elements):
-            x1 = i * dx
-            x2 = (i + 1) * dx
+    x_arr = _scaled(np.arange(n_nodes) * dx, scale["length"])
+    x_arr.flags.writeable = False
+    x_out = x_arr.tolist()
+    reaction_scale = np.array([scale["force"], -scale["force"], scale["moment"]])
+    
+    # Condiciones de apoyo
+    support_left = as_support(support_left)
+    support_right = as_support(support_right)
+    left_dof = _support_dof(support_left, [0, 0, 0])
+    right_dof = _support_dof(support_right, [0, 0, 0])
+    supports = {"left": _support_label(support_left), "right": _support_label(support_right)}
+
+    # Todo lo que define el modelo (sin cargas): si el modelo vivo de OpenSees
+    # tiene la misma clave, se reutiliza cambiando solo el patrón de carga
+    model_key = ("beam", length, tuple(left_dof), tuple(right_dof), n_elements, A, E, Iz)
+
+    def analyze(point_loads: List[Any], distributed_loads: List[Any]) -> Dict[str, Any]:
+        global _live_model_key
+
+        if not _reuse_model(model_key, n_nodes, n_elements):
+            # Limpiar modelo anterior
+            _wipe_model()
             
-            # Verificar si el elemento está dentro del rango de carga
-            if x2 <= start or x1 >= end:
-                continue
+            # Crear modelo 2D con 3 DOF por nodo (dx, dy, rz)
+            ops.model('basic', '-ndm', 2, '-ndf', 3)
             
-            # Calcular carga en este segmento
-            x1_load = max(x1, start)
-            x2_load = min(x2, end)
+            # Crear nodos y aplicar condiciones de apoyo
+            _line_nodes(n_nodes, dx, 0.0)
+            ops.fix(1, *left_dof)
+            ops.fix(n_nodes, *right_dof)
             
-            # Interpolar magnitud de carga
-            if end > start:
-                t1 = (x1_load - start) / (end - start) if (end - start) > 0 else 0
-                t2 = (x2_load - start) / (end - start) if (end - start) > 0 else 0
-                w1 = w_start + (w_end - w_start) * t1
-                w2 = w_start + (w_end - w_start) * t2
-            else:
-                w1 = w2 = w_start
-            
-            # Carga promedio en el segmento
-            w_avg = (w1 + w2) / 2
-            seg_length = x2_load - x1_load
-            total_load = w_avg * seg_length
+            # Transformación geométrica (lineal para análisis elástico)
+            ops.geomTransf('Linear', 1)
             
-            # Distribuir entre nodos del elemento
-            node_i = i + 1
-            node_j = i + 2
-            ops.load(node_i, 0, -total_load / 2, 0)
-            ops.load(node_j, 0, -total_load / 2, 0)
-    
-    # Configurar análisis
-    ops.system('BandSPD')
-    ops.numberer('RCM')
-    ops.constraints('Plain')
-    ops.integrator('LoadControl', 1.0)
-    ops.algorithm('Linear')
-    ops.analysis('Static')
-    
-    # Ejecutar análisis
-    analysis_ok = ops.analyze(1)
-
-    if analysis_ok != 0:
-        ops.wipe()
-        raise RuntimeError("El análisis de viga no convergió")
-
-    # Extraer resultados
+            # Crear elementos elasticBeamColumn
+            _line_elements(n_elements, A, E, Iz)
+            _live_model_key = model_key
+        
+        # Crear patrón de carga
+        ops.timeSeries('Linear', 1)
+        ops.pattern('Plain', 1, 1)
+        
+        # Aplicar cargas puntuales en el nodo más cercano (redondeo y recorte vectorial)
+        positions = np.array([load.position for load in point_loads], dtype=np.float64)
+        node_idx = np.clip(np.round(positions / dx).astype(np.int64) + 1, 1, n_nodes)
 
-    # Desplazamientos nodales
-    displacements = []
-    for i in range(n_nodes):
-        node_id = i + 1
-        x = i * dx
-        ux = ops.nodeDisp(node_id, 1)
-        uy = ops.nodeDisp(node_id, 2)
-        rz = ops.nodeDisp(node_id, 3)
-        displacements.append({
-            "x": convert_output_units(x, "length", units),
-            "ux": convert_output_units(ux, "displacement", units),
-            "uy": convert_output_units(uy, "displacement", units),
-            "rz": rz  # [rad] Rotación en radianes
-        })
+        # Validar que node_idx esté dentro del rango
+        for i in np.flatnonzero(positions > length).tolist():
+            pos = point_loads[i].position
+            print(f"Warning: Carga puntual en posición {pos}m excede la longitud de la viga {length}m. Se coloca en el extremo.")
 
-    # Reacciones - necesitamos calcularlas primero
-    ops.reactions()
-    
-    reactions = {}
-    if any(left_dof):
-        reactions["left"] = {
-            "Rx": convert_output_units(ops.nodeReaction(1, 1), "force", units),
-            "Ry": convert_output_units(-ops.nodeReaction(1, 2), "force", units),
-            "Mz": convert_output_units(ops.nodeReaction(1, 3), "moment", units)
-        }
-    if any(right_dof):
-        reactions["right"] = {
-            "Rx": convert_output_units(ops.nodeReaction(n_nodes, 1), "force", units),
-            "Ry": convert_output_units(-ops.nodeReaction(n_nodes, 2), "force", units),
-            "Mz": convert_output_units(ops.nodeReaction(n_nodes, 3), "moment", units)
-        }
-    
-    # Fuerzas en elementos (M, V, N)
-    forces_diagram = {"moment": [], "shear": [], "axial": []}
-    
-    for i in range(n_elements):
-        elem_id = i + 1
-        x_mid = (i + 0.5) * dx
+        # Acumular cargas por nodo (Fy negativo porque OpenSees usa +Y hacia arriba);
+        # varias cargas en el mismo nodo se suman aquí y no en OpenSees
+        F_nodal = np.zeros((n_nodes, 3))
+        if point_loads:
+            point_values = np.array(
+                [(load.Fx, -load.Fy, load.Mz) for load in point_loads], dtype=np.float64
+            )
+            np.add.at(F_nodal, node_idx - 1, point_values)
+
+        # Cargas distribuidas (convertidas a cargas nodales equivalentes)
+        F_nodal[:, 1] += _distributed_nodal_loads(distributed_loads, length, n_elements, dx)
+
+        # Una sola llamada a ops.load por nodo cargado
+        for i in np.flatnonzero(F_nodal.any(axis=1)).tolist():
+            ops.load(i + 1, *F_nodal[i].tolist())
         
-        # Obtener fuerzas del elemento [N1, V1, M1, N2, V2, M2]
-        forces = ops.eleResponse(elem_id, 'forces')
+        # Configurar análisis
+        ops.system('BandSPD')
+        ops.numberer('RCM')
+        ops.constraints('Plain')
+        ops.integrator('LoadControl', 1.0)
+        ops.algorithm('Linear')
+        ops.analysis('Static')
         
-        # Para cada extremo del elemento
-        x1 = i * dx
-        x2 = (i + 1) * dx
+        # Ejecutar análisis
+        analysis_ok = ops.analyze(1)
+
+        if analysis_ok != 0:
+            _wipe_model()
+            raise RuntimeError("El análisis de viga no convergió")
+
+        # Extraer resultados
+
+        # Desplazamientos nodales (una llamada a nodeDisp por nodo, conversión vectorial)
+        U = _node_displacements(n_nodes)
+        uy_arr = _scaled(U[:, 1], scale["displacement"])
+        displacements = [
+            {"x": x, "ux": ux, "uy": uy, "rz": rz}  # rz [rad] Rotación en radianes
+            for x, ux, uy, rz in zip(
+                x_out,
+                _scaled(U[:, 0], scale["displacement"]).tolist(),
+                uy_arr.tolist(),
+                U[:, 2].tolist()
+            )
+        ]
+
+        # Reacciones - necesitamos calcularlas primero
+        ops.reactions()
         
-        # Fuerzas en i (índices 0, 1, 2)
-        N1, V1, M1 = forces[0], forces[1], forces[2]
-        # Fuerzas en j (índices 3, 4, 5)
-        N2, V2, M2 = forces[3], forces[4], forces[5]
+        # Una llamada a nodeReaction por apoyo; signo de Ry y escala en un producto
+        reactions = {}
+        for side, node, dof in (("left", 1, left_dof), ("right", n_nodes, right_dof)):
+            if any(dof):
+                R = np.array(ops.nodeReaction(node)) * reaction_scale
+                reactions[side] = dict(zip(("Rx", "Ry", "Mz"), R.tolist()))
         
-        if i == 0:
-            forces_diagram["moment"].append({
-                "x": convert_output_units(x1, "length", units),
-                "value": convert_output_units(M1, "moment", units)
-            })
-            forces_diagram["shear"].append({
-                "x": convert_output_units(x1, "length", units),
-                "value": convert_output_units(V1, "force", units)
-            })
-            forces_diagram["axial"].append({
-                "x": convert_output_units(x1, "length", units),
-                "value": convert_output_units(N1, "force", units)
-            })
+        # Fuerzas en elementos [N1, V1, M1, N2, V2, M2] (una fila por elemento)
+        F = _element_end_forces(n_elements)
+
+        # Diagramas en los nodos: extremo i del primer elemento y extremos j
+        # (con signo invertido) de todos los elementos
+        def diagram(col_i: int, col_j: int, unit_type: str) -> np.ndarray:
+            values = np.empty(n_nodes)
+            values[0] = F[0, col_i]
+            values[1:] = -F[:, col_j]
+            return _scaled(values, scale[unit_type])
+
+        arrays = {
+            "moment": diagram(2, 5, "moment"),
+            "shear": diagram(1, 4, "force"),
+            "axial": diagram(0, 3, "force"),
+        }
+        forces_diagram = {
+            name: [{"x": x, "value": value} for x, value in zip(x_out, values.tolist())]
+            for name, values in arrays.items()
+        }
         
-        forces_diagram["moment"].append({
-            "x": convert_output_units(x2, "length", units),
-            "value": convert_output_units(-M2, "moment", units)
-        })
-        forces_diagram["shear"].append({
-            "x": convert_output_units(x2, "length", units),
-            "value": convert_output_units(-V2, "force", units)
-        })
-        forces_diagram["axial"].append({
-            "x": convert_output_units(x2, "length", units),
-            "value": convert_output_units(-N2, "force", units)
-        })
-    
-    # Valores máximos
-    max_moment = max((abs(p["value"]) for p in forces_diagram["moment"]), default=0.0)
-    max_shear = max((abs(p["value"]) for p in forces_diagram["shear"]), default=0.0)
-    max_deflection = max((abs(d["uy"]) for d in displacements), default=0.0)
-    
-    # Verificaciones AISC
-    verification = verify_beam_aisc(
-        Mu=max_moment,
-        Vu=max_shear,
-        L=length,
-        delta_max=max_deflection,
-        section_id=section_id,
-        material_id=material_id,
-        units=units
-    )
-    
-    # Limpiar
-    ops.wipe()
-    
-    return {
-        "status": "success",
-        "input": {
-            "length": length,
-            "section": section_info,
-            "material": get_material_by_id(material_id),
-            "supports": {"left": support_left, "right": support_right}
-        },
-        "reactions": reactions,
-        "displacements": displacements,
-        "diagrams": forces_diagram,
-        "max_values": {
-            "moment": max_moment,
-            "shear": max_shear,
-            "deflection": max_deflection
-        },
-        "verification": verification,
-        "units": units
-    }
+        # Valores máximos (reducciones sobre los arrays, no sobre los diccionarios)
+        max_moment = float(np.abs(arrays["moment"]).max(initial=0.0))
+        max_shear = float(np.abs(arrays["shear"]).max(initial=0.0))
+        max_deflection = float(np.abs(uy_arr).max(initial=0.0))
+        
+        # Verificaciones AISC
+        verification = verify_beam_aisc(
+            Mu=max_moment,
+            Vu=max_shear,
+            L=length,
+            delta_max=max_deflection,
+            section_id=section_id,
+            material_id=material_id,
+            units=units
+        )
+        
+        # El modelo queda vivo para la próxima llamada con la misma viga
+        result = {
+            "status": "success",
+            "input": {
+                "length": length,
+                "section": section_info,
+                "material": material_info,
+                "supports": dict(supports)
+            },
+            "reactions": reactions,
+            "displacements": displacements,
+            "diagrams": forces_diagram,
+            "max_values": {
+                "moment": max_moment,
+                "shear": max_shear,
+                "deflection": max_deflection
+            },
+            "verification": verification,
+            "units": units
+        }
+        if diagram_arrays:
+            result["diagram_arrays"] = {"x": x_arr, **arrays}
+        return result
+
+    return analyze
 
 
 # ==================== ANÁLISIS DE COLUMNA ====================
 
 def analyze_column(
     height: float,
-    base: str,
-    top: str,
+    base: Union[Support, str],
+    top: Union[Support, str],
     section_id: str,
     material_id: str,
     axial_load: float,
@@ -365,6 +507,8 @@ def analyze_column(
         Diccionario con resultados y verificaciones
     """
     
+    scale = _unit_scales(units)
+
     # Obtener propiedades
     mat_props = get_material_properties(material_id)
     sec_props = get_section_properties(section_id)
@@ -379,19 +523,14 @@ def analyze_column(
     ry = sec_props["ry"]
     
     # Factor K para longitud efectiva
-    K_values = {
-        ("fixed", "fixed"): 0.65,
-        ("fixed", "pinned"): 0.80,
-        ("pinned", "fixed"): 0.70,
-        ("fixed", "free"): 2.10,
-        ("pinned", "pinned"): 1.00,
-        ("pinned", "free"): 2.10,
-    }
-    K = K_values.get((base, top), 1.0)
+    base = as_support(base)
+    top = as_support(top)
+    K = K_FACTORS.get((base, top), 1.0)
     
     # Longitud efectiva
-    Leff_x = K * height
-    Leff_y = K * height
+    KL = K * height
+    Leff_x = KL
+    Leff_y = KL
     
     # Esbeltez
     lambda_x = Leff_x / rx
@@ -404,24 +543,23 @@ def analyze_column(
     r_min = min(rx, ry)
     
     # Tensión crítica de Euler
-    Fe = (np.pi ** 2 * E) / (K * height / r_min) ** 2  # kPa
+    Fe = (_PI2 * E) / (KL / r_min) ** 2  # kPa
     
     # Carga crítica de Euler usando Pcr = π²EI/(KL)²
-    Pcr_euler = (np.pi ** 2 * E * I_min) / (K * height) ** 2  # kN
+    Pcr_euler = (_PI2 * E * I_min) / KL ** 2  # kN
     
     # Verificación AISC con OpenSees
-    ops.wipe()
+    _wipe_model()
     ops.model('basic', '-ndm', 2, '-ndf', 3)
     
     # Nodos
     n_elements = 10
     dy = height / n_elements
-    for i in range(n_elements + 1):
-        ops.node(i + 1, 0.0, i * dy)
+    _line_nodes(n_elements + 1, 0.0, dy)
     
     # Apoyos
-    base_dof = SUPPORT_DOF.get(base, [1, 1, 1])
-    top_dof = SUPPORT_DOF.get(top, [0, 0, 0])
+    base_dof = _support_dof(base, [1, 1, 1])
+    top_dof = _support_dof(top, [0, 0, 0])
     
     ops.fix(1, *base_dof)
     if any(top_dof):
@@ -431,8 +569,7 @@ def analyze_column(
     ops.geomTransf('PDelta', 1)
     
     # Elementos
-    for i in range(n_elements):
-        ops.element('elasticBeamColumn', i + 1, i + 1, i + 2, A, E, Ix, 1)
+    _line_elements(n_elements, A, E, Ix)
     
     # Cargas
     ops.timeSeries('Linear', 1)
@@ -454,24 +591,22 @@ def analyze_column(
     ops.analysis('Static')
     ops.analyze(1)
     
-    # Extraer desplazamientos
-    displacements = []
-    for i in range(n_elements + 1):
-        node_id = i + 1
-        y = i * dy
-        ux = ops.nodeDisp(node_id, 1)
-        uy = ops.nodeDisp(node_id, 2)
-        rz = ops.nodeDisp(node_id, 3)
-        displacements.append({
-            "y": convert_output_units(y, "length", units),
-            "ux": convert_output_units(ux, "displacement", units),
-            "uy": convert_output_units(uy, "displacement", units),
-            "rz": rz  # [rad] Rotación en radianes
-        })
+    # Extraer desplazamientos (una llamada a nodeDisp por nodo, conversión vectorial)
+    y_nodes = np.arange(n_elements + 1) * dy
+    U = _node_displacements(n_elements + 1)
+    displacements = [
+        {"y": y, "ux": ux, "uy": uy, "rz": rz}  # rz [rad] Rotación en radianes
+        for y, ux, uy, rz in zip(
+            _scaled(y_nodes, scale["length"]).tolist(),
+            _scaled(U[:, 0], scale["displacement"]).tolist(),
+            _scaled(U[:, 1], scale["displacement"]).tolist(),
+            U[:, 2].tolist()
+        )
+    ]
     
     max_lateral = max((abs(d["ux"]) for d in displacements), default=0.0)
     
-    ops.wipe()
+    _wipe_model()
     
     # Verificación AISC
     verification = verify_column_aisc(
@@ -491,7 +626,7 @@ def analyze_column(
             "height": height,
             "section": section_info,
             "material": get_material_by_id(material_id),
-            "supports": {"base": base, "top": top},
+            "supports": {"base": _support_label(base), "top": _support_label(top)},
             "loads": {
                 "axial": axial_load,
                 "moment_top": moment_top,
@@ -532,6 +667,7 @@ def get_element_forces(element_ids: List[int], units: str = "kN-m") -> Dict[int,
     Returns:
         Diccionario {elem_id: {N, V_i, M_i, V_j, M_j}}
     """
+    scale = _unit_scales(units)
     forces = {}
 
     for elem_id in element_ids:
@@ -543,11 +679,11 @@ def get_element_forces(element_ids: List[int], units: str = "kN-m") -> Dict[int,
 
             if len(force) >= 5:
                 forces[elem_id] = {
-                    "N": convert_output_units(force[0], "force", units),       # Axial
-                    "V_i": convert_output_units(force[1], "force", units),     # Cortante en i
-                    "M_i": convert_output_units(force[2], "moment", units),    # Momento en i
-                    "V_j": convert_output_units(force[3], "force", units),     # Cortante en j
-                    "M_j": convert_output_units(force[4], "moment", units)     # Momento en j
+                    "N": force[0] * scale["force"],       # Axial
+                    "V_i": force[1] * scale["force"],     # Cortante en i
+                    "M_i": force[2] * scale["moment"],    # Momento en i
+                    "V_j": force[3] * scale["force"],     # Cortante en j
+                    "M_j": force[4] * scale["moment"]     # Momento en j
                 }
             else:
                 # Si no hay suficientes valores, retornar ceros
@@ -593,51 +729,38 @@ def analyze_frame(
         Diccionario con resultados completos
     """
     
+    scale = _unit_scales(units)
     mat_props = get_material_properties(material_id)
     E = mat_props["E"] * 1e6  # MPa -> kPa
     
-    ops.wipe()
+    _wipe_model()
     ops.model('basic', '-ndm', 2, '-ndf', 3)
     
+    # Datos de entrada en listas paralelas (un solo acceso por atributo)
+    node_ids = [node.id for node in nodes]
+    node_xs = [node.x for node in nodes]
+    node_ys = [node.y for node in nodes]
+    node_supports = [node.support for node in nodes]
+    element_ids = [elem.id for elem in elements]
+    element_sections = [elem.section_id for elem in elements]
+
     # Crear nodos
-    node_coords = {}
-    for node in nodes:
-        node_id = node.id
-        x = node.x
-        y = node.y
-        support = node.support
-        
-        ops.node(node_id, x, y)
-        node_coords[node_id] = (x, y)
-        
+    create_node = ops.node
+    for node_id, x, y, support in zip(node_ids, node_xs, node_ys, node_supports):
+        create_node(node_id, x, y)
         if support:
-            dof = SUPPORT_DOF.get(support, [0, 0, 0])
-            ops.fix(node_id, *dof)
+            ops.fix(node_id, *SUPPORT_DOF.get(support, [0, 0, 0]))
+    node_coords = dict(zip(node_ids, zip(node_xs, node_ys)))
     
     # Transformación geométrica
     ops.geomTransf('PDelta', 1)
     
     # Crear elementos
-    element_props = {}
-    for elem in elements:
-        elem_id = elem.id
-        node_i = elem.node_i
-        node_j = elem.node_j
-        section_id = elem.section_id
-        
+    create_element = ops.element
+    for elem_id, elem, section_id in zip(element_ids, elements, element_sections):
         sec_props = get_section_properties(section_id)
-        A = sec_props["A"]
-        I = sec_props["Ix"]
-        
-        ops.element('elasticBeamColumn', elem_id, node_i, node_j, A, E, I, 1)
-        
-        element_props[elem_id] = {
-            "section_id": section_id,
-            "node_i": node_i,
-            "node_j": node_j,
-            "A": A,
-            "I": I
-        }
+        create_element('elasticBeamColumn', elem_id, elem.node_i, elem.node_j,
+                       sec_props["A"], E, sec_props["Ix"], 1)
     
     # Aplicar cargas
     ops.timeSeries('Linear', 1)
@@ -674,15 +797,14 @@ def analyze_frame(
     analysis_ok = ops.analyze(1)
 
     if analysis_ok != 0:
-        ops.wipe()
+        _wipe_model()
         return {"status": "error", "message": "El análisis no convergió"}
 
     # Extraer resultados
 
     # Desplazamientos nodales
     node_results = {}
-    for node in nodes:
-        node_id = node.id
+    for node_id in node_ids:
         ux = ops.nodeDisp(node_id, 1)
         uy = ops.nodeDisp(node_id, 2)
         rz = ops.nodeDisp(node_id, 3)
@@ -690,41 +812,35 @@ def analyze_frame(
         node_results[node_id] = {
             "x": node_coords[node_id][0],
             "y": node_coords[node_id][1],
-            "ux": convert_output_units(ux, "displacement", units),
-            "uy": convert_output_units(uy, "displacement", units),
+            "ux": ux * scale["displacement"],
+            "uy": uy * scale["displacement"],
             "rz": rz  # [rad] Rotación en radianes
         }
 
     # Reacciones en apoyos - solo si el análisis fue exitoso
     ops.reactions()
     
-    reactions = {}
-    for node in nodes:
-        node_id = node.id
-        support = node.support
-        
-        if support and support != "free":
-            Rx = ops.nodeReaction(node_id, 1)
-            Ry = -ops.nodeReaction(node_id, 2)
-            Mz = ops.nodeReaction(node_id, 3)
-            
-            reactions[node_id] = {
-                "Rx": convert_output_units(Rx, "force", units),
-                "Ry": convert_output_units(Ry, "force", units),
-                "Mz": convert_output_units(Mz, "moment", units)
-            }
+    # Una llamada a nodeReaction por apoyo; signo de Ry y escala en un producto
+    supported_ids = [
+        node_id for node_id, support in zip(node_ids, node_supports)
+        if support and support != "free"
+    ]
+    R = np.array([ops.nodeReaction(node_id) for node_id in supported_ids]).reshape(-1, 3)
+    R *= (scale["force"], -scale["force"], scale["moment"])
+    reactions = {
+        node_id: {"Rx": Rx, "Ry": Ry, "Mz": Mz}
+        for node_id, (Rx, Ry, Mz) in zip(supported_ids, R.tolist())
+    }
     
     # Fuerzas en elementos usando basicForce (más preciso)
-    element_ids = [elem.id for elem in elements]
     element_forces = get_element_forces(element_ids, units)
 
     element_results = {}
-    for elem in elements:
-        elem_id = elem.id
+    for elem_id, elem, section_id in zip(element_ids, elements, element_sections):
         forces = element_forces.get(elem_id, {})
 
         element_results[elem_id] = {
-            "section_id": element_props[elem_id]["section_id"],
+            "section_id": section_id,
             "element_type": elem.element_type,
             "forces_i": {
                 "N": forces.get("N", 0.0),
@@ -738,7 +854,7 @@ def analyze_frame(
             }
         }
 
-    ops.wipe()
+    _wipe_model()
 
     return {
         "status": "success",
@@ -3,10 +3,13 @@ Secciones de Acero - Perfiles AISC y Chilenos
 Base de datos de propiedades geométricas
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, NamedTuple
+from functools import lru_cache
 import json
 import os
 
+import numpy as np
+
 # ==================== TIPOS DE SECCIONES ====================
 
 SECTION_TYPES = {
@@ -1983,12 +1986,13 @@ CHILEAN_SECTIONS: Dict[str, Dict[str, Any]] = {
 }
 
 
+@lru_cache(maxsize=256)
 def get_all_sections(
     section_type: str = None,
     catalog: str = None,
     limit: int = 50
-) -> List[Dict[str, Any]]:
-    """Obtener todas las secciones, opcionalmente filtradas"""
+) -> Tuple[Dict[str, Any], ...]:
+    """Obtener todas las secciones, opcionalmente filtradas (resultado memoizado, solo lectura)"""
     all_sections = {**AISC_SECTIONS, **CHILEAN_SECTIONS}
     
     result = []
@@ -2001,15 +2005,64 @@ def get_all_sections(
         if len(result) >= limit:
             break
     
-    return result
+    return tuple(result)
 
 
+@lru_cache(maxsize=1024)
 def get_section_by_id(section_id: str) -> Optional[Dict[str, Any]]:
-    """Obtener una sección por su ID"""
+    """Obtener una sección por su ID (catálogo estático, resultado memoizado)"""
     section_id = section_id.upper()
     return AISC_SECTIONS.get(section_id) or CHILEAN_SECTIONS.get(section_id)
 
 
+# ==================== TABLAS SoA DEL CATALOGO ====================
+
+class SectionArrays(NamedTuple):
+    """Propiedades del catalogo en arrays paralelos (unidades del catalogo)"""
+    sections: Tuple[Dict[str, Any], ...]  # en el orden de get_all_sections
+    d: np.ndarray        # mm (d, H u OD)
+    weight: np.ndarray   # kg/m
+    Ix: np.ndarray       # mm⁴
+    Iy: np.ndarray       # mm⁴
+    Zx: np.ndarray       # mm³
+    rx: np.ndarray       # mm
+    ry: np.ndarray       # mm
+
+
+@lru_cache(maxsize=64)
+def get_section_arrays(section_type: str = None, catalog: str = None, limit: int = 50) -> SectionArrays:
+    """
+    Mismas secciones que get_all_sections, como arrays por propiedad
+
+    Se arman una vez por filtro; las busquedas sobre el catalogo quedan como
+    operaciones vectoriales. Propiedades faltantes valen 0 (con los mismos
+    respaldos por tipo de perfil: H/OD, I, Z, r). Resultado de solo lectura.
+    """
+    sections = get_all_sections(section_type=section_type, catalog=catalog, limit=limit)
+
+    def column(*keys):
+        values = []
+        for section in sections:
+            value = 0
+            for key in reversed(keys):
+                value = section.get(key, value)
+            values.append(value)
+        array = np.array(values, dtype=np.float64)
+        array.flags.writeable = False
+        return array
+
+    return SectionArrays(
+        sections,
+        column("d", "H", "OD"),
+        column("weight"),
+        column("Ix", "I"),
+        column("Iy", "I"),
+        column("Zx", "Z"),
+        column("rx", "r"),
+        column("ry", "r"),
+    )
+
+
 def search_sections(query: str, catalog: str = None) -> List[Dict[str, Any]]:
     """Buscar secciones por nombre"""
     query = query.upper()
@@ -2025,6 +2078,7 @@ def search_sections(query: str, catalog: str = None) -> List[Dict[str, Any]]:
     return results
 
 
+@lru_cache(maxsize=1024)
 def get_section_properties(section_id: str, units: str = "kN-m") -> Dict[str, float]:
     """
     Obtener propiedades de sección para cálculo
@@ -2034,7 +2088,8 @@ def get_section_properties(section_id: str, units: str = "kN-m") -> Dict[str, fl
         units: Sistema de unidades
     
     Returns:
-        Propiedades en unidades consistentes (m, m², m⁴)
+        Propiedades en unidades consistentes (m, m², m⁴).
+        Resultado memoizado: tratar como solo lectura.
     """
     section = get_section_by_id(section_id)
     if not section:
@@ -2063,3 +2118,26 @@ def get_section_properties(section_id: str, units: str = "kN-m") -> Dict[str, fl
     }
     
     return props
+
+
+@lru_cache(maxsize=1024)
+def get_section_properties_mm(section_id: str) -> Dict[str, float]:
+    """
+    Obtener propiedades de sección en mm para las verificaciones AISC
+
+    Mismos valores que get_section_properties convertidos una sola vez
+    (m -> mm, m² -> mm², m³ -> mm³, m⁴ -> mm⁴). Resultado memoizado: tratar
+    como solo lectura.
+    """
+    props = get_section_properties(section_id)
+    return {
+        "A": props["A"] * 1e6,      # mm²
+        "Ix": props["Ix"] * 1e12,   # mm⁴
+        "Iy": props["Iy"] * 1e12,   # mm⁴
+        "Sx": props["Sx"] * 1e9,    # mm³
+        "Zx": props["Zx"] * 1e9,    # mm³
+        "rx": props["rx"] * 1e3,    # mm
+        "ry": props["ry"] * 1e3,    # mm
+        "d": props["d"] * 1e3,      # mm
+        "weight": props["weight"],  # kg/m
+    }
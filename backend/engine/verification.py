@@ -2,145 +2,215 @@
 Verificaciones AISC 360 para elementos de acero
 """
 
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
 import math
+
+import numpy as np
+
 from .materials import get_material_properties
-from .sections import get_section_properties, get_section_by_id
+from .sections import get_section_properties_mm, get_section_by_id
 
 
-def verify_beam_aisc(
-    Mu: float,
-    Vu: float,
-    L: float,
-    delta_max: float,
-    section_id: str,
-    material_id: str,
-    units: str = "kN-m",
-    Lb: float = None,  # Longitud no arriostrada (si None = L)
-    Cb: float = 1.0    # Factor de momento
-) -> Dict[str, Any]:
+# ==================== INVARIANTES DEL MATERIAL ====================
+
+_PI2 = math.pi * math.pi  # π²
+
+
+class _MaterialConsts(NamedTuple):
+    """Invariantes de un material que usan las verificaciones (MPa)"""
+    Fy: float
+    E: float
+    sqrt_E_Fy: float      # √(E/Fy), para Lp y Lr
+    pi2_E: float          # π²·E, para la tensión de Euler
+    lambda_limit: float   # 4.71·√(E/Fy), esbeltez límite AISC E3
+    FL: float             # 0.7·Fy, tensión de la zona inelástica (F2)
+
+
+@lru_cache(maxsize=None)
+def _material_consts(material_id: str) -> _MaterialConsts:
+    """Invariantes del material (catálogo pequeño y estático, memoizado)"""
+    mat = get_material_properties(material_id)
+    Fy = mat["Fy"]  # MPa
+    E = mat["E"]    # MPa
+    sqrt_E_Fy = math.sqrt(E / Fy)
+    return _MaterialConsts(Fy, E, sqrt_E_Fy, _PI2 * E, 4.71 * sqrt_E_Fy, 0.7 * Fy)
+
+
+# ==================== PROPIEDADES DE SECCIÓN ====================
+
+class _AISCSection(NamedTuple):
+    """Propiedades que usan las verificaciones, ya en mm (una tupla por perfil)"""
+    A: float      # mm²
+    Zx: float     # mm³
+    Sx: float     # mm³
+    rx: float     # mm
+    ry: float     # mm
+    Aw: float     # mm² (área de corte aproximada)
+    is_W: bool    # perfil W (define el Lr aproximado y el área de corte)
+
+
+def _shear_area(sec: Dict[str, float], sec_info: Optional[Dict[str, Any]]) -> float:
+    """Área de corte aproximada [mm²]: d*tw para perfiles W, 0.6*A en otro caso"""
+    if sec_info and sec_info.get("type") == "W":
+        return sec["d"] * sec_info.get("tw", 6)  # mm²
+    return 0.6 * sec["A"]  # Aproximación
+
+
+@lru_cache(maxsize=1024)
+def _aisc_section(section_id: str) -> _AISCSection:
+    """Propiedades de verificación de un perfil (catálogo estático, memoizado)"""
+    sec = get_section_properties_mm(section_id)
+    sec_info = get_section_by_id(section_id)
+    return _AISCSection(
+        A=sec["A"],
+        Zx=sec["Zx"],
+        Sx=sec["Sx"],
+        rx=sec["rx"],
+        ry=sec.get("ry", sec.get("rx", 0)),  # usar rx como fallback
+        Aw=_shear_area(sec, sec_info),
+        is_W=bool(sec_info and sec_info.get("type") == "W"),
+    )
+
+
+# ==================== VIGAS (AISC F y G) ====================
+
+# Zonas de flexión; el núcleo vectorizado las devuelve como índice en esta tupla
+BEAM_ZONES = ("plastic", "inelastic", "elastic_LTB")
+
+
+def verify_beams_aisc_batch(
+    Mu: np.ndarray,
+    Vu: np.ndarray,
+    Zx: np.ndarray,
+    Sx: np.ndarray,
+    ry: np.ndarray,
+    Aw: np.ndarray,
+    is_W: np.ndarray,
+    Lb: np.ndarray,
+    Fy: float,
+    E: float,
+    Cb: float = 1.0
+) -> Dict[str, np.ndarray]:
     """
-    Verificar viga según AISC 360 Capítulo F y G
-    
+    Versión vectorizada de verify_beam_aisc (flexión y corte), mismas fórmulas
+
+    Todos los argumentos salvo el material aceptan escalares o arreglos que
+    se combinan por broadcasting (p. ej. una demanda contra muchas secciones).
+    No arma diccionarios ni redondea.
+
     Args:
-        Mu: Momento último demandado [kN·m]
-        Vu: Corte último demandado [kN]
-        L: Longitud de la viga [m]
-        delta_max: Deflexión máxima [m]
-        section_id: ID del perfil
-        material_id: ID del material
-        units: Sistema de unidades
+        Mu, Vu: Momento [kN·m] y corte [kN] últimos
+        Zx, Sx: Módulos plástico y elástico [mm³]
+        ry: Radio de giro para pandeo lateral-torsional [mm]
+        Aw: Área de corte [mm²]
+        is_W: True para perfiles W (define el Lr aproximado)
         Lb: Longitud no arriostrada lateral [m]
+        Fy, E: Propiedades del material [MPa]
         Cb: Factor de modificación por gradiente de momento
-    
+
     Returns:
-        Diccionario con resultados de verificación
+        Dict de arreglos: Mp, Lp, Lr [mm], zone (índice en BEAM_ZONES),
+        phi_Mn, ratio_moment, phi_Vn, ratio_shear
     """
-    
-    # Obtener propiedades
-    mat = get_material_properties(material_id)
-    sec = get_section_properties(section_id)
-    sec_info = get_section_by_id(section_id)
-    
-    Fy = mat["Fy"]  # MPa
-    E = mat["E"]    # MPa
-    
-    # Propiedades de sección en unidades consistentes
-    Zx = sec["Zx"] * 1e9  # m³ -> mm³
-    Sx = sec["Sx"] * 1e9  # m³ -> mm³
-    ry = sec.get("ry", sec.get("rx", 0)) * 1e3  # m -> mm, usar rx como fallback
-    d = sec["d"] * 1e3    # m -> mm
-    
+    Zx = np.asarray(Zx, dtype=np.float64)
+    Sx = np.asarray(Sx, dtype=np.float64)
+    ry = np.asarray(ry, dtype=np.float64)
+
     # Momento plástico
     Mp = Fy * Zx / 1e6  # kN·m
-    
-    # Longitud no arriostrada
-    if Lb is None:
-        Lb = L
-    Lb_mm = Lb * 1000  # m -> mm
-    
-    # Longitudes límite (simplificado para perfiles compactos)
-    Lp = 1.76 * ry * math.sqrt(E / Fy)  # mm
-    
-    # Lr aproximado para perfiles I
-    if sec_info and sec_info.get("type") == "W":
-        # Aproximación conservadora
-        Lr = 3.5 * ry * math.sqrt(E / Fy)  # mm
-    else:
-        Lr = 2.5 * ry * math.sqrt(E / Fy)  # mm
-    
-    # Capacidad a flexión según zona
+    Lb_mm = np.asarray(Lb, dtype=np.float64) * 1000  # m -> mm
+
+    # Longitudes límite (simplificado para perfiles compactos; Lr aproximado
+    # y conservador para perfiles I)
+    sqrt_E_Fy = math.sqrt(E / Fy)
+    Lp = 1.76 * ry * sqrt_E_Fy  # mm
+    Lr = np.where(is_W, 3.5, 2.5) * ry * sqrt_E_Fy  # mm
+
+    # Capacidad a flexión según zona (se evalúan las tres y se elige por zona)
     phi_b = 0.90
-    
-    if Lb_mm <= Lp:
-        # Zona plástica
-        Mn = Mp
-        zone = "plastic"
-    elif Lb_mm <= Lr:
+    plastic = Lb_mm <= Lp
+    inelastic = ~plastic & (Lb_mm <= Lr)
+    zone = np.where(plastic, 0, np.where(inelastic, 1, 2))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
         # Zona inelástica
         Mr = 0.7 * Fy * Sx / 1e6  # kN·m
-        Mn = Cb * (Mp - (Mp - Mr) * (Lb_mm - Lp) / (Lr - Lp))
-        Mn = min(Mn, Mp)
-        zone = "inelastic"
-    else:
+        Mn_inelastic = Cb * (Mp - (Mp - Mr) * (Lb_mm - Lp) / (Lr - Lp))
         # Zona elástica (pandeo lateral-torsional)
         Fe = Cb * math.pi**2 * E / (Lb_mm / ry)**2  # MPa
-        Mn = Fe * Sx / 1e6  # kN·m
-        Mn = min(Mn, Mp)
-        zone = "elastic_LTB"
-    
-    phi_Mn = phi_b * Mn
+        Mn_elastic = Fe * Sx / 1e6  # kN·m
 
-    # Verificación a flexión
-    ratio_moment = abs(Mu) / phi_Mn if phi_Mn > 0 else 9999.0
-    flex_ok = ratio_moment <= 1.0
-    
-    # Capacidad a corte (AISC G2)
-    phi_v = 0.90
-    
-    # Área de corte aproximada
-    if sec_info and sec_info.get("type") == "W":
-        tf = sec_info.get("tf", 10)  # mm
-        tw = sec_info.get("tw", 6)   # mm
-        Aw = d * tw  # mm²
-    else:
-        A = sec["A"] * 1e6  # m² -> mm²
-        Aw = 0.6 * A  # Aproximación
-    
-    # Cv1 = 1.0 para la mayoría de perfiles laminados
-    Cv1 = 1.0
-    Vn = 0.6 * Fy * Aw * Cv1 / 1e3  # kN
-    phi_Vn = phi_v * Vn
+        # Tope Mp común a las tres zonas (en la plástica no cambia nada)
+        Mn = np.minimum(
+            np.select([plastic, inelastic], [Mp, Mn_inelastic], default=Mn_elastic), Mp
+        )
+        phi_Mn = phi_b * Mn
 
-    # Verificación a corte
-    ratio_shear = abs(Vu) / phi_Vn if phi_Vn > 0 else 9999.0
-    shear_ok = ratio_shear <= 1.0
-    
-    # Verificación de deflexión
+        # Verificación a flexión
+        ratio_moment = np.where(phi_Mn > 0, np.abs(Mu) / phi_Mn, 9999.0)
+
+        # Capacidad a corte (AISC G2); Cv1 = 1.0 para la mayoría de perfiles laminados
+        phi_v = 0.90
+        Cv1 = 1.0
+        Vn = 0.6 * Fy * np.asarray(Aw, dtype=np.float64) * Cv1 / 1e3  # kN
+        phi_Vn = phi_v * Vn
+
+        # Verificación a corte
+        ratio_shear = np.where(phi_Vn > 0, np.abs(Vu) / phi_Vn, 9999.0)
+
+    return {
+        "Mp": Mp,
+        "Lp": Lp,
+        "Lr": Lr,
+        "zone": zone,
+        "phi_Mn": phi_Mn,
+        "ratio_moment": ratio_moment,
+        "phi_Vn": phi_Vn,
+        "ratio_shear": ratio_shear,
+    }
+
+
+# Límites de deflexión L/n (L/180 para carga viva de servicio)
+DEFLECTION_LIMITS = (180, 240, 360)
+_DEFLECTION_LABELS = tuple(f"L/{n}" for n in DEFLECTION_LIMITS)
+
+
+def _deflection_checks(L: float, delta_max: float) -> Dict[str, Dict[str, Any]]:
+    """Verificación de deflexión contra cada límite de DEFLECTION_LIMITS"""
     L_mm = L * 1000
-    delta_limit_L180 = L_mm / 180  # mm (carga viva servicio)
-    delta_limit_L240 = L_mm / 240  # mm
-    delta_limit_L360 = L_mm / 360  # mm
     delta_max_mm = abs(delta_max) * 1000  # m -> mm
-    
-    deflection_checks = {
-        "L/180": {
-            "limit": delta_limit_L180,
-            "actual": delta_max_mm,
-            "ok": delta_max_mm <= delta_limit_L180
-        },
-        "L/240": {
-            "limit": delta_limit_L240,
-            "actual": delta_max_mm,
-            "ok": delta_max_mm <= delta_limit_L240
-        },
-        "L/360": {
-            "limit": delta_limit_L360,
+
+    checks = {}
+    for label, n in zip(_DEFLECTION_LABELS, DEFLECTION_LIMITS):
+        limit = L_mm / n  # mm
+        checks[label] = {
+            "limit": limit,
             "actual": delta_max_mm,
-            "ok": delta_max_mm <= delta_limit_L360
+            "ok": delta_max_mm <= limit
         }
-    }
-    
+    return checks
+
+
+def _beam_result(
+    Mu: float,
+    Vu: float,
+    L: float,
+    Lb: float,
+    delta_max: float,
+    Mp: float,
+    Lp: float,
+    Lr: float,
+    zone: int,
+    phi_Mn: float,
+    ratio_moment: float,
+    phi_Vn: float,
+    ratio_shear: float
+) -> Dict[str, Any]:
+    """Diccionario de resultados de verify_beam_aisc a partir de valores escalares"""
+    flex_ok = ratio_moment <= 1.0
+    shear_ok = ratio_shear <= 1.0
+
     return {
         "flexure": {
             "Mu": Mu,
@@ -149,7 +219,7 @@ def verify_beam_aisc(
             "ratio": round(ratio_moment, 3),
             "utilization": round(ratio_moment * 100, 1),
             "ok": flex_ok,
-            "zone": zone,
+            "zone": BEAM_ZONES[zone],
             "Lb": Lb,
             "Lp": Lp / 1000,  # mm -> m
             "Lr": Lr / 1000   # mm -> m
@@ -161,100 +231,344 @@ def verify_beam_aisc(
             "utilization": round(ratio_shear * 100, 1),
             "ok": shear_ok
         },
-        "deflection": deflection_checks,
+        "deflection": _deflection_checks(L, delta_max),
         "overall_ok": flex_ok and shear_ok,
         "governing": "flexure" if ratio_moment > ratio_shear else "shear"
     }
 
 
-def verify_column_aisc(
-    Pu: float,
-    Mu_top: float,
-    Mu_base: float,
+class _BeamCapacity(NamedTuple):
+    """Términos de verify_beam_aisc que no dependen de la demanda ni de Lb"""
+    Mp: float       # kN·m
+    Mr: float       # kN·m (0.7·Fy·Sx)
+    Lp: float       # mm
+    Lr: float       # mm
+    phi_Vn: float   # kN
+    Sx: float       # mm³
+    ry: float       # mm
+    E: float        # MPa
+
+
+@lru_cache(maxsize=1024)
+def _beam_capacity(section_id: str, material_id: str) -> _BeamCapacity:
+    """Capacidades de un par (perfil, material), memoizadas para barridos de demanda"""
+    mat = _material_consts(material_id)
+    _, Zx, Sx, _, ry, Aw, is_W = _aisc_section(section_id)
+    Fy = mat.Fy  # MPa
+
+    # Momento plástico
+    Mp = Fy * Zx / 1e6  # kN·m
+    Mr = mat.FL * Sx / 1e6  # kN·m
+
+    # Longitudes límite (simplificado para perfiles compactos)
+    Lp = 1.76 * ry * mat.sqrt_E_Fy  # mm
+    
+    # Lr aproximado para perfiles I
+    if is_W:
+        # Aproximación conservadora
+        Lr = 3.5 * ry * mat.sqrt_E_Fy  # mm
+    else:
+        Lr = 2.5 * ry * mat.sqrt_E_Fy  # mm
+
+    # Capacidad a corte (AISC G2)
+    phi_v = 0.90
+    
+    # Cv1 = 1.0 para la mayoría de perfiles laminados
+    Cv1 = 1.0
+    Vn = 0.6 * Fy * Aw * Cv1 / 1e3  # kN
+    phi_Vn = phi_v * Vn
+
+    return _BeamCapacity(Mp, Mr, Lp, Lr, phi_Vn, Sx, ry, mat.E)
+
+
+def _beam_core(
+    cap: _BeamCapacity,
+    Mu: float,
+    Vu: float,
+    Lb: float,
+    Cb: float
+) -> Tuple[float, float, float, int, float, float, float, float]:
+    """
+    Aritmética de verify_beam_aisc que depende de la demanda y de Lb
+
+    Returns:
+        (Mp, Lp, Lr, zone, phi_Mn, ratio_moment, phi_Vn, ratio_shear), en
+        el orden de _beam_result (zone es índice en BEAM_ZONES)
+    """
+    Mp, Mr, Lp, Lr, phi_Vn, Sx, ry, E = cap
+
+    # Longitud no arriostrada
+    Lb_mm = Lb * 1000  # m -> mm
+    
+    # Capacidad a flexión según zona
+    phi_b = 0.90
+    
+    if Lb_mm <= Lp:
+        # Zona plástica
+        Mn = Mp
+        zone = 0
+    elif Lb_mm <= Lr:
+        # Zona inelástica
+        Mn = Cb * (Mp - (Mp - Mr) * (Lb_mm - Lp) / (Lr - Lp))
+        Mn = min(Mn, Mp)
+        zone = 1
+    else:
+        # Zona elástica (pandeo lateral-torsional)
+        Fe = Cb * _PI2 * E / (Lb_mm / ry)**2  # MPa
+        Mn = Fe * Sx / 1e6  # kN·m
+        Mn = min(Mn, Mp)
+        zone = 2
+    
+    phi_Mn = phi_b * Mn
+
+    # Verificación a flexión
+    ratio_moment = abs(Mu) / phi_Mn if phi_Mn > 0 else 9999.0
+
+    # Verificación a corte
+    ratio_shear = abs(Vu) / phi_Vn if phi_Vn > 0 else 9999.0
+    
+    return Mp, Lp, Lr, zone, phi_Mn, ratio_moment, phi_Vn, ratio_shear
+
+
+def verify_beam_aisc(
+    Mu: float,
+    Vu: float,
     L: float,
-    K: float,
+    delta_max: float,
     section_id: str,
     material_id: str,
-    units: str = "kN-m"
+    units: str = "kN-m",
+    Lb: float = None,  # Longitud no arriostrada (si None = L)
+    Cb: float = 1.0    # Factor de momento
 ) -> Dict[str, Any]:
     """
-    Verificar columna según AISC 360 Capítulo E y H
+    Verificar viga según AISC 360 Capítulo F y G
     
     Args:
-        Pu: Carga axial última [kN] (positivo = compresión)
-        Mu_top: Momento en tope [kN·m]
-        Mu_base: Momento en base [kN·m]
-        L: Altura de la columna [m]
-        K: Factor de longitud efectiva
+        Mu: Momento último demandado [kN·m]
+        Vu: Corte último demandado [kN]
+        L: Longitud de la viga [m]
+        delta_max: Deflexión máxima [m]
         section_id: ID del perfil
         material_id: ID del material
         units: Sistema de unidades
+        Lb: Longitud no arriostrada lateral [m]
+        Cb: Factor de modificación por gradiente de momento
     
     Returns:
         Diccionario con resultados de verificación
     """
     
-    mat = get_material_properties(material_id)
-    sec = get_section_properties(section_id)
-    sec_info = get_section_by_id(section_id)
+    # Capacidades del par perfil-material (memoizadas)
+    cap = _beam_capacity(section_id, material_id)
     
-    Fy = mat["Fy"]  # MPa
-    E = mat["E"]    # MPa
-    
-    A = sec["A"] * 1e6       # m² -> mm²
-    Zx = sec["Zx"] * 1e9     # m³ -> mm³
-    rx = sec["rx"] * 1e3     # m -> mm
-    ry = sec["ry"] * 1e3     # m -> mm
+    # Longitud no arriostrada
+    if Lb is None:
+        Lb = L
     
-    # Longitud efectiva
-    KL = K * L * 1000  # mm
+    return _beam_result(
+        Mu, Vu, L, Lb, delta_max, *_beam_core(cap, Mu, Vu, Lb, Cb)
+    )
+
+
+def verify_beams_aisc(
+    Mu: float,
+    Vu: float,
+    L: float,
+    delta_max: float,
+    section_ids: List[str],
+    material_id: str,
+    units: str = "kN-m",
+    Lb: float = None,
+    Cb: float = 1.0
+) -> List[Dict[str, Any]]:
+    """
+    verify_beam_aisc para varios perfiles con la misma demanda
+
+    Las propiedades se reúnen en arreglos y las capacidades se calculan de
+    una vez con verify_beams_aisc_batch; los diccionarios se arman al final.
+    Mismos argumentos que verify_beam_aisc, con una lista de IDs de perfil.
+
+    Returns:
+        Lista de resultados, en el orden de section_ids
+    """
     
+    # Obtener propiedades
+    mat = _material_consts(material_id)
+
+    if not section_ids:
+        return []
+
+    # Longitud no arriostrada
+    if Lb is None:
+        Lb = L
+
+    batch = _beams_batch(Mu, Vu, section_ids, mat, Lb, Cb)
+    columns = [
+        batch[key].tolist()
+        for key in ("Mp", "Lp", "Lr", "zone", "phi_Mn", "ratio_moment", "phi_Vn", "ratio_shear")
+    ]
+    return [_beam_result(Mu, Vu, L, Lb, delta_max, *values) for values in zip(*columns)]
+
+
+def _beams_batch(
+    Mu: float,
+    Vu: float,
+    section_ids: List[str],
+    mat: _MaterialConsts,
+    Lb: float,
+    Cb: float
+) -> Dict[str, np.ndarray]:
+    """verify_beams_aisc_batch sobre una lista de perfiles (arreglos de largo n)"""
+    # Propiedades de sección (memoizadas, ya en mm) como columnas
+    _, Zx, Sx, _, ry, Aw, is_W = zip(*[_aisc_section(section_id) for section_id in section_ids])
+    batch = verify_beams_aisc_batch(Mu, Vu, Zx, Sx, ry, Aw, is_W, Lb, mat.Fy, mat.E, Cb)
+    n = len(section_ids)
+    return {key: np.broadcast_to(values, (n,)) for key, values in batch.items()}
+
+
+# Resumen por perfil de verify_beams_aisc_records (un registro por perfil)
+BEAM_RECORD_DTYPE = np.dtype([
+    ("phi_Mn", "f8"),        # kN·m
+    ("phi_Vn", "f8"),        # kN
+    ("ratio_moment", "f8"),
+    ("ratio_shear", "f8"),
+    ("zone", "u1"),          # índice en BEAM_ZONES
+    ("ok", "?"),             # flexión y corte cumplen
+])
+
+
+def verify_beams_aisc_records(
+    Mu: float,
+    Vu: float,
+    L: float,
+    section_ids: List[str],
+    material_id: str,
+    Lb: float = None,
+    Cb: float = 1.0
+) -> np.ndarray:
+    """
+    Capacidades y ratios de varios perfiles como un arreglo estructurado
+
+    Para barridos de perfiles que solo necesitan ratios y estados: no arma
+    diccionarios ni redondea (eso queda para la capa de presentación). El
+    detalle completo de un perfil se obtiene con verify_beam_aisc.
+
+    Returns:
+        Arreglo de dtype BEAM_RECORD_DTYPE, en el orden de section_ids
+    """
+    mat = _material_consts(material_id)
+    records = np.zeros(len(section_ids), dtype=BEAM_RECORD_DTYPE)
+    if not section_ids:
+        return records
+
+    batch = _beams_batch(Mu, Vu, section_ids, mat, L if Lb is None else Lb, Cb)
+    for name in ("phi_Mn", "phi_Vn", "ratio_moment", "ratio_shear", "zone"):
+        records[name] = batch[name]
+    records["ok"] = (batch["ratio_moment"] <= 1.0) & (batch["ratio_shear"] <= 1.0)
+    return records
+
+
+# ==================== COLUMNAS (AISC E y H) ====================
+
+def verify_columns_aisc_batch(
+    Pu: np.ndarray,
+    Mu: np.ndarray,
+    KL: np.ndarray,
+    A: np.ndarray,
+    Zx: np.ndarray,
+    rx: np.ndarray,
+    ry: np.ndarray,
+    Fy: float,
+    E: float
+) -> Dict[str, np.ndarray]:
+    """
+    Versión vectorizada de verify_column_aisc (compresión, flexión e interacción)
+
+    Sin ramas por elemento: las dos formas de Fcr (AISC E3) y de la
+    interacción (H1-1a / H1-1b) se evalúan para todos y se elige con
+    np.where. Los argumentos aceptan escalares o arreglos (broadcasting).
+    np.power puede diferir de ** en el último bit.
+
+    Args:
+        Pu: Carga axial última [kN]
+        Mu: Momento último (máximo de los extremos, en valor absoluto) [kN·m]
+        KL: Longitud efectiva [mm]
+        A, Zx: Área [mm²] y módulo plástico [mm³]
+        rx, ry: Radios de giro [mm]
+        Fy, E: Propiedades del material [MPa]
+
+    Returns:
+        Dict de arreglos: lambda_c, lambda_limit, Fe, Fcr, Pn, phi_Pn,
+        ratio_axial, phi_Mn, ratio_moment, use_h1a, interaction
+    """
     # Esbeltez (usar el eje menor)
-    r_min = min(rx, ry)
-    lambda_c = KL / r_min
-    
+    r_min = np.minimum(rx, ry)
+    lambda_c = np.asarray(KL, dtype=np.float64) / r_min
+    if np.any(lambda_c == 0):
+        raise ValueError("Longitud efectiva KL nula: la tensión de Euler no está definida")
+
     # Esbeltez límite
     lambda_limit = 4.71 * math.sqrt(E / Fy)
-    
-    # Tensión de Euler
-    Fe = math.pi**2 * E / lambda_c**2  # MPa
-    
-    # Tensión crítica de pandeo (AISC E3)
-    if lambda_c <= lambda_limit:
-        # Pandeo inelástico
-        Fcr = (0.658 ** (Fy / Fe)) * Fy
-    else:
-        # Pandeo elástico
-        Fcr = 0.877 * Fe
-    
-    # Capacidad a compresión
-    phi_c = 0.90
-    Pn = Fcr * A / 1e3  # kN
-    phi_Pn = phi_c * Pn
 
-    # Verificación a compresión pura
-    ratio_axial = abs(Pu) / phi_Pn if phi_Pn > 0 else 9999.0
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        # Tensión de Euler
+        Fe = math.pi**2 * E / lambda_c**2  # MPa
+
+        # Tensión crítica de pandeo (AISC E3): inelástico / elástico
+        Fcr = np.where(lambda_c <= lambda_limit, np.power(0.658, Fy / Fe) * Fy, 0.877 * Fe)
+
+        # Capacidad a compresión
+        phi_c = 0.90
+        Pn = Fcr * np.asarray(A, dtype=np.float64) / 1e3  # kN
+        phi_Pn = phi_c * Pn
+        ratio_axial = np.where(phi_Pn > 0, np.abs(Pu) / phi_Pn, 9999.0)
+
+        # Capacidad a flexión (simplificada, conservador: asumir arriostrado)
+        phi_b = 0.90
+        phi_Mn = phi_b * (Fy * np.asarray(Zx, dtype=np.float64) / 1e6)  # kN·m
+        ratio_moment = np.where(phi_Mn > 0, Mu / phi_Mn, 0.0)
+
+    # Interacción flexo-compresión (AISC H1): ambas ecuaciones, sin ramas
+    use_h1a = ratio_axial >= 0.2
+    interaction = np.where(
+        use_h1a,
+        ratio_axial + (8/9) * ratio_moment,   # H1-1a
+        ratio_axial / 2 + ratio_moment        # H1-1b
+    )
+
+    return {
+        "lambda_c": lambda_c,
+        "lambda_limit": lambda_limit,
+        "Fe": Fe,
+        "Fcr": Fcr,
+        "Pn": Pn,
+        "phi_Pn": phi_Pn,
+        "ratio_axial": ratio_axial,
+        "phi_Mn": phi_Mn,
+        "ratio_moment": ratio_moment,
+        "use_h1a": use_h1a,
+        "interaction": interaction,
+    }
+
+
+def _column_result(
+    Pu: float,
+    Mu: float,
+    lambda_c: float,
+    lambda_limit: float,
+    Fe: float,
+    Fcr: float,
+    Pn: float,
+    phi_Pn: float,
+    ratio_axial: float,
+    phi_Mn: float,
+    ratio_moment: float,
+    interaction: float,
+    governing_axis: str
+) -> Dict[str, Any]:
+    """Diccionario de resultados de verify_column_aisc a partir de valores escalares"""
     compression_ok = ratio_axial <= 1.0
-    
-    # Capacidad a flexión (simplificada)
-    phi_b = 0.90
-    Mp = Fy * Zx / 1e6  # kN·m
-    phi_Mn = phi_b * Mp  # Conservador: asumir arriostrado
-    
-    Mu = max(abs(Mu_top), abs(Mu_base))
-    ratio_moment = Mu / phi_Mn if phi_Mn > 0 else 0
-    
-    # Interacción flexo-compresión (AISC H1)
-    Pr_Pc = ratio_axial
-    Mr_Mc = ratio_moment
-    
-    if Pr_Pc >= 0.2:
-        # Ecuación H1-1a
-        interaction = Pr_Pc + (8/9) * Mr_Mc
-    else:
-        # Ecuación H1-1b
-        interaction = Pr_Pc / 2 + Mr_Mc
-    
     interaction_ok = interaction <= 1.0
     
     return {
@@ -271,7 +585,7 @@ def verify_column_aisc(
         "slenderness": {
             "KL_r": round(lambda_c, 1),
             "limit": round(lambda_limit, 1),
-            "governing_axis": "y" if ry < rx else "x"
+            "governing_axis": governing_axis
         },
         "flexure": {
             "Mu": Mu,
@@ -280,9 +594,9 @@ def verify_column_aisc(
             "utilization": round(ratio_moment * 100, 1)
         },
         "interaction": {
-            "equation": "H1-1a" if Pr_Pc >= 0.2 else "H1-1b",
-            "Pr_Pc": round(Pr_Pc, 3),
-            "Mr_Mc": round(Mr_Mc, 3),
+            "equation": "H1-1a" if ratio_axial >= 0.2 else "H1-1b",
+            "Pr_Pc": round(ratio_axial, 3),
+            "Mr_Mc": round(ratio_moment, 3),
             "value": round(interaction, 3),
             "utilization": round(interaction * 100, 1),
             "ok": interaction_ok
@@ -290,3 +604,176 @@ def verify_column_aisc(
         "overall_ok": interaction_ok,
         "governing": "interaction"
     }
+
+
+class _ColumnCapacity(NamedTuple):
+    """Términos de verify_column_aisc que no dependen de la demanda ni de KL"""
+    A: float              # mm²
+    r_min: float          # mm (eje menor)
+    phi_Mn: float         # kN·m
+    Fy: float             # MPa
+    pi2_E: float          # MPa
+    lambda_limit: float
+    governing_axis: str
+
+
+@lru_cache(maxsize=1024)
+def _column_capacity(section_id: str, material_id: str) -> _ColumnCapacity:
+    """Capacidades de un par (perfil, material), memoizadas para barridos de demanda"""
+    mat = _material_consts(material_id)
+    A, Zx, _, rx, ry, _, _ = _aisc_section(section_id)
+
+    # Capacidad a flexión (simplificada)
+    phi_b = 0.90
+    Mp = mat.Fy * Zx / 1e6  # kN·m
+    phi_Mn = phi_b * Mp  # Conservador: asumir arriostrado
+
+    return _ColumnCapacity(
+        A, min(rx, ry), phi_Mn, mat.Fy, mat.pi2_E, mat.lambda_limit,
+        "y" if ry < rx else "x"
+    )
+
+
+def _column_core(
+    cap: _ColumnCapacity,
+    Pu: float,
+    Mu: float,
+    KL: float
+) -> Tuple[float, float, float, float, float, float, float, float, float, float]:
+    """
+    Aritmética de verify_column_aisc que depende de la demanda y de KL
+
+    Returns:
+        (lambda_c, lambda_limit, Fe, Fcr, Pn, phi_Pn, ratio_axial, phi_Mn,
+        ratio_moment, interaction), en el orden de _column_result
+    """
+    A, r_min, phi_Mn, Fy, pi2_E, lambda_limit, _ = cap
+
+    # Esbeltez (usar el eje menor)
+    lambda_c = KL / r_min
+    if lambda_c == 0:
+        raise ValueError("Longitud efectiva KL nula: la tensión de Euler no está definida")
+    
+    # Tensión de Euler
+    Fe = pi2_E / lambda_c**2  # MPa
+    
+    # Tensión crítica de pandeo (AISC E3)
+    if lambda_c <= lambda_limit:
+        # Pandeo inelástico
+        Fcr = (0.658 ** (Fy / Fe)) * Fy
+    else:
+        # Pandeo elástico
+        Fcr = 0.877 * Fe
+    
+    # Capacidad a compresión
+    phi_c = 0.90
+    Pn = Fcr * A / 1e3  # kN
+    phi_Pn = phi_c * Pn
+
+    # Verificación a compresión pura
+    ratio_axial = abs(Pu) / phi_Pn if phi_Pn > 0 else 9999.0
+    
+    # Verificación a flexión (phi_Mn memoizado por perfil y material)
+    ratio_moment = Mu / phi_Mn if phi_Mn > 0 else 0
+    
+    # Interacción flexo-compresión (AISC H1)
+    Pr_Pc = ratio_axial
+    Mr_Mc = ratio_moment
+    
+    if Pr_Pc >= 0.2:
+        # Ecuación H1-1a
+        interaction = Pr_Pc + (8/9) * Mr_Mc
+    else:
+        # Ecuación H1-1b
+        interaction = Pr_Pc / 2 + Mr_Mc
+    
+    return (
+        lambda_c, lambda_limit, Fe, Fcr, Pn, phi_Pn, ratio_axial,
+        phi_Mn, ratio_moment, interaction
+    )
+
+
+def verify_column_aisc(
+    Pu: float,
+    Mu_top: float,
+    Mu_base: float,
+    L: float,
+    K: float,
+    section_id: str,
+    material_id: str,
+    units: str = "kN-m"
+) -> Dict[str, Any]:
+    """
+    Verificar columna según AISC 360 Capítulo E y H
+    
+    Args:
+        Pu: Carga axial última [kN] (positivo = compresión)
+        Mu_top: Momento en tope [kN·m]
+        Mu_base: Momento en base [kN·m]
+        L: Altura de la columna [m]
+        K: Factor de longitud efectiva
+        section_id: ID del perfil
+        material_id: ID del material
+        units: Sistema de unidades
+    
+    Returns:
+        Diccionario con resultados de verificación
+    """
+    
+    # Capacidades del par perfil-material (memoizadas)
+    cap = _column_capacity(section_id, material_id)
+    
+    # Longitud efectiva
+    KL = K * L * 1000  # mm
+    
+    Mu = max(abs(Mu_top), abs(Mu_base))
+    
+    return _column_result(Pu, Mu, *_column_core(cap, Pu, Mu, KL), cap.governing_axis)
+
+
+def verify_columns_aisc(
+    Pu: float,
+    Mu_top: float,
+    Mu_base: float,
+    L: float,
+    K: float,
+    section_ids: List[str],
+    material_id: str,
+    units: str = "kN-m"
+) -> List[Dict[str, Any]]:
+    """
+    verify_column_aisc para varios perfiles con la misma demanda
+
+    Las capacidades se calculan de una vez con verify_columns_aisc_batch;
+    los diccionarios se arman al final. Mismos argumentos que
+    verify_column_aisc, con una lista de IDs de perfil.
+
+    Returns:
+        Lista de resultados, en el orden de section_ids
+    """
+    mat = _material_consts(material_id)
+
+    if not section_ids:
+        return []
+
+    # Propiedades de sección (memoizadas, ya en mm) como columnas
+    A, Zx, _, rx, ry, _, _ = (
+        np.array(values) for values in zip(*[_aisc_section(section_id) for section_id in section_ids])
+    )
+
+    Mu = max(abs(Mu_top), abs(Mu_base))
+    batch = verify_columns_aisc_batch(Pu, Mu, K * L * 1000, A, Zx, rx, ry, mat.Fy, mat.E)
+
+    n = len(section_ids)
+    columns = [
+        np.broadcast_to(batch[key], (n,)).tolist()
+        for key in (
+            "lambda_c", "lambda_limit", "Fe", "Fcr", "Pn", "phi_Pn",
+            "ratio_axial", "phi_Mn", "ratio_moment", "interaction"
+        )
+    ]
+    axes = np.where(ry < rx, "y", "x").tolist()
+    return [
+        _column_result(Pu, Mu, *values, axis)
+        for *values, axis in zip(*columns, axes)
+    ]
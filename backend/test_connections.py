@@ -0,0 +1,68 @@
+"""
+Pruebas de la verificación de pernos en lote (AISC J3-3a)
+
+La versión vectorizada se compara con verify_bolt_combined, que es la que
+usa la API.
+"""
+
+import random
+
+import numpy as np
+
+from engine.connections import (
+    BOLT_DIAMETERS,
+    BOLT_PROPERTIES,
+    bolt_ids,
+    verify_bolt_combined,
+    verify_bolt_combined_batch,
+)
+
+
+def test_bolt_combined_batch_matches_scalar():
+    """verify_bolt_combined_batch coincide con verify_bolt_combined en 500 configuraciones"""
+    rng = random.Random(3)
+    n = 500
+    grades = [rng.choice(list(BOLT_PROPERTIES)) for _ in range(n)]
+    diameters = [rng.choice(list(BOLT_DIAMETERS)) for _ in range(n)]
+    num_bolts = [rng.randint(1, 16) for _ in range(n)]
+    Vu = [rng.uniform(-500, 500) for _ in range(n)]
+    Tu = [rng.uniform(-500, 500) for _ in range(n)]
+    shear_planes = [rng.choice([1, 2]) for _ in range(n)]
+
+    grade_ids, dia_ids = bolt_ids(grades, diameters)
+    batch = verify_bolt_combined_batch(
+        grade_ids, dia_ids, np.array(num_bolts), np.array(Vu), np.array(Tu), np.array(shear_planes)
+    )
+
+    for k in range(n):
+        expected = verify_bolt_combined(grades[k], diameters[k], num_bolts[k], Vu[k], Tu[k], shear_planes[k])
+        where = (grades[k], diameters[k], num_bolts[k], Vu[k], Tu[k], shear_planes[k])
+        assert round(float(batch["interaction"][k]), 3) == expected["interaction"]["value"], where
+        assert bool(batch["ok"][k]) == expected["overall_ok"], where
+        assert round(float(batch["frv"][k]), 2) == expected["stresses"]["frv"], where
+        assert round(float(batch["frt"][k]), 2) == expected["stresses"]["frt"], where
+        assert float(batch["phi_Fnv"][k]) == expected["stresses"]["phi_Fnv"], where
+        assert float(batch["phi_Fnt"][k]) == expected["stresses"]["phi_Fnt"], where
+
+
+def test_bolt_ids_rejects_unknown():
+    """bolt_ids rechaza grados y diámetros que no están en las tablas"""
+    diameter = next(iter(BOLT_DIAMETERS))
+    grade = next(iter(BOLT_PROPERTIES))
+    for grades, diameters, fragment in (
+        (["A999"], [diameter], "Grado"),
+        ([grade], ["M99"], "Diametro"),
+    ):
+        try:
+            bolt_ids(grades, diameters)
+        except ValueError as e:
+            assert fragment in str(e)
+        else:
+            raise AssertionError("se esperaba ValueError")
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✓ {name}")
@@ -0,0 +1,85 @@
+"""
+Pruebas de la evaluación de combinaciones de carga por lotes
+
+apply_combinations_batch y critical_batch se comparan con las funciones
+escalares que usa la API (apply_combination, get_critical_combination).
+"""
+
+import math
+import random
+
+import numpy as np
+
+from engine.load_combinations import (
+    COMBINATION_LOAD_TYPES,
+    apply_combination,
+    apply_combinations_batch,
+    build_load_matrix,
+    critical_batch,
+    get_combinations,
+    get_critical_combination,
+)
+
+
+def _random_loads(rng: random.Random, n: int):
+    """Escenarios de carga al azar (incluye tipos que no entran en las combinaciones)"""
+    types = list(COMBINATION_LOAD_TYPES) + ["R", "T"]
+    return [
+        {load_type: rng.uniform(-50, 80) for load_type in rng.sample(types, rng.randint(1, len(types)))}
+        for _ in range(n)
+    ]
+
+
+def test_batch_matches_scalar():
+    """Valores y combinación crítica coinciden con las funciones escalares"""
+    rng = random.Random(7)
+    loads_list = _random_loads(rng, 300)
+    loads_array = build_load_matrix(loads_list)
+    assert loads_array.shape == (len(loads_list), len(COMBINATION_LOAD_TYPES))
+
+    for method in ("LRFD", "ASD"):
+        combinations = get_combinations(method)
+        values = apply_combinations_batch(loads_array, method)
+        assert values.shape == (len(loads_list), len(combinations))
+        for k, loads in enumerate(loads_list):
+            for j, combo in enumerate(combinations):
+                assert math.isclose(values[k, j], apply_combination(loads, combo),
+                                    rel_tol=1e-12, abs_tol=1e-12), (method, k, j)
+
+        for maximize in (True, False):
+            idx, critical = critical_batch(loads_array, method, maximize)
+            for k, loads in enumerate(loads_list):
+                combo, value = get_critical_combination(loads, method, maximize)
+                assert combinations[idx[k]] is combo, (method, maximize, k)
+                assert math.isclose(critical[k], value, rel_tol=1e-12, abs_tol=1e-12), (method, maximize, k)
+
+
+def test_batch_empty():
+    """Una lista vacía de escenarios da resultados vacíos"""
+    loads_array = build_load_matrix([])
+    assert loads_array.shape == (0, len(COMBINATION_LOAD_TYPES))
+    assert apply_combinations_batch(loads_array).shape == (0, len(get_combinations("LRFD")))
+    idx, critical = critical_batch(loads_array)
+    assert idx.shape == (0,) and critical.shape == (0,)
+
+
+def test_batch_rejects_wrong_shape():
+    """Matrices con otra forma o un método desconocido se rechazan con ValueError"""
+    for args in (
+        (np.zeros(len(COMBINATION_LOAD_TYPES)), "LRFD"),             # 1-D
+        (np.zeros((3, len(COMBINATION_LOAD_TYPES) + 1)), "LRFD"),    # columnas de más
+        (np.zeros((3, len(COMBINATION_LOAD_TYPES))), "WSD"),         # método
+    ):
+        try:
+            apply_combinations_batch(*args)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"se esperaba ValueError para {args[0].shape}, {args[1]}")
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✓ {name}")
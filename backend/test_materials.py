@@ -0,0 +1,54 @@
+"""
+Pruebas de las tablas SoA de materiales
+"""
+
+from engine.materials import (
+    STEEL_GRADES,
+    get_material_arrays,
+    get_material_indices,
+    get_material_properties,
+)
+
+
+def test_material_indices_map_to_arrays():
+    """Cada índice apunta a la fila del material pedido (sin distinguir mayúsculas)"""
+    arrays = get_material_arrays()
+    material_ids = list(STEEL_GRADES) + [material_id.lower() for material_id in STEEL_GRADES]
+    indices = get_material_indices(material_ids)
+    assert indices.shape == (len(material_ids),)
+
+    for material_id, index in zip(material_ids, indices.tolist()):
+        assert arrays.ids[index] == material_id.upper()
+        properties = get_material_properties(material_id.upper())
+        for key in ("Fy", "Fu", "E", "G", "nu", "rho"):
+            assert getattr(arrays, key)[index] == properties[key], (material_id, key)
+
+
+def test_material_indices_empty_and_unknown():
+    """Una secuencia vacía da un arreglo vacío; un ID inexistente, ValueError"""
+    assert get_material_indices([]).shape == (0,)
+    try:
+        get_material_indices(["A36", "A999"])
+    except ValueError as e:
+        assert "A999" in str(e)
+    else:
+        raise AssertionError("se esperaba ValueError para un material inexistente")
+
+
+def test_material_arrays_read_only():
+    """Los arrays compartidos no se pueden modificar"""
+    arrays = get_material_arrays()
+    assert not arrays.Fy.flags.writeable
+    try:
+        arrays.Fy[0] = 0.0
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("se esperaba un array de solo lectura")
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✓ {name}")
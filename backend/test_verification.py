@@ -0,0 +1,97 @@
+"""
+Pruebas de las versiones vectorizadas de las verificaciones AISC 360
+
+Cada versión por lotes se compara con la verificación escalar que replica,
+para que las dos copias de las fórmulas no se separen.
+"""
+
+import math
+import random
+
+from engine.sections import get_all_sections
+from engine.verification import (
+    BEAM_ZONES,
+    verify_beam_aisc,
+    verify_beams_aisc_records,
+    verify_column_aisc,
+    verify_columns_aisc,
+)
+
+
+SECTION_IDS = [section["id"] for section in get_all_sections(limit=100000)]
+
+
+def _assert_same(expected, actual, path="resultado"):
+    """Comparar resultados; los floats admiten diferencias en el último bit"""
+    if isinstance(expected, dict):
+        assert list(expected) == list(actual), path
+        for key in expected:
+            _assert_same(expected[key], actual[key], f"{path}.{key}")
+    elif isinstance(expected, float) and isinstance(actual, float):
+        assert math.isclose(expected, actual, rel_tol=1e-14, abs_tol=0.0), (path, expected, actual)
+    else:
+        assert expected == actual, (path, expected, actual)
+
+
+def test_columns_batch_matches_scalar():
+    """verify_columns_aisc entrega lo mismo que verify_column_aisc en todo el catálogo"""
+    rng = random.Random(5)
+    for _ in range(20):
+        args = (
+            rng.uniform(-900, 900),     # Pu
+            rng.uniform(-100, 100),     # Mu_top
+            rng.uniform(-100, 100),     # Mu_base
+            rng.choice([0.5, 3, 7, 20]),
+            rng.choice([0.5, 1.0, 2.1]),
+        )
+        material_id = rng.choice(["A36", "A572_GR50"])
+        batch = verify_columns_aisc(*args, SECTION_IDS, material_id)
+        assert len(batch) == len(SECTION_IDS)
+        for section_id, result in zip(SECTION_IDS, batch):
+            _assert_same(verify_column_aisc(*args, section_id, material_id), result, section_id)
+
+
+def test_columns_zero_length_raises():
+    """KL = 0 se rechaza igual en la versión escalar y en la vectorizada"""
+    for check in (
+        lambda: verify_column_aisc(100, 10, 5, 0, 1.0, "W310X39", "A36"),
+        lambda: verify_columns_aisc(100, 10, 5, 0, 1.0, ["W310X39", "W360X44"], "A36"),
+    ):
+        try:
+            check()
+        except ValueError as e:
+            assert "KL" in str(e)
+        else:
+            raise AssertionError("se esperaba ValueError para KL = 0")
+
+
+def test_beam_records_match_scalar():
+    """verify_beams_aisc_records coincide con verify_beam_aisc (incluye Lb = 0 y Lb = None)"""
+    rng = random.Random(11)
+    for Lb in (None, 0.0, 1.5, 4.0, 12.0):
+        Mu, Vu, L = rng.uniform(0, 600), rng.uniform(0, 400), rng.uniform(2, 12)
+        Cb = rng.choice([1.0, 1.14, 1.67])
+        material_id = rng.choice(["A36", "A572_GR50"])
+        records = verify_beams_aisc_records(Mu, Vu, L, SECTION_IDS, material_id, Lb=Lb, Cb=Cb)
+        assert len(records) == len(SECTION_IDS)
+        for section_id, record in zip(SECTION_IDS, records):
+            expected = verify_beam_aisc(Mu, Vu, L, 0.0, section_id, material_id, Lb=Lb, Cb=Cb)
+            where = (section_id, Lb)
+            assert BEAM_ZONES[record["zone"]] == expected["flexure"]["zone"], where
+            assert bool(record["ok"]) == expected["overall_ok"], where
+            _assert_same(expected["flexure"]["phi_Mn"], float(record["phi_Mn"]), where)
+            _assert_same(expected["shear"]["phi_Vn"], float(record["phi_Vn"]), where)
+
+
+def test_beam_records_empty():
+    """Sin perfiles se devuelve un arreglo vacío del dtype de registros"""
+    records = verify_beams_aisc_records(100, 50, 6, [], "A36")
+    assert records.shape == (0,)
+    assert records.dtype.names == ("phi_Mn", "phi_Vn", "ratio_moment", "ratio_shear", "zone", "ok")
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✓ {name}")